@@ -2,10 +2,12 @@
 
 from typing import Any
 from .client import HoudiniSwapClient
+from .async_client import AsyncHoudiniSwapClient
 from .models import (
     Token,
     DEXToken,
     DEXTokensResponse,
+    LazyModelList,
     Network,
     Quote,
     DEXQuote,
@@ -24,6 +26,7 @@ from .exceptions import (
     APIError,
     ValidationError,
     NetworkError,
+    CircuitOpenError,
 )
 from .utils import deprecated, deprecated_parameter
 
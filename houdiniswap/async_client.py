@@ -0,0 +1,244 @@
+"""Asyncio interface for the Houdini Swap API."""
+
+import asyncio
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial, wraps
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Iterable, List, Optional
+
+from .client import HoudiniSwapClient, _FINAL_STATUSES, _poll_delays
+from .constants import DEFAULT_PAGE_SIZE, DEFAULT_MAX_POLL_INTERVAL
+from .exceptions import ValidationError
+from .models import DEXToken, Status, TransactionStatus
+
+
+def _async_proxy(name: str) -> Callable[..., Awaitable[Any]]:
+    """Build an async method that runs HoudiniSwapClient.<name> on the worker pool."""
+    sync_method = getattr(HoudiniSwapClient, name)
+
+    @wraps(sync_method)
+    async def method(self: "AsyncHoudiniSwapClient", *args: Any, **kwargs: Any) -> Any:
+        return await self._run(getattr(self._client, name), *args, **kwargs)
+
+    return method
+
+
+class AsyncHoudiniSwapClient:
+    """
+    Asyncio client for the Houdini Swap API.
+
+    Wraps a HoudiniSwapClient and exposes the same API methods as coroutines, so
+    many quote/status calls can be awaited together with asyncio.gather. The
+    blocking HTTP calls run on a dedicated thread pool sized to the session's
+    connection pool, reusing the sync client's keep-alive connections, retry
+    policy, caching, validation, and model parsing. Waiting (status polling,
+    backoff) happens on the event loop with asyncio.sleep and holds no thread.
+
+    Arguments are passed through to HoudiniSwapClient unchanged.
+
+    Example:
+        ```python
+        async with AsyncHoudiniSwapClient(api_key, api_secret) as client:
+            statuses = await client.gather_requests(
+                client.get_status(houdini_id) for houdini_id in ids
+            )
+        ```
+    """
+
+    __slots__ = ('_client', '_executor')
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        self._client = HoudiniSwapClient(*args, **kwargs)
+        self._executor = ThreadPoolExecutor(
+            max_workers=self._client.pool_maxsize,
+            thread_name_prefix="houdiniswap-async",
+        )
+
+    def __repr__(self) -> str:
+        """String representation that doesn't expose credentials."""
+        return f"<{self.__class__.__name__}(base_url='{self._client.base_url}')>"
+
+    @property
+    def sync_client(self) -> HoudiniSwapClient:
+        """The underlying synchronous client."""
+        return self._client
+
+    async def _run(self, func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """Run a blocking call on the worker pool and await its result."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, partial(func, *args, **kwargs))
+
+    async def __aenter__(self) -> "AsyncHoudiniSwapClient":
+        """Enter async context manager."""
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        """Exit async context manager and release resources."""
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """
+        Close the HTTP session and shut down the worker pool.
+        
+        The blocking shutdown (which waits for in-flight calls) runs on the
+        loop's default executor, so other tasks keep running meanwhile.
+        """
+        await asyncio.get_running_loop().run_in_executor(None, self.close)
+
+    def close(self) -> None:
+        """Close the HTTP session and shut down the worker pool (blocking)."""
+        self._executor.shutdown(wait=True)
+        self._client.close()
+
+    def clear_cache(self, group: Optional[str] = None) -> None:
+        """Clear cached responses (see HoudiniSwapClient.clear_cache)."""
+        self._client.clear_cache(group)
+
+    def cache_stats(self) -> Dict[str, Any]:
+        """Get token cache usage statistics (see HoudiniSwapClient.cache_stats)."""
+        return self._client.cache_stats()
+
+    # ==================== API methods ====================
+
+    get_cex_tokens = _async_proxy("get_cex_tokens")
+    get_dex_tokens = _async_proxy("get_dex_tokens")
+    get_cex_quote = _async_proxy("get_cex_quote")
+    get_dex_quote = _async_proxy("get_dex_quote")
+    post_cex_exchange = _async_proxy("post_cex_exchange")
+    post_dex_exchange = _async_proxy("post_dex_exchange")
+    post_dex_approve = _async_proxy("post_dex_approve")
+    post_dex_confirm_tx = _async_proxy("post_dex_confirm_tx")
+    get_status = _async_proxy("get_status")
+    get_min_max = _async_proxy("get_min_max")
+    get_volume = _async_proxy("get_volume")
+    get_weekly_volume = _async_proxy("get_weekly_volume")
+    get_all_dex_tokens = _async_proxy("get_all_dex_tokens")
+
+    # ==================== Helper Methods ====================
+
+    async def gather_requests(self, coros: Iterable[Awaitable[Any]]) -> List[Any]:
+        """
+        Await several API coroutines concurrently.
+
+        Args:
+            coros: Awaitables, e.g. ``client.get_status(houdini_id)`` calls
+
+        Returns:
+            List of results in the same order as coros. If a call raises, the
+            exception is stored at its index instead (like execute_parallel).
+        """
+        return list(await asyncio.gather(*coros, return_exceptions=True))
+
+    async def iter_dex_tokens(
+        self,
+        chain: Optional[str] = None,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        prefetch: int = 1,
+    ) -> AsyncIterator[DEXToken]:
+        """
+        Async iterator for all DEX tokens across all pages.
+
+        Up to ``prefetch`` upcoming pages are requested while the current page
+        is being consumed (see HoudiniSwapClient.iter_dex_tokens).
+
+        Args:
+            chain: Optional chain filter (e.g., "base")
+            page_size: Number of tokens per page (default: 100)
+            prefetch: Number of upcoming pages requested ahead (default: 1)
+
+        Yields:
+            DEXToken objects from all pages
+
+        Raises:
+            ValidationError: If prefetch is less than 1
+        """
+        if prefetch < 1:
+            raise ValidationError(f"prefetch must be at least 1, got {prefetch}")
+
+        page = 1
+        pending: "deque[asyncio.Future]" = deque()
+        try:
+            response = await self.get_dex_tokens(page=page, page_size=page_size, chain=chain)
+            while response.tokens:
+                total_pages = (response.count + page_size - 1) // page_size
+                next_page = page + len(pending) + 1
+                while len(pending) < prefetch and next_page <= total_pages:
+                    pending.append(asyncio.ensure_future(
+                        self.get_dex_tokens(page=next_page, page_size=page_size, chain=chain)
+                    ))
+                    next_page += 1
+                for token in response.tokens:
+                    yield token
+                if not pending:
+                    break
+                response = await pending.popleft()
+                page += 1
+        finally:
+            for future in pending:
+                future.cancel()
+
+    async def wait_for_status(
+        self,
+        houdini_id: str,
+        target_status: TransactionStatus,
+        timeout: int = 300,
+        poll_interval: int = 5,
+        max_poll_interval: int = DEFAULT_MAX_POLL_INTERVAL,
+    ) -> Status:
+        """
+        Poll until transaction reaches target status (see HoudiniSwapClient.wait_for_status).
+
+        Raises:
+            TimeoutError: If timeout is reached before target status
+            APIError: If API returns an error
+        """
+        start_time = time.monotonic()
+        delays = _poll_delays(poll_interval, max_poll_interval)
+
+        while True:
+            status = await self.get_status(houdini_id)
+            if status.status == target_status:
+                return status
+
+            elapsed = time.monotonic() - start_time
+            if elapsed > timeout:
+                raise TimeoutError(
+                    f"Timeout waiting for status {target_status.name}. "
+                    f"Current status: {status.status.name}"
+                )
+
+            # Never sleep past the deadline: the last poll happens at the timeout
+            await asyncio.sleep(min(next(delays), max(0, timeout - elapsed)))
+
+    async def poll_until_finished(
+        self,
+        houdini_id: str,
+        timeout: int = 600,
+        poll_interval: int = 5,
+        max_poll_interval: int = DEFAULT_MAX_POLL_INTERVAL,
+    ) -> Status:
+        """
+        Poll until transaction is finished (see HoudiniSwapClient.poll_until_finished).
+
+        Raises:
+            TimeoutError: If timeout is reached
+            APIError: If API returns an error
+        """
+        start_time = time.monotonic()
+        delays = _poll_delays(poll_interval, max_poll_interval)
+
+        while True:
+            status = await self.get_status(houdini_id)
+            if status.status in _FINAL_STATUSES:
+                return status
+
+            elapsed = time.monotonic() - start_time
+            if elapsed > timeout:
+                raise TimeoutError(
+                    f"Timeout waiting for transaction to finish. "
+                    f"Current status: {status.status.name}"
+                )
+
+            # Never sleep past the deadline: the last poll happens at the timeout
+            await asyncio.sleep(min(next(delays), max(0, timeout - elapsed)))
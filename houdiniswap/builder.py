@@ -5,10 +5,45 @@ from .client import HoudiniSwapClient
 from .models import ExchangeResponse, RouteDTO
 from .exceptions import ValidationError
 
+# String fields sanitized in a single pass when the exchange is executed
+_SANITIZED_FIELDS = (
+    "from_token",
+    "to_token",
+    "address_to",
+    "address_from",
+    "receiver_tag",
+    "wallet_id",
+    "ip",
+    "user_agent",
+    "timezone",
+    "swap",
+    "quote_id",
+)
+
 
 class ExchangeBuilder:
     """Builder for constructing exchange requests."""
     
+    __slots__ = (
+        'client',
+        '_exchange_type',
+        '_amount',
+        '_from_token',
+        '_to_token',
+        '_address_to',
+        '_address_from',
+        '_anonymous',
+        '_receiver_tag',
+        '_wallet_id',
+        '_ip',
+        '_user_agent',
+        '_timezone',
+        '_use_xmr',
+        '_swap',
+        '_quote_id',
+        '_route',
+    )
+    
     def __init__(self, client: HoudiniSwapClient):
         """Initialize the builder with a client instance."""
         self.client = client
@@ -49,22 +84,22 @@ class ExchangeBuilder:
     
     def from_token(self, token: str) -> "ExchangeBuilder":
         """Set source token (symbol for CEX, ID for DEX)."""
-        self._from_token = self.client._sanitize_input(token, "from_token")
+        self._from_token = token
         return self
     
     def to_token(self, token: str) -> "ExchangeBuilder":
         """Set destination token (symbol for CEX, ID for DEX)."""
-        self._to_token = self.client._sanitize_input(token, "to_token")
+        self._to_token = token
         return self
     
     def address_to(self, address: str) -> "ExchangeBuilder":
         """Set destination address."""
-        self._address_to = self.client._sanitize_input(address, "address_to")
+        self._address_to = address
         return self
     
     def address_from(self, address: str) -> "ExchangeBuilder":
         """Set source address (DEX only)."""
-        self._address_from = self.client._sanitize_input(address, "address_from")
+        self._address_from = address
         return self
     
     def anonymous(self, anonymous: bool = True) -> "ExchangeBuilder":
@@ -74,27 +109,27 @@ class ExchangeBuilder:
     
     def receiver_tag(self, tag: str) -> "ExchangeBuilder":
         """Set receiver tag."""
-        self._receiver_tag = self.client._sanitize_input(tag, "receiver_tag")
+        self._receiver_tag = tag
         return self
     
     def wallet_id(self, wallet_id: str) -> "ExchangeBuilder":
         """Set wallet ID."""
-        self._wallet_id = self.client._sanitize_input(wallet_id, "wallet_id")
+        self._wallet_id = wallet_id
         return self
     
     def ip(self, ip: str) -> "ExchangeBuilder":
         """Set IP address."""
-        self._ip = self.client._sanitize_input(ip, "ip")
+        self._ip = ip
         return self
     
     def user_agent(self, user_agent: str) -> "ExchangeBuilder":
         """Set user agent."""
-        self._user_agent = self.client._sanitize_input(user_agent, "user_agent")
+        self._user_agent = user_agent
         return self
     
     def timezone(self, timezone: str) -> "ExchangeBuilder":
         """Set timezone."""
-        self._timezone = self.client._sanitize_input(timezone, "timezone")
+        self._timezone = timezone
         return self
     
     def use_xmr(self, use_xmr: bool = True) -> "ExchangeBuilder":
@@ -104,12 +139,12 @@ class ExchangeBuilder:
     
     def swap(self, swap: str) -> "ExchangeBuilder":
         """Set swap identifier (DEX only)."""
-        self._swap = self.client._sanitize_input(swap, "swap")
+        self._swap = swap
         return self
     
     def quote_id(self, quote_id: str) -> "ExchangeBuilder":
         """Set quote ID (DEX only)."""
-        self._quote_id = self.client._sanitize_input(quote_id, "quote_id")
+        self._quote_id = quote_id
         return self
     
     def route(self, route: RouteDTO) -> "ExchangeBuilder":
@@ -119,6 +154,15 @@ class ExchangeBuilder:
         self._route = route
         return self
     
+    def _sanitize_fields(self) -> None:
+        """Sanitize all string fields that have been set."""
+        sanitize = self.client._sanitize_input
+        for name in _SANITIZED_FIELDS:
+            attr = "_" + name
+            value = getattr(self, attr)
+            if value is not None:
+                setattr(self, attr, sanitize(value, name))
+    
     def _validate_cex(self) -> None:
         """Validate CEX exchange parameters."""
         if self._amount is None:
@@ -153,16 +197,20 @@ class ExchangeBuilder:
         """
         Execute the exchange request.
         
+        String fields are sanitized here in one pass rather than in each setter.
+        
         Returns:
             ExchangeResponse object
             
         Raises:
-            ValidationError: If required parameters are missing
+            ValidationError: If required parameters are missing or invalid
             APIError: If the API returns an error
         """
         if not self._exchange_type:
             raise ValidationError("Exchange type must be set (use .cex() or .dex())")
         
+        self._sanitize_fields()
+        
         if self._exchange_type == "cex":
             self._validate_cex()
             return self.client.post_cex_exchange(
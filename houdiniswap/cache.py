@@ -0,0 +1,201 @@
+"""In-memory TTL cache used by the client for slowly changing API data."""
+
+import threading
+import time
+from collections import Counter, OrderedDict
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+_MISSING = object()
+
+
+def _group_of(key: Hashable) -> Hashable:
+    """Key group used for stats and clear(): the first element of tuple keys."""
+    return key[0] if isinstance(key, tuple) and key else key
+
+
+class TTLCache:
+    """
+    Thread-safe, size-bounded key/value cache whose entries expire after a
+    per-entry TTL.
+
+    Expiry is measured with time.monotonic(), so wall-clock adjustments
+    cannot extend or cut short an entry's lifetime. The TTL is supplied on
+    each set() so that changes to the client's cache_ttl apply to new
+    entries immediately.
+
+    When an insert would exceed maxsize, expired entries are purged first; if
+    the cache is still full, the entry closest to expiry is evicted, with ties
+    going to the least recently used entry. Entries about to expire are the
+    cheapest to lose, since they would have to be refetched soon anyway.
+
+    Hits and misses are counted per key group (the first element of tuple
+    keys, e.g. "dex_tokens" for every page) and reported by stats(), so
+    TTLs and maxsize can be tuned to the workload.
+
+    Thread Safety:
+        All operations are guarded by a re-entrant lock, so a cache warmed
+        by one thread can be read safely by others (e.g. batch_execute or
+        execute_parallel fan-outs). get_or_load() additionally coalesces
+        concurrent misses for the same key onto a single loader call.
+    """
+
+    __slots__ = ('maxsize', '_data', '_lock', '_inflight', '_hits', '_misses', '_evictions')
+
+    def __init__(self, maxsize: int = 256) -> None:
+        if maxsize < 1:
+            raise ValueError(f"maxsize must be >= 1, got {maxsize}")
+        self.maxsize = maxsize
+        # key -> (value, expires_at), ordered from least to most recently used
+        self._data: "OrderedDict[Hashable, Tuple[Any, float]]" = OrderedDict()
+        self._lock = threading.RLock()
+        self._inflight: Dict[Hashable, Future] = {}  # key -> pending load
+        self._hits: Counter = Counter()    # key group -> hit count
+        self._misses: Counter = Counter()  # key group -> miss count
+        self._evictions = 0
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """
+        Return the cached value for key, or default if missing or expired.
+
+        Expired entries are removed on access.
+        """
+        with self._lock:
+            value = self._lookup(key)
+            self._record(key, value is not _MISSING)
+            return default if value is _MISSING else value
+
+    def set(self, key: Hashable, value: Any, ttl: float) -> None:
+        """Store value under key for ttl seconds."""
+        with self._lock:
+            now = time.monotonic()
+            if key in self._data:
+                self._data.move_to_end(key)
+            elif len(self._data) >= self.maxsize:
+                self._evict(now)
+            self._data[key] = (value, now + ttl)
+
+    def get_or_load(self, key: Hashable, loader: Callable[[], Any], ttl: float) -> Any:
+        """
+        Return the cached value for key, calling loader() to fill it on a miss.
+
+        Only one loader call runs per key at a time: threads that miss while a
+        load is in flight wait for it and receive the same value (or exception)
+        instead of issuing duplicate requests. A load that is in flight when
+        clear() removes its key still returns to its callers, but its value
+        is not cached.
+        """
+        with self._lock:
+            value = self._lookup(key)
+            self._record(key, value is not _MISSING)
+            if value is not _MISSING:
+                return value
+            pending = self._inflight.get(key)
+            if pending is None:
+                future: Future = Future()
+                self._inflight[key] = future
+
+        if pending is not None:
+            return pending.result()
+
+        try:
+            value = loader()
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            with self._lock:
+                # clear() detaches in-flight loads; don't resurrect stale data
+                if self._inflight.get(key) is future:
+                    self.set(key, value, ttl)
+            future.set_result(value)
+            return value
+        finally:
+            with self._lock:
+                if self._inflight.get(key) is future:
+                    del self._inflight[key]
+
+    def _lookup(self, key: Hashable) -> Any:
+        """Return the live value for key or _MISSING, dropping it if expired (lock held)."""
+        try:
+            value, expires_at = self._data[key]
+        except KeyError:
+            return _MISSING
+        if time.monotonic() >= expires_at:
+            del self._data[key]
+            return _MISSING
+        self._data.move_to_end(key)
+        return value
+
+    def _record(self, key: Hashable, hit: bool) -> None:
+        """Count a hit or miss under the key's group (lock held)."""
+        group = _group_of(key)
+        if hit:
+            self._hits[group] += 1
+        else:
+            self._misses[group] += 1
+
+    def _evict(self, now: float) -> None:
+        """Make room for one entry: drop expired entries, then the soonest to expire (lock held)."""
+        expired = [key for key, (_, expires_at) in self._data.items() if now >= expires_at]
+        for key in expired:
+            del self._data[key]
+        while len(self._data) >= self.maxsize:
+            # min() keeps the first of equal candidates, i.e. the least recently used
+            victim = min(self._data, key=lambda k: self._data[k][1])
+            del self._data[victim]
+            self._evictions += 1
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Return a snapshot of cache usage.
+
+        Returns:
+            Dict with size, maxsize, total hits/misses, overall hit_ratio,
+            evictions (live entries dropped for space), and per-group
+            {"hits", "misses", "hit_ratio"} under "groups"
+        """
+        with self._lock:
+            groups = {}
+            for group in self._hits.keys() | self._misses.keys():
+                hits, misses = self._hits[group], self._misses[group]
+                groups[group] = {
+                    "hits": hits,
+                    "misses": misses,
+                    "hit_ratio": hits / (hits + misses),
+                }
+            hits, misses = sum(self._hits.values()), sum(self._misses.values())
+            return {
+                "size": len(self._data),
+                "maxsize": self.maxsize,
+                "hits": hits,
+                "misses": misses,
+                "hit_ratio": hits / (hits + misses) if hits + misses else 0.0,
+                "evictions": self._evictions,
+                "groups": groups,
+            }
+
+    def clear(self, group: Optional[Hashable] = None) -> None:
+        """
+        Remove all entries, or only those in the given key group.
+
+        Loads in flight for the removed keys are detached, so their results
+        are not cached when they complete.
+        """
+        with self._lock:
+            if group is None:
+                self._data.clear()
+                self._inflight.clear()
+                return
+            for key in [key for key in self._data if _group_of(key) == group]:
+                del self._data[key]
+            for key in [key for key in self._inflight if _group_of(key) == group]:
+                del self._inflight[key]
+
+    def __contains__(self, key: Hashable) -> bool:
+        with self._lock:
+            return self._lookup(key) is not _MISSING
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._data)
@@ -1,18 +1,25 @@
 """Main client for Houdini Swap API."""
 
+import gzip
+import json
 import logging
 import os
+import re
+import threading
 import time
 import requests
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
-from typing import Optional, List, Dict, Any, Callable, Union
+from urllib3.util.request import ACCEPT_ENCODING
+from typing import Optional, List, Dict, Any, Callable, Iterator, Set, Tuple, Union, cast
 try:
-    from typing import TypeGuard  # Python 3.10+
+    import orjson  # Optional fast JSON backend
 except ImportError:
-    from typing_extensions import TypeGuard  # Python 3.8-3.9
+    orjson = None  # type: ignore[assignment]
 from urllib.parse import urljoin
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from collections import deque
+from functools import lru_cache, partial
+from concurrent.futures import Future, ThreadPoolExecutor
 from decimal import Decimal, InvalidOperation
 
 from .constants import (
@@ -22,6 +29,19 @@ from .constants import (
     DEFAULT_MAX_RETRIES,
     DEFAULT_RETRY_BACKOFF_FACTOR,
     DEFAULT_CACHE_TTL,
+    DEFAULT_CACHE_MAXSIZE,
+    DEFAULT_MIN_MAX_CACHE_TTL,
+    DEFAULT_VOLUME_CACHE_TTL,
+    DEFAULT_WEEKLY_VOLUME_CACHE_TTL,
+    DEFAULT_QUOTE_CACHE_TTL,
+    DEFAULT_QUOTE_CACHE_MAXSIZE,
+    DEFAULT_MAX_POLL_INTERVAL,
+    DEFAULT_POOL_CONNECTIONS,
+    DEFAULT_POOL_MAXSIZE,
+    DEFAULT_BREAKER_THRESHOLD,
+    DEFAULT_BREAKER_COOLDOWN,
+    MAX_CREDENTIAL_LENGTH,
+    REQUEST_COMPRESSION_MIN_SIZE,
     ENV_VAR_API_URL,
     API_VERSION_DEFAULT,
     HEADER_API_VERSION,
@@ -48,6 +68,7 @@ from .constants import (
     ERROR_AUTHENTICATION_FAILED,
     ERROR_NETWORK,
     ERROR_UNEXPECTED,
+    ERROR_CIRCUIT_OPEN,
 )
 from .exceptions import (
     HoudiniSwapError,
@@ -55,11 +76,13 @@ from .exceptions import (
     APIError,
     ValidationError,
     NetworkError,
+    CircuitOpenError,
 )
 from .models import (
     Token,
     DEXToken,
     DEXTokensResponse,
+    LazyModelList,
     Quote,
     DEXQuote,
     ExchangeResponse,
@@ -72,16 +95,200 @@ from .models import (
     RouteDTO,
 )
 from .config import Config
+from .cache import TTLCache
 
 
-def _is_list_response(response: Dict[str, Any]) -> TypeGuard[List[Dict[str, Any]]]:
-    """Type guard to help type checkers understand list responses."""
-    return isinstance(response, list)
+# Statuses after which a transaction no longer changes
+_FINAL_STATUSES = frozenset({
+    TransactionStatus.FINISHED,
+    TransactionStatus.FAILED,
+    TransactionStatus.EXPIRED,
+    TransactionStatus.REFUNDED,
+})
 
+# Endpoints whose full URLs are resolved once per client in __init__
+_ENDPOINTS = (
+    ENDPOINT_TOKENS,
+    ENDPOINT_DEX_TOKENS,
+    ENDPOINT_QUOTE,
+    ENDPOINT_DEX_QUOTE,
+    ENDPOINT_EXCHANGE,
+    ENDPOINT_DEX_EXCHANGE,
+    ENDPOINT_DEX_APPROVE,
+    ENDPOINT_DEX_CONFIRM_TX,
+    ENDPOINT_STATUS,
+    ENDPOINT_MIN_MAX,
+    ENDPOINT_VOLUME,
+    ENDPOINT_WEEKLY_VOLUME,
+)
+
+
+# orjson decodes integers wider than 64 bits as floats, losing precision on
+# wei-denominated amounts; bodies with a 20+ digit run take the stdlib path.
+_WIDE_DIGITS = re.compile(rb"\d{20}")
+
+
+def _decode_json(response: requests.Response) -> Any:
+    """Decode a response body, using orjson on the raw bytes when available."""
+    if orjson is not None:
+        content = response.content
+        if not _WIDE_DIGITS.search(content):
+            return orjson.loads(content)
+    return response.json()
+
+
+def _encode_json_body(data: Any) -> bytes:
+    """
+    Serialize a request body to JSON bytes, using orjson when available.
+    
+    Payloads orjson rejects (integers wider than 64 bits, non-str dict keys)
+    fall back to the stdlib encoder, which accepts everything requests'
+    json= argument did.
+    
+    Raises:
+        ValidationError: If the body is not JSON serializable (e.g. Decimal
+                         values or NaN)
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(data)
+        except TypeError:
+            pass
+    try:
+        return json.dumps(data, separators=(",", ":"), allow_nan=False).encode("utf-8")
+    except (TypeError, ValueError) as e:
+        raise ValidationError(f"Request body is not JSON serializable: {e}") from e
+
+
+# post_dex_confirm_tx bodies meaning success (JSON true or a quoted string)
+_TRUE_BODIES = frozenset((b"true", b'"true"'))
+
+# Extra headers for gzip-compressed request bodies (merged, never mutated, by requests)
+_GZIP_HEADERS = {"Content-Encoding": "gzip"}
+
+# Transport failures that count towards an endpoint's circuit breaker. Other
+# RequestExceptions (InvalidURL, MissingSchema, InvalidJSONError) are raised
+# before anything reaches the server and say nothing about its health.
+_BREAKER_ERRORS = (requests.exceptions.ConnectionError, requests.exceptions.Timeout)
+
+# Credentials with no whitespace or ':' and within the length limit, matched
+# in one pass; anything else goes through the individual checks for a precise error
+_CREDENTIAL_PATTERN = re.compile(r"[^\s:]{1,%d}" % MAX_CREDENTIAL_LENGTH)
+
+# Inputs longer than this (user agents, raw payloads) rarely repeat and bypass the cache
+_SANITIZE_CACHE_MAX_LENGTH = 128
+
+
+@lru_cache(maxsize=2048)
+def _sanitize_string(value: str, field_name: str) -> str:
+    """Strip and validate a string input (memoized; tokens and addresses recur)."""
+    sanitized = value.strip()
+    if not sanitized:
+        raise ValidationError(f"{field_name} cannot be empty")
+    
+    # Check for potentially dangerous characters. Each `in` is a C-level memchr
+    # scan, which beats both str.translate (allocates a copy) and a regex search
+    # for identifiers and addresses as well as long payloads.
+    if '\n' in sanitized or '\r' in sanitized or '\t' in sanitized or '\x00' in sanitized:
+        raise ValidationError(f"{field_name} contains invalid characters")
+    
+    return sanitized
 
-def _is_dict_response(response: Dict[str, Any]) -> TypeGuard[Dict[str, Any]]:
-    """Type guard to help type checkers understand dict responses."""
-    return isinstance(response, dict)
+
+@lru_cache(maxsize=256)
+def _compile_address_pattern(pattern: str) -> Optional["re.Pattern[str]"]:
+    """Compile a network address regex once; None if the pattern is invalid."""
+    try:
+        return re.compile(pattern)
+    except re.error:
+        return None
+
+
+# Marks threads owned by a client worker pool (see _run_parallel)
+_worker_state = threading.local()
+
+
+def _mark_worker_thread() -> None:
+    """ThreadPoolExecutor initializer flagging the thread as a pool worker."""
+    _worker_state.is_worker = True
+
+
+def _call_capturing_errors(func: Callable[[], Any]) -> Any:
+    """Call func, returning any exception it raises instead of propagating it."""
+    try:
+        return func()
+    except Exception as e:
+        return e
+
+
+@lru_cache(maxsize=1024)
+def _check_houdini_id(houdini_id: str) -> None:
+    """Validate a houdini ID (memoized; status polling re-checks the same ID)."""
+    sanitized = _sanitize_string.__wrapped__(houdini_id, "houdini_id")
+    # Houdini IDs are typically alphanumeric, 20-30 chars
+    if not sanitized.replace('_', '').replace('-', '').isalnum():
+        raise ValidationError("houdini_id must be alphanumeric (may include _ or -)")
+    if len(sanitized) < 10 or len(sanitized) > 50:
+        raise ValidationError(f"houdini_id must be between 10 and 50 characters, got {len(sanitized)}")
+
+
+def _poll_delays(poll_interval: float, max_poll_interval: float) -> Iterator[float]:
+    """Yield poll delays that double from poll_interval up to max_poll_interval."""
+    cap = max(poll_interval, max_poll_interval)
+    delay = poll_interval
+    while True:
+        yield delay
+        delay = min(delay * 2, cap)
+
+
+def _finite(value: Decimal, amount: Any) -> Decimal:
+    """Return value, rejecting NaN, sNaN and infinities (not valid JSON numbers)."""
+    if not value.is_finite():
+        raise ValidationError(f"amount must be a valid number, got {amount!r}")
+    return value
+
+
+def _amount_str_from_str(amount: str) -> str:
+    """Validate that a string amount parses as a finite number and return it unchanged."""
+    _amount_decimal_from_str(amount)
+    return amount
+
+
+def _amount_decimal_from_str(amount: str) -> Decimal:
+    """Parse a string amount into a finite Decimal."""
+    try:
+        value = Decimal(amount)
+    except (ValueError, TypeError, InvalidOperation):
+        raise ValidationError(f"amount must be a valid number, got {amount!r}")
+    return _finite(value, amount)
+
+
+# Amount normalizers keyed on exact type; floats go through str() to avoid binary precision artifacts
+_AMOUNT_TO_STR: Dict[type, Callable[[Any], str]] = {
+    Decimal: lambda amount: str(_finite(amount, amount)),
+    str: _amount_str_from_str,
+    int: lambda amount: str(Decimal(amount)),
+    float: lambda amount: str(_finite(Decimal(str(amount)), amount)),
+}
+
+_AMOUNT_TO_DECIMAL: Dict[type, Callable[[Any], Decimal]] = {
+    Decimal: lambda amount: _finite(amount, amount),
+    str: _amount_decimal_from_str,
+    int: Decimal,
+    float: lambda amount: _finite(Decimal(str(amount)), amount),
+}
+
+
+def _lookup_amount_normalizer(table: Dict[type, Callable[[Any], Any]], amount: Any) -> Callable[[Any], Any]:
+    """Find the normalizer for amount's type, falling back to its base classes for subclasses."""
+    amount_type = type(amount)
+    try:
+        return table[amount_type]
+    except KeyError:
+        for base in amount_type.__mro__[1:]:
+            if base in table:
+                return table[base]
+    raise ValidationError(f"amount must be str, Decimal, or number, got {amount_type.__name__}")
 
 
 class HoudiniSwapClient:
@@ -91,8 +298,12 @@ class HoudiniSwapClient:
     All requests require authentication using API key and secret.
     
     Thread Safety:
-        This client is not thread-safe. Each thread should use its own instance
-        or external synchronization must be used when sharing an instance.
+        An instance can be shared between threads. API methods, the response
+        caches, the circuit breaker, and the worker pool used by
+        execute_parallel/batch_execute are safe for concurrent use; the
+        underlying requests.Session is shared, so do not modify its headers or
+        adapters while requests are in flight. Configuration attributes (e.g.
+        timeout, cache_ttl) should be set before the instance is shared.
     
     Performance:
         Uses a persistent HTTP session for connection pooling. Network requests
@@ -106,22 +317,45 @@ class HoudiniSwapClient:
     __slots__ = (
         '_api_key',
         '_api_secret',
+        '_auth_header',
         'base_url',
+        '_url_cache',
         'timeout',
         'api_version',
         'session',
         'verify_ssl',
-        'max_retries',
-        'retry_backoff_factor',
+        '_max_retries',
+        '_retry_backoff_factor',
+        'pool_maxsize',
+        'request_compression',
+        'breaker_threshold',
+        'breaker_cooldown',
+        '_breaker_failures',
+        '_breaker_lock',
+        '_breaker_trials',
         'logger',
         'cache_enabled',
         'cache_ttl',
         '_token_cache',
+        'quote_cache_enabled',
+        'quote_cache_ttl',
+        '_quote_cache',
         '_closed',
+        '_executor',
+        '_executor_lock',
     )
     
     BASE_URL = "https://api-partner.houdiniswap.com"
     
+    # Statuses retried by the session adapter; built once for O(1) membership checks
+    _RETRYABLE_STATUSES = frozenset({
+        HTTP_STATUS_TOO_MANY_REQUESTS,
+        HTTP_STATUS_INTERNAL_SERVER_ERROR,
+        HTTP_STATUS_BAD_GATEWAY,
+        HTTP_STATUS_SERVICE_UNAVAILABLE,
+        HTTP_STATUS_GATEWAY_TIMEOUT,
+    })
+    
     def __init__(
         self,
         api_key: str,
@@ -132,8 +366,14 @@ class HoudiniSwapClient:
         verify_ssl: bool = True,
         max_retries: int = DEFAULT_MAX_RETRIES,
         retry_backoff_factor: float = DEFAULT_RETRY_BACKOFF_FACTOR,
+        pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
+        breaker_threshold: Optional[int] = DEFAULT_BREAKER_THRESHOLD,
+        breaker_cooldown: float = DEFAULT_BREAKER_COOLDOWN,
+        request_compression: bool = False,
         cache_enabled: bool = False,
         cache_ttl: int = DEFAULT_CACHE_TTL,
+        quote_cache_enabled: bool = False,
+        quote_cache_ttl: float = DEFAULT_QUOTE_CACHE_TTL,
         log_level: Optional[int] = None,
     ):
         """
@@ -147,10 +387,31 @@ class HoudiniSwapClient:
             timeout: Request timeout in seconds (default: 30, see DEFAULT_TIMEOUT constant)
             api_version: API version to use (default: "v1"). Sent as X-API-Version header.
             verify_ssl: Whether to verify SSL certificates (default: True). Set to False only for testing.
-            max_retries: Maximum number of retry attempts for failed requests (default: 3)
+            max_retries: Maximum number of retry attempts for failed requests (default: 3).
+                        Applied by the session's urllib3 Retry policy; assigning
+                        client.max_retries later rebuilds the policy.
             retry_backoff_factor: Multiplier for exponential backoff (default: 1.0)
-            cache_enabled: Enable caching for token lists (default: False)
-            cache_ttl: Cache time-to-live in seconds (default: 300 = 5 minutes)
+            pool_maxsize: Keep-alive connections kept per host (default: 20). Also
+                          caps the worker threads used by execute_parallel,
+                          batch_execute, and get_all_dex_tokens. Raise it when
+                          driving the client from many threads.
+            breaker_threshold: Consecutive failures (connection errors, timeouts
+                               or 5xx after retries) after which an endpoint's circuit opens
+                               (default: 5). None or 0 disables the breaker.
+            breaker_cooldown: Seconds an open circuit fails fast with
+                              CircuitOpenError before a trial request is let
+                              through (default: 30)
+            request_compression: Gzip JSON request bodies of 1 KB or more and send
+                                 them with Content-Encoding: gzip (default: False).
+                                 Enable only if the server accepts compressed bodies.
+            cache_enabled: Enable caching for slowly changing data (default: False):
+                           token lists for cache_ttl seconds, min/max limits for 30s,
+                           total volume for 60s, and weekly volume for 300s
+            cache_ttl: Token list cache time-to-live in seconds (default: 300 = 5 minutes)
+            quote_cache_enabled: Reuse identical CEX/DEX quotes for quote_cache_ttl
+                                 seconds (default: False). Leave disabled for
+                                 real-time price monitoring.
+            quote_cache_ttl: Quote cache time-to-live in seconds (default: 10)
             log_level: Logging level (logging.DEBUG, INFO, WARNING, ERROR). Default: WARNING.
         
         Raises:
@@ -172,25 +433,44 @@ class HoudiniSwapClient:
         self._validate_credentials(api_key, api_secret)
         
         # Store credentials in private attributes to prevent direct access
-        object.__setattr__(self, '_api_key', api_key)
-        object.__setattr__(self, '_api_secret', api_secret)
+        self._api_key = api_key
+        self._api_secret = api_secret
+        # Authorization header value, built once and reused by the session
+        self._auth_header = f"{api_key}:{api_secret}"
         
         # Base URL resolution: parameter > environment variable > default
         if base_url:
-            object.__setattr__(self, 'base_url', base_url)
+            self.base_url = base_url
         else:
-            object.__setattr__(self, 'base_url', os.getenv(ENV_VAR_API_URL, BASE_URL_PRODUCTION))
+            self.base_url = os.getenv(ENV_VAR_API_URL, BASE_URL_PRODUCTION)
+        # endpoint -> full URL, precomputed for all known endpoints
+        self._url_cache = {
+            endpoint: urljoin(self.base_url, endpoint.lstrip("/"))
+            for endpoint in _ENDPOINTS
+        }
         
-        object.__setattr__(self, 'timeout', timeout or DEFAULT_TIMEOUT)
-        object.__setattr__(self, 'api_version', api_version or API_VERSION_DEFAULT)
-        object.__setattr__(self, 'verify_ssl', verify_ssl)
-        object.__setattr__(self, 'max_retries', max_retries)
-        object.__setattr__(self, 'retry_backoff_factor', retry_backoff_factor)
+        self.timeout = timeout or DEFAULT_TIMEOUT
+        self.api_version = api_version or API_VERSION_DEFAULT
+        self.verify_ssl = verify_ssl
+        self._max_retries = max_retries
+        self._retry_backoff_factor = retry_backoff_factor
+        self.pool_maxsize = pool_maxsize
+        self.request_compression = request_compression
+        self.breaker_threshold = breaker_threshold
+        self.breaker_cooldown = breaker_cooldown
+        # endpoint -> (consecutive failures, monotonic time of the last failure)
+        self._breaker_failures: Dict[str, Tuple[int, float]] = {}
+        self._breaker_lock = threading.Lock()
+        # Endpoints whose half-open trial request is in flight
+        self._breaker_trials: Set[str] = set()
         
         # Caching configuration
-        object.__setattr__(self, 'cache_enabled', cache_enabled)
-        object.__setattr__(self, 'cache_ttl', cache_ttl)
-        object.__setattr__(self, '_token_cache', {})  # key -> (data, timestamp)
+        self.cache_enabled = cache_enabled
+        self.cache_ttl = cache_ttl
+        self._token_cache = TTLCache(maxsize=DEFAULT_CACHE_MAXSIZE)
+        self.quote_cache_enabled = quote_cache_enabled
+        self.quote_cache_ttl = quote_cache_ttl
+        self._quote_cache = TTLCache(maxsize=DEFAULT_QUOTE_CACHE_MAXSIZE)
         
         # Setup logging
         self.logger = logging.getLogger("houdiniswap")
@@ -209,42 +489,86 @@ class HoudiniSwapClient:
         # Add closed property to session for testing
         session.closed = False
         
+        # Retries with exponential backoff are handled by urllib3 inside the
+        # adapter, so the pooled connection is reused across attempts.
+        retry = self._build_retry()
+        
         # Configure connection pooling with HTTPAdapter
         # pool_connections: number of connection pools to cache
         # pool_maxsize: maximum number of connections to save in the pool
         adapter = HTTPAdapter(
-            pool_connections=10,  # Number of connection pools to cache
-            pool_maxsize=20,      # Maximum number of connections to save in the pool
-            max_retries=0,        # We handle retries in _request method
+            pool_connections=DEFAULT_POOL_CONNECTIONS,  # Number of connection pools to cache
+            pool_maxsize=pool_maxsize,  # Maximum number of connections to save in the pool
+            max_retries=retry,
             pool_block=False,     # Don't block if pool is full
         )
         session.mount('http://', adapter)
         session.mount('https://', adapter)
         
-        object.__setattr__(self, 'session', session)
+        self.session = session
+        self._closed = False
+        # Worker pool for execute_parallel/batch_execute, created on first use
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._executor_lock = threading.Lock()
         # Use private attributes for credentials in header
         self.session.headers.update({
-            "Authorization": f"{self._api_key}:{self._api_secret}",
+            "Authorization": self._auth_header,
             "Content-Type": "application/json",
+            "Accept": "application/json",
+            # gzip/deflate always; br/zstd only when urllib3 can decode them
+            "Accept-Encoding": ACCEPT_ENCODING,
             HEADER_API_VERSION: self.api_version,
         })
         # Explicitly set SSL verification
         self.session.verify = verify_ssl
     
-    def __getattribute__(self, name: str):
-        """Prevent direct access to credentials."""
-        if name in ('api_key', 'api_secret'):
-            raise AttributeError(
-                f"'{self.__class__.__name__}' object has no attribute '{name}'. "
-                "Credentials are stored securely and cannot be accessed directly. "
-                "Use the client methods to interact with the API."
-            )
-        return object.__getattribute__(self, name)
-    
     def __repr__(self) -> str:
         """String representation that doesn't expose credentials."""
         return f"<{self.__class__.__name__}(base_url='{self.base_url}')>"
     
+    @property
+    def max_retries(self) -> int:
+        """Maximum number of retry attempts applied by the session's Retry policy."""
+        return self._max_retries
+    
+    @max_retries.setter
+    def max_retries(self, value: int) -> None:
+        self._max_retries = value
+        self._apply_retry()
+    
+    @property
+    def retry_backoff_factor(self) -> float:
+        """Multiplier for the exponential backoff between retries."""
+        return self._retry_backoff_factor
+    
+    @retry_backoff_factor.setter
+    def retry_backoff_factor(self, value: float) -> None:
+        self._retry_backoff_factor = value
+        self._apply_retry()
+    
+    def _build_retry(self) -> Retry:
+        """
+        Build the urllib3 Retry policy from the current retry settings.
+        
+        raise_on_status=False returns the last response once retries are
+        exhausted so _request can classify it.
+        """
+        return Retry(
+            total=self._max_retries,
+            backoff_factor=self._retry_backoff_factor,
+            status_forcelist=self._RETRYABLE_STATUSES,
+            allowed_methods=frozenset(["GET", "POST", "PUT", "DELETE"]),
+            respect_retry_after_header=True,
+            raise_on_status=False,
+        )
+    
+    def _apply_retry(self) -> None:
+        """Swap a freshly built Retry policy into the mounted adapters, keeping their pools."""
+        retry = self._build_retry()
+        for adapter in self.session.adapters.values():
+            if isinstance(adapter, HTTPAdapter):
+                adapter.max_retries = retry
+    
     def _validate_credentials(self, api_key: str, api_secret: str) -> None:
         """
         Validate API credentials format.
@@ -256,12 +580,15 @@ class HoudiniSwapClient:
         Raises:
             ValidationError: If credentials are invalid
         """
+        # Common case: both credentials accepted by a single regex pass each
+        if _CREDENTIAL_PATTERN.fullmatch(api_key) and _CREDENTIAL_PATTERN.fullmatch(api_secret):
+            return
+        
         # Check for colon character (would break Authorization header format)
         if ":" in api_key or ":" in api_secret:
             raise ValidationError("API key and secret cannot contain ':' character")
         
         # Validate length (HTTP headers typically have 8KB limit, be conservative)
-        MAX_CREDENTIAL_LENGTH = 1000
         if len(api_key) > MAX_CREDENTIAL_LENGTH or len(api_secret) > MAX_CREDENTIAL_LENGTH:
             raise ValidationError(f"API credentials exceed maximum length of {MAX_CREDENTIAL_LENGTH} characters")
         
@@ -270,7 +597,7 @@ class HoudiniSwapClient:
             raise ValidationError(ERROR_INVALID_CREDENTIALS)
     
     def _redact_credentials(self, data: Dict[str, Any]) -> Dict[str, Any]:
-        """Redact credentials from data for logging."""
+        """Redact credentials from data (e.g. header dumps) for logging."""
         redacted = dict(data)
         if "Authorization" in redacted:
             redacted["Authorization"] = "***REDACTED***"
@@ -293,17 +620,9 @@ class HoudiniSwapClient:
         if not isinstance(value, str):
             raise ValidationError(f"{field_name} must be a string, got {type(value).__name__}")
         
-        sanitized = value.strip()
-        if not sanitized:
-            raise ValidationError(f"{field_name} cannot be empty")
-        
-        # Check for potentially dangerous characters
-        dangerous_chars = ['\n', '\r', '\t', '\x00']
-        for char in dangerous_chars:
-            if char in sanitized:
-                raise ValidationError(f"{field_name} contains invalid characters")
-        
-        return sanitized
+        if len(value) > _SANITIZE_CACHE_MAX_LENGTH:
+            return _sanitize_string.__wrapped__(value, field_name)
+        return _sanitize_string(value, field_name)
     
     def _validate_amount(self, amount: Union[float, Decimal, int, str], field_name: str = "amount") -> None:
         """Validate that amount is positive."""
@@ -325,32 +644,11 @@ class HoudiniSwapClient:
     
     def _normalize_amount(self, amount: Union[str, Decimal, float]) -> str:
         """Normalize amount to string for API requests."""
-        if isinstance(amount, Decimal):
-            return str(amount)
-        if isinstance(amount, (int, float)):
-            # Convert to Decimal first to avoid precision issues, then to string
-            return str(Decimal(str(amount)))
-        if isinstance(amount, str):
-            # Validate it's a valid number
-            try:
-                Decimal(amount)
-                return amount
-            except (ValueError, TypeError, InvalidOperation):
-                raise ValidationError(f"amount must be a valid number, got {amount!r}")
-        raise ValidationError(f"amount must be str, Decimal, or number, got {type(amount).__name__}")
+        return _lookup_amount_normalizer(_AMOUNT_TO_STR, amount)(amount)
     
     def _normalize_amount_to_decimal(self, amount: Union[str, Decimal, float]) -> Decimal:
         """Normalize amount to Decimal for internal use."""
-        if isinstance(amount, Decimal):
-            return amount
-        if isinstance(amount, (int, float)):
-            return Decimal(str(amount))
-        if isinstance(amount, str):
-            try:
-                return Decimal(amount)
-            except (ValueError, TypeError, InvalidOperation):
-                raise ValidationError(f"amount must be a valid number, got {amount!r}")
-        raise ValidationError(f"amount must be str, Decimal, or number, got {type(amount).__name__}")
+        return _lookup_amount_normalizer(_AMOUNT_TO_DECIMAL, amount)(amount)
     
     def _validate_token_id(self, token_id: str, field_name: str = "token_id") -> None:
         """Validate that token ID is non-empty."""
@@ -373,19 +671,24 @@ class HoudiniSwapClient:
     def _validate_hex_string(self, value: str, field_name: str = "hex_string") -> None:
         """Validate that value is a valid hex string."""
         sanitized = self._sanitize_input(value, field_name)
+        digits = sanitized[2:] if sanitized[:2] in ("0x", "0X") else sanitized
+        if len(digits) % 2:
+            digits = "0" + digits
+        # bytes.fromhex validates in C without building a bignum; it skips
+        # whitespace, so a short result also means the input was not pure hex
         try:
-            int(sanitized, 16)
+            valid = bool(digits) and len(bytes.fromhex(digits)) * 2 == len(digits)
         except ValueError:
+            valid = False
+        if not valid:
             raise ValidationError(f"{field_name} must be a valid hexadecimal string")
     
     def _validate_houdini_id(self, houdini_id: str) -> None:
         """Validate houdini ID format."""
-        sanitized = self._sanitize_input(houdini_id, "houdini_id")
-        # Houdini IDs are typically alphanumeric, 20-30 chars
-        if not sanitized.replace('_', '').replace('-', '').isalnum():
-            raise ValidationError("houdini_id must be alphanumeric (may include _ or -)")
-        if len(sanitized) < 10 or len(sanitized) > 50:
-            raise ValidationError(f"houdini_id must be between 10 and 50 characters, got {len(sanitized)}")
+        if not isinstance(houdini_id, str):
+            raise ValidationError(f"houdini_id must be a string, got {type(houdini_id).__name__}")
+        # IDs over 50 chars always fail, and failures are never cached
+        _check_houdini_id(houdini_id)
     
     def _validate_address(self, address: str, network: Optional["Network"] = None, field_name: str = "address") -> None:
         """
@@ -396,20 +699,16 @@ class HoudiniSwapClient:
             network: Optional Network object with address_validation regex
             field_name: Name of field for error messages
         """
-        import re
         sanitized = self._sanitize_input(address, field_name)
         
         # If network provided, use its validation regex
         if network and network.address_validation:
-            try:
-                pattern = re.compile(network.address_validation)
-                if not pattern.match(sanitized):
-                    raise ValidationError(
-                        f"{field_name} does not match expected format for network {network.name}: {network.address_validation}"
-                    )
-            except re.error:
-                # Invalid regex in network data - skip regex validation
-                pass
+            pattern = _compile_address_pattern(network.address_validation)
+            # Invalid regex in network data (None) - skip regex validation
+            if pattern is not None and not pattern.match(sanitized):
+                raise ValidationError(
+                    f"{field_name} does not match expected format for network {network.name}: {network.address_validation}"
+                )
         
         # Basic validation: addresses should be reasonable length
         if len(sanitized) < 10 or len(sanitized) > 200:
@@ -433,7 +732,8 @@ class HoudiniSwapClient:
             Dictionary of headers/parameters to add to request
         """
         # Placeholder for future request signing
-        # If API adds signing requirements, implement here
+        # If API adds signing requirements, implement here, starting from the
+        # precomputed self._auth_header rather than re-joining the credentials
         return {}
     
     def _request(
@@ -442,185 +742,200 @@ class HoudiniSwapClient:
         endpoint: str,
         params: Optional[Dict[str, Any]] = None,
         json_data: Optional[Dict[str, Any]] = None,
-    ) -> Dict[str, Any]:
+        raw: bool = False,
+    ) -> Any:
         """
         Make an HTTP request to the API with automatic retries.
         
-        Note: params and json_data are defensively copied to prevent mutation
-        of caller's dictionaries. This ensures safe concurrent usage.
+        Retries for connection errors and retryable status codes (429, 500, 502,
+        503, 504) are performed by the session's urllib3 Retry policy, honouring
+        Retry-After headers. This method only classifies the final outcome.
+        
+        Each endpoint has a circuit breaker: after breaker_threshold consecutive
+        connection errors, timeouts or 5xx responses, calls to that endpoint raise
+        CircuitOpenError without a request for breaker_cooldown seconds. The
+        next call after the cooldown is sent as a single trial (concurrent
+        callers keep getting CircuitOpenError while it is in flight); success
+        closes the circuit and failure reopens it.
+        
+        Note: params and json_data are passed through without copying; they are
+        never mutated here. Callers build a fresh dict per call.
         
         Args:
             method: HTTP method (GET, POST, etc.)
             endpoint: API endpoint path
             params: Query parameters
             json_data: JSON body for POST requests
+            raw: Return the undecoded response body (bytes) on success instead
+                 of parsing it; errors are still decoded and raised
             
         Returns:
-            JSON response as dictionary
+            JSON response as dictionary, or the body bytes if raw is True
             
         Raises:
             APIError: If the API returns an error
             NetworkError: If a network error occurs after all retries
+            CircuitOpenError: If the endpoint's circuit breaker is open
             AuthenticationError: If authentication fails
+            ValidationError: If json_data is not JSON serializable (e.g. contains
+                             Decimal values)
         """
-        url = urljoin(self.base_url, endpoint.lstrip("/"))
+        url = self._url_cache.get(endpoint)
+        if url is None:
+            url = urljoin(self.base_url, endpoint.lstrip("/"))
+            self._url_cache[endpoint] = url
         
-        # Defensive copy of params to prevent mutation of caller's dict
-        # This ensures safe concurrent usage and prevents accidental side effects
-        safe_params = dict(params) if params else None
-        safe_json_data = dict(json_data) if json_data else None
+        # Empty dicts are sent as None so no empty query string/body is produced
+        safe_params = params or None
+        safe_json_data = json_data or None
         
-        # Status codes that should trigger retries
-        retryable_statuses = [
-            HTTP_STATUS_TOO_MANY_REQUESTS,
-            HTTP_STATUS_INTERNAL_SERVER_ERROR,
-            HTTP_STATUS_BAD_GATEWAY,
-            HTTP_STATUS_SERVICE_UNAVAILABLE,
-            HTTP_STATUS_GATEWAY_TIMEOUT,
-        ]
-        
-        last_exception = None
-        
-        for attempt in range(self.max_retries + 1):
-            try:
-                # Log request (redact credentials)
-                if self.logger.isEnabledFor(logging.DEBUG):
-                    log_data = {
-                        "method": method,
-                        "url": url,
-                        "params": safe_params,
-                        "json": safe_json_data,
-                    }
-                    self.logger.debug(f"Request: {self._redact_credentials(log_data)}")
+        is_trial = self._check_breaker(endpoint)
+        try:
+            # Credentials live in the session headers, never in params/json,
+            # so no redaction is needed. Formatting is deferred to the logger.
+            self.logger.debug(
+                "Request: %s %s params=%s json=%s", method, url, safe_params, safe_json_data
+            )
+            
+            # Serialize bodies here (orjson when available) rather than via
+            # requests' json=, so encoding errors surface as ValidationError and
+            # bodies can be compressed; the session already sends
+            # Content-Type: application/json
+            body = None
+            headers = None
+            if safe_json_data is not None:
+                body = _encode_json_body(safe_json_data)
+                if self.request_compression and len(body) >= REQUEST_COMPRESSION_MIN_SIZE:
+                    body = gzip.compress(body, compresslevel=6)
+                    headers = _GZIP_HEADERS
+            
+            start_time = time.monotonic()
+            response = self.session.request(
+                method=method,
+                url=url,
+                params=safe_params,
+                data=body,
+                headers=headers,
+                timeout=self.timeout,
+            )
+            duration = time.monotonic() - start_time
+            
+            status_code = response.status_code
+            self.logger.debug("Response: %s (%.2fs)", status_code, duration)
+            
+            # Any response below 500 shows the endpoint is up
+            if status_code >= HTTP_STATUS_INTERNAL_SERVER_ERROR:
+                self._record_failure(endpoint)
+            elif endpoint in self._breaker_failures:
+                with self._breaker_lock:
+                    self._breaker_failures.pop(endpoint, None)
+            
+            # Handle authentication errors
+            if status_code == HTTP_STATUS_UNAUTHORIZED:
+                self.logger.warning("Authentication failed")
+                raise AuthenticationError(ERROR_AUTHENTICATION_FAILED)
+            
+            # Rate limit still exceeded after all retries
+            if status_code == HTTP_STATUS_TOO_MANY_REQUESTS:
+                error_data = None
+                try:
+                    error_data = _decode_json(response)
+                    error_message = error_data.get("message", "Rate limit exceeded")
+                except ValueError:
+                    error_message = "Rate limit exceeded"
                 
-                start_time = time.time()
-                response = self.session.request(
-                    method=method,
-                    url=url,
-                    params=safe_params,
-                    json=safe_json_data,
-                    timeout=self.timeout,
+                self.logger.error("Rate limit exceeded after %d attempts", self.max_retries + 1)
+                raise APIError(
+                    f"{error_message}. Please wait before retrying.",
+                    status_code=status_code,
+                    response=error_data,
                 )
-                duration = time.time() - start_time
-                
-                # Log response
-                if self.logger.isEnabledFor(logging.DEBUG):
-                    self.logger.debug(f"Response: {response.status_code} ({duration:.2f}s)")
-                
-                # Handle authentication errors (don't retry)
-                if response.status_code == HTTP_STATUS_UNAUTHORIZED:
-                    self.logger.warning("Authentication failed")
-                    raise AuthenticationError(ERROR_AUTHENTICATION_FAILED)
-                
-                # Handle rate limiting (429) with special backoff
-                if response.status_code == HTTP_STATUS_TOO_MANY_REQUESTS:
-                    if attempt < self.max_retries:
-                        # Check for Retry-After header (seconds to wait)
-                        retry_after = response.headers.get("Retry-After")
-                        if retry_after:
-                            try:
-                                wait_time = float(retry_after)
-                            except (ValueError, TypeError):
-                                # If Retry-After is invalid, use exponential backoff
-                                wait_time = self.retry_backoff_factor * (2 ** attempt) * 2  # Longer backoff for rate limits
-                        else:
-                            # No Retry-After header, use longer exponential backoff
-                            wait_time = self.retry_backoff_factor * (2 ** attempt) * 2  # 2x longer for rate limits
-                        
-                        self.logger.warning(
-                            f"Rate limit exceeded (429) (attempt {attempt + 1}/{self.max_retries + 1}). "
-                            f"Retrying in {wait_time:.2f}s..."
-                        )
-                        time.sleep(wait_time)
-                        continue
-                    else:
-                        # Max retries reached for rate limit
-                        error_data = None
-                        try:
-                            error_data = response.json()
-                            error_message = error_data.get("message", "Rate limit exceeded")
-                        except ValueError:
-                            error_message = "Rate limit exceeded"
-                        
-                        self.logger.error(f"Rate limit exceeded after {self.max_retries + 1} attempts")
-                        raise APIError(
-                            f"{error_message}. Please wait before retrying.",
-                            status_code=response.status_code,
-                            response=error_data,
-                        )
-                
-                # Handle other retryable HTTP errors
-                if response.status_code in retryable_statuses:
-                    if attempt < self.max_retries:
-                        wait_time = self.retry_backoff_factor * (2 ** attempt)
-                        self.logger.warning(
-                            f"Retryable error {response.status_code} (attempt {attempt + 1}/{self.max_retries + 1}). "
-                            f"Retrying in {wait_time:.2f}s..."
-                        )
-                        time.sleep(wait_time)
-                        continue
-                
-                # Handle other HTTP errors (don't retry)
-                if response.status_code >= HTTP_STATUS_BAD_REQUEST:
-                    error_data = None
-                    try:
-                        error_data = response.json()
-                        error_message = error_data.get("message", f"API error: {response.status_code}")
-                    except ValueError:
-                        # JSON parsing failed - include raw response text (limit length)
-                        error_message = f"API error: {response.status_code} - {response.text[:500]}"
-                    
-                    self.logger.error(f"API error: {error_message}")
-                    raise APIError(
-                        error_message,
-                        status_code=response.status_code,
-                        response=error_data,
-                    )
-                
-                # Parse JSON response
+            
+            # Handle other HTTP errors
+            if status_code >= HTTP_STATUS_BAD_REQUEST:
+                error_data = None
                 try:
-                    result = response.json()
-                    if self.logger.isEnabledFor(logging.DEBUG):
-                        self.logger.debug(f"Request successful: {method} {endpoint}")
-                    return result
+                    error_data = _decode_json(response)
+                    error_message = error_data.get("message", f"API error: {status_code}")
                 except ValueError:
-                    # Some endpoints return non-JSON (e.g., boolean true)
-                    return {"response": response.text}
-                    
-            except requests.exceptions.RequestException as e:
-                last_exception = e
-                if attempt < self.max_retries:
-                    wait_time = self.retry_backoff_factor * (2 ** attempt)
-                    self.logger.warning(
-                        f"Network error (attempt {attempt + 1}/{self.max_retries + 1}): {str(e)}. "
-                        f"Retrying in {wait_time:.2f}s..."
-                    )
-                    time.sleep(wait_time)
-                    continue
-                # Last attempt failed
-                self.logger.error(f"Network error after {self.max_retries + 1} attempts: {str(e)}")
-                raise NetworkError(ERROR_NETWORK.format(str(e))) from e
-            except (APIError, AuthenticationError):
-                # Don't retry these
-                raise
-            except Exception as e:
-                last_exception = e
-                if attempt < self.max_retries:
-                    wait_time = self.retry_backoff_factor * (2 ** attempt)
-                    self.logger.warning(
-                        f"Unexpected error (attempt {attempt + 1}/{self.max_retries + 1}): {str(e)}. "
-                        f"Retrying in {wait_time:.2f}s..."
-                    )
-                    time.sleep(wait_time)
-                    continue
-                # Last attempt failed
-                self.logger.error(f"Unexpected error after {self.max_retries + 1} attempts: {str(e)}")
-                raise HoudiniSwapError(ERROR_UNEXPECTED.format(str(e))) from e
+                    # JSON parsing failed - include raw response text (limit length)
+                    error_message = f"API error: {status_code} - {response.text[:500]}"
+                
+                self.logger.error("API error: %s", error_message)
+                raise APIError(
+                    error_message,
+                    status_code=status_code,
+                    response=error_data,
+                )
+            
+            if raw:
+                self.logger.debug("Request successful: %s %s", method, endpoint)
+                return response.content
+            
+            # Parse JSON response
+            try:
+                result = _decode_json(response)
+                self.logger.debug("Request successful: %s %s", method, endpoint)
+                return result
+            except ValueError:
+                # Some endpoints return non-JSON (e.g., boolean true)
+                return {"response": response.text}
+                
+        except requests.exceptions.RequestException as e:
+            if isinstance(e, _BREAKER_ERRORS):
+                self._record_failure(endpoint)
+            self.logger.error("Network error after %d attempts: %s", self.max_retries + 1, e)
+            raise NetworkError(ERROR_NETWORK.format(str(e))) from e
+        except (APIError, AuthenticationError, ValidationError):
+            raise
+        except Exception as e:
+            self.logger.error("Unexpected error: %s", e)
+            raise HoudiniSwapError(ERROR_UNEXPECTED.format(str(e))) from e
+        finally:
+            if is_trial:
+                with self._breaker_lock:
+                    self._breaker_trials.discard(endpoint)
+    
+    def _check_breaker(self, endpoint: str) -> bool:
+        """
+        Fail fast if the endpoint's circuit is open.
         
-        # Should never reach here, but just in case
-        if last_exception:
-            raise HoudiniSwapError(ERROR_UNEXPECTED.format(str(last_exception))) from last_exception
-        raise HoudiniSwapError("Request failed after all retries")
+        Returns:
+            True if this call is the half-open trial after the cooldown; the
+            caller must clear it from _breaker_trials when the request ends
+        
+        Raises:
+            CircuitOpenError: If the circuit is open, or cooling down is over
+                              but another caller's trial is still in flight
+        """
+        # Endpoints with no recorded failures (the common case) skip the lock
+        if not self.breaker_threshold or endpoint not in self._breaker_failures:
+            return False
+        with self._breaker_lock:
+            failures = self._breaker_failures.get(endpoint)
+            if failures is None or failures[0] < self.breaker_threshold:
+                return False
+            count, last_failure = failures
+            remaining = self.breaker_cooldown - (time.monotonic() - last_failure)
+            if remaining <= 0 and endpoint not in self._breaker_trials:
+                self._breaker_trials.add(endpoint)
+                return True
+        retry_after = max(remaining, 0.0)
+        raise CircuitOpenError(
+            ERROR_CIRCUIT_OPEN.format(endpoint, count, retry_after),
+            endpoint=endpoint,
+            retry_after=retry_after,
+        )
+    
+    def _record_failure(self, endpoint: str) -> None:
+        """Count a consecutive failure towards the endpoint's circuit breaker."""
+        with self._breaker_lock:
+            count, _ = self._breaker_failures.get(endpoint, (0, 0.0))
+            self._breaker_failures[endpoint] = (count + 1, time.monotonic())
+        if self.breaker_threshold and count + 1 == self.breaker_threshold:
+            self.logger.warning(
+                "Circuit opened for %s after %d consecutive failures", endpoint, count + 1
+            )
     
     def __enter__(self) -> "HoudiniSwapClient":
         """Enter context manager."""
@@ -632,23 +947,115 @@ class HoudiniSwapClient:
     
     def close(self) -> None:
         """Close the HTTP session and release resources."""
+        executor = getattr(self, '_executor', None)
+        if executor is not None:
+            self._executor = None
+            executor.shutdown(wait=True)
         if hasattr(self, 'session') and self.session:
-            try:
-                closed = object.__getattribute__(self, '_closed')
-            except AttributeError:
-                closed = False
-            if not closed:
+            if not self._closed:
                 self.session.close()
-                self.session.closed = True
-                object.__setattr__(self, '_closed', True)
+                self.session.closed = True  # type: ignore[attr-defined]
+                self._closed = True
+    
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """Return the shared worker pool, creating it on first use."""
+        executor = self._executor
+        if executor is None:
+            with self._executor_lock:
+                executor = self._executor
+                if executor is None:
+                    # Threads are spawned on demand, up to the connection pool size
+                    executor = self._executor = ThreadPoolExecutor(
+                        max_workers=self.pool_maxsize,
+                        thread_name_prefix="houdiniswap-parallel",
+                        initializer=_mark_worker_thread,
+                    )
+        return executor
+    
+    def _run_parallel(self, calls: List[Callable[[], Any]], max_workers: int) -> List[Any]:
+        """
+        Run calls on the shared pool with at most max_workers in flight.
+        
+        Results (or raised exceptions) are returned in input order. A fan-out
+        started from inside a pool task (e.g. execute_parallel nested in
+        execute_parallel) gets a private pool for the call instead: waiting on
+        the shared pool from one of its own workers could deadlock once every
+        worker is blocked.
+        
+        Raises:
+            ValidationError: If max_workers is less than 1
+        """
+        if max_workers < 1:
+            raise ValidationError(f"max_workers must be at least 1, got {max_workers}")
+        
+        executor, private = self._executor_for(min(max_workers, len(calls)) or 1)
+        if private:
+            with executor:
+                return self._submit_bounded(executor, calls, max_workers)
+        return self._submit_bounded(executor, calls, max_workers)
+    
+    def _executor_for(self, max_workers: int) -> Tuple[ThreadPoolExecutor, bool]:
+        """
+        Return the pool to fan out on and whether it is private to the caller.
+        
+        Callers on a shared-pool worker get a private pool of max_workers
+        threads, which they must shut down; everyone else gets the shared pool.
+        """
+        if getattr(_worker_state, "is_worker", False):
+            return ThreadPoolExecutor(
+                max_workers=max_workers,
+                thread_name_prefix="houdiniswap-nested",
+                initializer=_mark_worker_thread,
+            ), True
+        return self._get_executor(), False
+    
+    @staticmethod
+    def _submit_bounded(
+        executor: ThreadPoolExecutor, calls: List[Callable[[], Any]], max_workers: int
+    ) -> List[Any]:
+        """Submit calls with at most max_workers in flight; collect results in order."""
+        pending: "deque[Future]" = deque()
+        results = []
+        for call in calls:
+            if len(pending) >= max_workers:
+                results.append(pending.popleft().result())
+            pending.append(executor.submit(_call_capturing_errors, call))
+        results.extend(future.result() for future in pending)
+        return results
     
     # ==================== Token Information APIs ====================
     
-    def clear_cache(self) -> None:
-        """Clear the token cache."""
-        self._token_cache.clear()
-        if self.logger.isEnabledFor(logging.DEBUG):
-            self.logger.debug("Token cache cleared")
+    def clear_cache(self, group: Optional[str] = None) -> None:
+        """
+        Clear cached responses.
+        
+        Args:
+            group: Only clear one kind of cached response: "cex_tokens",
+                   "dex_tokens", "min_max", "volume", "weekly_volume",
+                   "cex_quote", or "dex_quote" (the names reported by
+                   cache_stats()). Default: clear everything.
+        """
+        self._token_cache.clear(group)
+        self._quote_cache.clear(group)
+        self.logger.debug("Cache cleared: %s", group or "all")
+    
+    def cache_stats(self) -> Dict[str, Any]:
+        """
+        Get token cache usage statistics.
+        
+        Returns:
+            Dict with size, maxsize, hits, misses, hit_ratio, evictions, and
+            per-endpoint counters under "groups" (e.g. "cex_tokens",
+            "dex_tokens", "min_max"). Counters accumulate for the life of the client and
+            are not reset by clear_cache().
+        
+        Example:
+            ```python
+            stats = client.cache_stats()
+            print(stats["groups"]["dex_tokens"]["hit_ratio"])
+            ```
+        """
+        return self._token_cache.stats()
     
     def get_cex_tokens(self) -> List[Token]:
         """
@@ -679,21 +1086,26 @@ class HoudiniSwapClient:
         Side Effects:
             Makes a network request if cache is disabled or expired. Updates cache if enabled.
         """
-        cache_key = "cex_tokens"
-        current_time = time.time()
+        if not self.cache_enabled:
+            return list(self._iter_cex_tokens())
         
-        # Check cache
-        if self.cache_enabled and cache_key in self._token_cache:
-            cached_data, cached_time = self._token_cache[cache_key]
-            if current_time - cached_time < self.cache_ttl:
-                if self.logger.isEnabledFor(logging.DEBUG):
-                    self.logger.debug(f"Returning cached CEX tokens (age: {current_time - cached_time:.1f}s)")
-                return cached_data
+        # Serve from cache or fetch from API; concurrent misses share a single
+        # request, and the cache stores a materialized list
+        return self._token_cache.get_or_load(
+            ("cex_tokens",), lambda: list(self._iter_cex_tokens()), self.cache_ttl
+        )
+    
+    def _iter_cex_tokens(self) -> Iterator[Token]:
+        """
+        Fetch CEX tokens and build Token objects lazily (bypasses the cache).
         
-        # Fetch from API
+        The response type is validated before returning, so errors surface on
+        the call rather than on first iteration. Callers that stop early (e.g.
+        searching for one symbol) never construct the remaining tokens.
+        """
         response = self._request("GET", ENDPOINT_TOKENS)
         
-        # Validate response is a list before list comprehension
+        # Validate response is a list before mapping over it
         if not isinstance(response, list):
             raise APIError(
                 f"Unexpected response type from tokens endpoint: expected list, got {type(response).__name__}",
@@ -701,21 +1113,14 @@ class HoudiniSwapClient:
                 response=response,
             )
         
-        tokens = [Token.from_dict(token_data) for token_data in response]
-        
-        # Update cache
-        if self.cache_enabled:
-            self._token_cache[cache_key] = (tokens, current_time)
-            if self.logger.isEnabledFor(logging.DEBUG):
-                self.logger.debug("Cached CEX tokens")
-        
-        return tokens
+        return map(Token.from_dict, response)
     
     def get_dex_tokens(
         self,
         page: int = 1,
         page_size: int = DEFAULT_PAGE_SIZE,
         chain: Optional[str] = None,
+        lazy: bool = False,
     ) -> DEXTokensResponse:
         """
         Get a list of tokens supported for DEX exchanges.
@@ -724,6 +1129,10 @@ class HoudiniSwapClient:
             page: Page number (default: 1)
             page_size: Number of tokens per page (default: 100, see DEFAULT_PAGE_SIZE constant)
             chain: Chain short name (e.g., "base") - optional
+            lazy: Return tokens as a read-only LazyModelList whose DEXToken
+                  objects are built on first access (default: False). Saves
+                  work when only count or a few tokens are read; malformed
+                  entries then raise on access rather than here.
             
         Returns:
             DEXTokensResponse object with count and tokens fields
@@ -749,24 +1158,31 @@ class HoudiniSwapClient:
             and page size. Typically completes in < 1 second under normal conditions.
         
         Side Effects:
-            Makes a network request. No local state is modified.
+            Makes a network request if cache is disabled or expired. Updates cache if enabled.
         """
         # Validate parameters
         self._validate_page(page)
         self._validate_page_size(page_size)
         
-        # Create cache key from parameters
-        cache_key = f"dex_tokens_{page}_{page_size}_{chain or 'all'}"
-        current_time = time.time()
+        if not self.cache_enabled:
+            return self._fetch_dex_tokens(page, page_size, chain, lazy)
         
-        # Check cache
-        if self.cache_enabled and cache_key in self._token_cache:
-            cached_data, cached_time = self._token_cache[cache_key]
-            if current_time - cached_time < self.cache_ttl:
-                if self.logger.isEnabledFor(logging.DEBUG):
-                    self.logger.debug(f"Returning cached DEX tokens (age: {current_time - cached_time:.1f}s)")
-                return cached_data
+        # Tuple key: no per-call string formatting; empty chain means all chains
+        cache_key: Tuple[Any, ...] = ("dex_tokens", page, page_size, chain or None)
+        if lazy:
+            # Lazy pages are cached apart so eager callers always get a list
+            cache_key += ("lazy",)
         
+        # Serve from cache or fetch from API; concurrent misses for the same
+        # page share a single request
+        return self._token_cache.get_or_load(
+            cache_key, lambda: self._fetch_dex_tokens(page, page_size, chain, lazy), self.cache_ttl
+        )
+    
+    def _fetch_dex_tokens(
+        self, page: int, page_size: int, chain: Optional[str], lazy: bool = False
+    ) -> DEXTokensResponse:
+        """Fetch and parse one page of DEX tokens (bypasses the cache)."""
         # Create fresh params dict for each call (no mutable defaults)
         # This pattern ensures thread-safety and prevents accidental mutations
         params = {
@@ -776,20 +1192,15 @@ class HoudiniSwapClient:
         if chain:
             params["chain"] = chain
         
-        # Fetch from API
         response = self._request("GET", ENDPOINT_DEX_TOKENS, params=params)
-        result = DEXTokensResponse(
-            count=response.get("count", 0),
-            tokens=[DEXToken.from_dict(token_data) for token_data in response.get("tokens", [])],
-        )
-        
-        # Update cache
-        if self.cache_enabled:
-            self._token_cache[cache_key] = (result, current_time)
-            if self.logger.isEnabledFor(logging.DEBUG):
-                self.logger.debug(f"Cached DEX tokens (key: {cache_key})")
-        
-        return result
+        raw_tokens = response.get("tokens", [])
+        if lazy:
+            # Built on first access; callers reading count or a few entries
+            # skip constructing the rest of the page
+            tokens = cast(List[DEXToken], LazyModelList(raw_tokens, DEXToken.from_dict))
+        else:
+            tokens = [DEXToken.from_dict(token) for token in raw_tokens]
+        return DEXTokensResponse(count=response.get("count", 0), tokens=tokens)
     
     # ==================== Quote APIs ====================
     
@@ -829,11 +1240,31 @@ class HoudiniSwapClient:
         Performance:
             Single HTTP GET request. Response time depends on API latency.
             Typically completes in < 1 second under normal conditions.
+            With quote_cache_enabled, identical calls within quote_cache_ttl
+            seconds return the cached Quote without a request.
         
         Side Effects:
-            Makes a network request. No local state is modified.
+            Makes a network request unless a cached quote is returned. Updates the
+            quote cache if enabled.
             Note: Boolean values are converted to lowercase strings for API compatibility.
         """
+        if self.quote_cache_enabled:
+            return self._quote_cache.get_or_load(
+                ("cex_quote", amount, from_token, to_token, anonymous, use_xmr),
+                lambda: self._fetch_cex_quote(amount, from_token, to_token, anonymous, use_xmr),
+                self.quote_cache_ttl,
+            )
+        return self._fetch_cex_quote(amount, from_token, to_token, anonymous, use_xmr)
+    
+    def _fetch_cex_quote(
+        self,
+        amount: str,
+        from_token: str,
+        to_token: str,
+        anonymous: bool,
+        use_xmr: Optional[bool],
+    ) -> Quote:
+        """Fetch and parse a CEX quote (bypasses the quote cache)."""
         # Create fresh params dict for each call (no mutable defaults)
         params = {
             "amount": amount,
@@ -879,15 +1310,29 @@ class HoudiniSwapClient:
         Performance:
             Single HTTP GET request. Response time depends on API latency and route calculation.
             Typically completes in < 2 seconds under normal conditions.
+            With quote_cache_enabled, identical calls within quote_cache_ttl
+            seconds return the cached quotes without a request.
         
         Side Effects:
-            Makes a network request. No local state is modified.
+            Makes a network request unless cached quotes are returned. Updates the
+            quote cache if enabled.
         """
         # Validate and convert amount
         amount_str = self._normalize_amount(amount)
         self._validate_token_id(token_id_from, "token_id_from")
         self._validate_token_id(token_id_to, "token_id_to")
         
+        if self.quote_cache_enabled:
+            # Keyed on the normalized amount so "1.5", Decimal("1.5") and 1.5 share an entry
+            return self._quote_cache.get_or_load(
+                ("dex_quote", amount_str, token_id_from, token_id_to),
+                lambda: self._fetch_dex_quote(amount_str, token_id_from, token_id_to),
+                self.quote_cache_ttl,
+            )
+        return self._fetch_dex_quote(amount_str, token_id_from, token_id_to)
+    
+    def _fetch_dex_quote(self, amount_str: str, token_id_from: str, token_id_to: str) -> List[DEXQuote]:
+        """Fetch and parse DEX quotes for validated input (bypasses the quote cache)."""
         # Create fresh params dict for each call (no mutable defaults)
         params = {
             "amount": amount_str,
@@ -968,13 +1413,7 @@ class HoudiniSwapClient:
             Creates a transaction on the Houdini Swap platform. This is a state-changing operation.
             The transaction will be processed asynchronously. Use get_status() to check progress.
         """
-        # Validate inputs
-        self._validate_amount(amount, "amount")
-        self._sanitize_input(from_token, "from_token")
-        self._sanitize_input(to_token, "to_token")
-        self._sanitize_input(address_to, "address_to")
-        
-        # Validate and convert amount
+        # Validate and convert amount, then validate inputs
         amount_decimal = self._normalize_amount_to_decimal(amount)
         self._validate_amount(float(amount_decimal), "amount")
         self._sanitize_input(from_token, "from_token")
@@ -1181,10 +1620,21 @@ class HoudiniSwapClient:
             "txHash": tx_hash,
         }
         
-        response = self._request("POST", ENDPOINT_DEX_CONFIRM_TX, json_data=json_data)
-        # API returns boolean true/false
-        if _is_dict_response(response) and "response" in response:
-            return response["response"].lower() == "true"
+        # API normally returns a bare true/false body; compare the bytes without parsing
+        body = self._request("POST", ENDPOINT_DEX_CONFIRM_TX, json_data=json_data, raw=True)
+        if body.strip().lower() in _TRUE_BODIES:
+            return True
+        
+        # Other bodies: JSON values count by truthiness (e.g. {"success": true})
+        try:
+            response = orjson.loads(body) if orjson is not None else json.loads(body)
+        except ValueError:
+            # Non-JSON text other than "true"
+            return False
+        if isinstance(response, dict) and "response" in response:
+            return str(response["response"]).lower() == "true"
+        if isinstance(response, str):
+            return response.lower() == "true"
         return bool(response)
     
     # ==================== Status and Information APIs ====================
@@ -1242,8 +1692,17 @@ class HoudiniSwapClient:
         if cex_only is not None:
             params["cexOnly"] = cex_only  # Send boolean directly, not string
         
-        response = self._request("GET", ENDPOINT_MIN_MAX, params=params)
-        return MinMax.from_list(response)
+        if not self.cache_enabled:
+            return self._fetch_min_max(params)
+        return self._token_cache.get_or_load(
+            ("min_max", from_token, to_token, anonymous, cex_only),
+            partial(self._fetch_min_max, params),
+            DEFAULT_MIN_MAX_CACHE_TTL,
+        )
+    
+    def _fetch_min_max(self, params: Dict[str, Any]) -> MinMax:
+        """Fetch and parse min/max limits (bypasses the cache)."""
+        return MinMax.from_list(self._request("GET", ENDPOINT_MIN_MAX, params=params))
     
     def get_volume(self) -> Volume:
         """
@@ -1252,11 +1711,18 @@ class HoudiniSwapClient:
         Returns:
             Volume object
         """
+        if not self.cache_enabled:
+            return self._fetch_volume()
+        return self._token_cache.get_or_load(("volume",), self._fetch_volume, DEFAULT_VOLUME_CACHE_TTL)
+    
+    def _fetch_volume(self) -> Volume:
+        """Fetch and parse the total volume (bypasses the cache)."""
         response = self._request("GET", ENDPOINT_VOLUME)
         # API returns array, get first element
-        if _is_list_response(response) and len(response) > 0:
+        # Inline isinstance checks: exact-type fast path, and type checkers narrow them
+        if isinstance(response, list) and response:
             return Volume.from_dict(response[0])
-        if _is_dict_response(response):
+        if isinstance(response, dict):
             return Volume.from_dict(response)
         raise APIError(
             f"Unexpected response type from volume endpoint: expected list or dict, got {type(response).__name__}",
@@ -1271,10 +1737,18 @@ class HoudiniSwapClient:
         Returns:
             List of WeeklyVolume objects
         """
+        if not self.cache_enabled:
+            return self._fetch_weekly_volume()
+        return self._token_cache.get_or_load(
+            ("weekly_volume",), self._fetch_weekly_volume, DEFAULT_WEEKLY_VOLUME_CACHE_TTL
+        )
+    
+    def _fetch_weekly_volume(self) -> List[WeeklyVolume]:
+        """Fetch and parse weekly volume data (bypasses the cache)."""
         response = self._request("GET", ENDPOINT_WEEKLY_VOLUME)
-        if _is_list_response(response):
+        if isinstance(response, list):
             return [WeeklyVolume.from_dict(item) for item in response]
-        if _is_dict_response(response):
+        if isinstance(response, dict):
             return [WeeklyVolume.from_dict(response)]
         raise APIError(
             f"Unexpected response type from weekly volume endpoint: expected list or dict, got {type(response).__name__}",
@@ -1288,6 +1762,7 @@ class HoudiniSwapClient:
         self,
         chain: Optional[str] = None,
         page_size: int = DEFAULT_PAGE_SIZE,
+        prefetch: int = 1,
     ):
         """
         Iterator for all DEX tokens across all pages.
@@ -1295,9 +1770,21 @@ class HoudiniSwapClient:
         Args:
             chain: Optional chain filter (e.g., "base")
             page_size: Number of tokens per page (default: 100)
+            prefetch: Number of upcoming pages requested ahead of the caller
+                      (default: 1)
             
         Yields:
             DEXToken objects from all pages
+        
+        Raises:
+            ValidationError: If prefetch is less than 1
+        
+        Performance:
+            While the tokens of one page are being yielded, the next pages are
+            prefetched on the client's shared worker pool, overlapping network latency with
+            the caller's processing. At most ``prefetch`` page requests are in
+            flight; raise it when per-token processing is fast relative to
+            round-trip time.
             
         Example:
             ```python
@@ -1305,18 +1792,37 @@ class HoudiniSwapClient:
                 print(token.name)
             ```
         """
+        if prefetch < 1:
+            raise ValidationError(f"prefetch must be at least 1, got {prefetch}")
+        
         page = 1
-        while True:
+        pending: "deque[Future]" = deque()  # futures for the upcoming pages, in page order
+        # Pool workers keep up to `prefetch` page requests in flight, so later
+        # pages download while the caller consumes the current one
+        executor, private = self._executor_for(prefetch)
+        try:
             response = self.get_dex_tokens(page=page, page_size=page_size, chain=chain)
-            if not response.tokens:
-                break
-            for token in response.tokens:
-                yield token
-            # Check if there are more pages
-            total_pages = (response.count + page_size - 1) // page_size
-            if page >= total_pages:
-                break
-            page += 1
+            while response.tokens:
+                # Top up the prefetch window with the pages that exist
+                total_pages = (response.count + page_size - 1) // page_size
+                next_page = page + len(pending) + 1
+                while len(pending) < prefetch and next_page <= total_pages:
+                    pending.append(executor.submit(
+                        self.get_dex_tokens, page=next_page, page_size=page_size, chain=chain
+                    ))
+                    next_page += 1
+                for token in response.tokens:
+                    yield token
+                if not pending:
+                    break
+                response = pending.popleft().result()
+                page += 1
+        finally:
+            # Consumer stopped early or an error occurred: drop any pending prefetches
+            for future in pending:
+                future.cancel()
+            if private:
+                executor.shutdown(wait=False)
     
     def get_all_dex_tokens(
         self,
@@ -1336,8 +1842,28 @@ class HoudiniSwapClient:
         Note:
             This loads all tokens into memory. For large token lists, use
             `iter_dex_tokens()` instead for memory efficiency.
+        
+        Performance:
+            The first page is fetched to learn the total count; the remaining
+            pages are then fetched concurrently (up to 10 at a time), so total
+            latency is roughly two round-trips instead of one per page.
         """
-        return list(self.iter_dex_tokens(chain=chain, page_size=page_size))
+        first = self.get_dex_tokens(page=1, page_size=page_size, chain=chain)
+        tokens = list(first.tokens)
+        total_pages = (first.count + page_size - 1) // page_size
+        if not tokens or total_pages <= 1:
+            return tokens
+        
+        calls: List[Callable[[], Any]] = [
+            partial(self.get_dex_tokens, page=page, page_size=page_size, chain=chain)
+            for page in range(2, total_pages + 1)
+        ]
+        # Results come back in page order; the first failed page is raised
+        for response in self._run_parallel(calls, min(10, self.pool_maxsize)):
+            if isinstance(response, Exception):
+                raise response
+            tokens.extend(response.tokens)
+        return tokens
     
     def wait_for_status(
         self,
@@ -1345,6 +1871,7 @@ class HoudiniSwapClient:
         target_status: TransactionStatus,
         timeout: int = 300,
         poll_interval: int = 5,
+        max_poll_interval: int = DEFAULT_MAX_POLL_INTERVAL,
     ) -> Status:
         """
         Poll until transaction reaches target status.
@@ -1353,7 +1880,9 @@ class HoudiniSwapClient:
             houdini_id: Unique ID of the transaction
             target_status: Status to wait for
             timeout: Maximum time to wait in seconds (default: 300 = 5 minutes)
-            poll_interval: Time between polls in seconds (default: 5)
+            poll_interval: Initial time between polls in seconds (default: 5)
+            max_poll_interval: Upper bound for the poll delay, which doubles after
+                               each poll (default: 30)
             
         Returns:
             Status object when target status is reached
@@ -1361,28 +1890,35 @@ class HoudiniSwapClient:
         Raises:
             TimeoutError: If timeout is reached before target status
             APIError: If API returns an error
+        
+        Performance:
+            Polls back off exponentially (5s, 10s, 20s, 30s, ...), so long-running
+            transactions cost a handful of requests instead of timeout / poll_interval.
         """
-        import time
-        start_time = time.time()
+        start_time = time.monotonic()
+        delays = _poll_delays(poll_interval, max_poll_interval)
         
         while True:
             status = self.get_status(houdini_id)
             if status.status == target_status:
                 return status
             
-            if time.time() - start_time > timeout:
+            elapsed = time.monotonic() - start_time
+            if elapsed > timeout:
                 raise TimeoutError(
                     f"Timeout waiting for status {target_status.name}. "
                     f"Current status: {status.status.name}"
                 )
             
-            time.sleep(poll_interval)
+            # Never sleep past the deadline: the last poll happens at the timeout
+            time.sleep(min(next(delays), max(0, timeout - elapsed)))
     
     def poll_until_finished(
         self,
         houdini_id: str,
         timeout: int = 600,
         poll_interval: int = 5,
+        max_poll_interval: int = DEFAULT_MAX_POLL_INTERVAL,
     ) -> Status:
         """
         Poll until transaction is finished (FINISHED, FAILED, EXPIRED, or REFUNDED).
@@ -1390,7 +1926,9 @@ class HoudiniSwapClient:
         Args:
             houdini_id: Unique ID of the transaction
             timeout: Maximum time to wait in seconds (default: 600 = 10 minutes)
-            poll_interval: Time between polls in seconds (default: 5)
+            poll_interval: Initial time between polls in seconds (default: 5)
+            max_poll_interval: Upper bound for the poll delay, which doubles after
+                               each poll (default: 30)
             
         Returns:
             Final Status object
@@ -1398,29 +1936,27 @@ class HoudiniSwapClient:
         Raises:
             TimeoutError: If timeout is reached
             APIError: If API returns an error
-        """
-        import time
-        start_time = time.time()
         
-        final_statuses = {
-            TransactionStatus.FINISHED,
-            TransactionStatus.FAILED,
-            TransactionStatus.EXPIRED,
-            TransactionStatus.REFUNDED,
-        }
+        Performance:
+            Polls back off exponentially up to max_poll_interval; see wait_for_status.
+        """
+        start_time = time.monotonic()
+        delays = _poll_delays(poll_interval, max_poll_interval)
         
         while True:
             status = self.get_status(houdini_id)
-            if status.status in final_statuses:
+            if status.status in _FINAL_STATUSES:
                 return status
             
-            if time.time() - start_time > timeout:
+            elapsed = time.monotonic() - start_time
+            if elapsed > timeout:
                 raise TimeoutError(
                     f"Timeout waiting for transaction to finish. "
                     f"Current status: {status.status.name}"
                 )
             
-            time.sleep(poll_interval)
+            # Never sleep past the deadline: the last poll happens at the timeout
+            time.sleep(min(next(delays), max(0, timeout - elapsed)))
     
     def execute_parallel(
         self,
@@ -1445,20 +1981,146 @@ class HoudiniSwapClient:
                 lambda: client.get_status("id2"),
             ])
             ```
+        
+        Performance:
+            Calls run on a worker pool owned by the client and reused across
+            execute_parallel and batch_execute calls, so repeated fan-outs do not
+            pay for thread startup and teardown. The pool holds at most
+            pool_maxsize threads, which also bounds max_workers; it is shut
+            down by close(). Nested fan-outs (execute_parallel called from
+            inside one of its own tasks) run on a private per-call pool.
+        
+        Raises:
+            ValidationError: If max_workers is less than 1
         """
-        from concurrent.futures import ThreadPoolExecutor, as_completed
-        results = [None] * len(requests)
-        with ThreadPoolExecutor(max_workers=max_workers) as executor:
-            future_to_index = {
-                executor.submit(req): i for i, req in enumerate(requests)
-            }
-            for future in as_completed(future_to_index):
-                index = future_to_index[future]
-                try:
-                    results[index] = future.result()
-                except Exception as e:
-                    results[index] = e
-        return results
+        if not requests:
+            return []
+        return self._run_parallel(requests, max_workers)
+    
+    def batch_execute(
+        self,
+        calls: List[tuple],
+        max_workers: int = 10,
+    ) -> List[Any]:
+        """
+        Execute multiple raw API requests concurrently over the pooled session.
+        
+        Args:
+            calls: List of ``(method, endpoint[, params[, json_data]])`` tuples,
+                   passed positionally to the internal request method
+            max_workers: Maximum number of concurrent requests (default: 10, capped at
+                         the connection pool size)
+            
+        Returns:
+            List of parsed JSON responses in the same order as calls. If a call
+            raises, the exception is stored at its index instead.
+        
+        Performance:
+            Independent requests overlap their round-trips, so N calls complete in
+            roughly ceil(N / max_workers) round-trips instead of N. Workers are
+            capped at the session's per-host pool size (pool_maxsize) so
+            every request reuses a kept-alive connection instead of opening, and
+            then discarding, extra TCP/TLS connections. Calls run on the client's
+            shared worker pool (see execute_parallel).
+        
+        Thread Safety:
+            The shared requests.Session is safe for concurrent requests as long as
+            session headers and adapters are not modified while a batch is running.
+            
+        Example:
+            ```python
+            results = client.batch_execute([
+                ("GET", "/status", {"id": "id1"}),
+                ("GET", "/status", {"id": "id2"}),
+                ("GET", "/volume"),
+            ])
+            ```
+        """
+        if not calls:
+            return []
+        return self._run_parallel([partial(self._request, *call) for call in calls], max_workers)
+    
+    def get_statuses(
+        self,
+        houdini_ids: List[str],
+        max_workers: int = 10,
+    ) -> Dict[str, Union[Status, Exception]]:
+        """
+        Get the status of several transactions concurrently.
+        
+        Args:
+            houdini_ids: Houdini IDs to look up (duplicates are requested once)
+            max_workers: Maximum number of concurrent requests (default: 10, capped
+                         at the connection pool size)
+            
+        Returns:
+            Dict mapping each houdini ID to its Status, or to the exception raised
+            for that ID (e.g. ValidationError, APIError), in input order
+        
+        Performance:
+            Requests run on the client's shared worker pool over pooled
+            connections, so N lookups take roughly ceil(N / max_workers)
+            round-trips instead of N.
+        
+        Example:
+            ```python
+            for houdini_id, status in client.get_statuses(ids).items():
+                if isinstance(status, Exception):
+                    print(f"{houdini_id}: {status}")
+            ```
+        """
+        ids = list(dict.fromkeys(houdini_ids))
+        results = self._run_parallel([partial(self.get_status, houdini_id) for houdini_id in ids], max_workers)
+        return dict(zip(ids, results))
+    
+    def get_min_maxes(
+        self,
+        pairs: List[Tuple[str, str]],
+        anonymous: bool = False,
+        cex_only: Optional[bool] = None,
+        max_workers: int = 10,
+    ) -> Dict[Tuple[str, str], Union[MinMax, Exception]]:
+        """
+        Get min/max exchange amounts for several token pairs concurrently.
+        
+        Args:
+            pairs: ``(from_token, to_token)`` tuples
+            anonymous: Whether the transactions should be anonymous (default: False)
+            cex_only: Whether to limit results to centralized exchanges (optional)
+            max_workers: Maximum number of concurrent requests (default: 10, capped
+                         at the connection pool size)
+            
+        Returns:
+            Dict mapping each pair to its MinMax, or to the exception raised for it
+        """
+        pairs = list(dict.fromkeys(pairs))
+        results = self._run_parallel(
+            [partial(self.get_min_max, from_token, to_token, anonymous, cex_only)
+             for from_token, to_token in pairs],
+            max_workers,
+        )
+        return dict(zip(pairs, results))
+    
+    def get_dex_quotes(
+        self,
+        requests: List[Tuple[Union[str, Decimal, float], str, str]],
+        max_workers: int = 10,
+    ) -> Dict[Tuple[Union[str, Decimal, float], str, str], Union[List[DEXQuote], Exception]]:
+        """
+        Get DEX quotes for several swaps concurrently.
+        
+        Args:
+            requests: ``(amount, token_id_from, token_id_to)`` tuples
+            max_workers: Maximum number of concurrent requests (default: 10, capped
+                         at the connection pool size)
+            
+        Returns:
+            Dict mapping each request tuple to its list of DEXQuote objects, or to
+            the exception raised for it
+        """
+        requests = list(dict.fromkeys(requests))
+        results = self._run_parallel([partial(self.get_dex_quote, *request) for request in requests], max_workers)
+        return dict(zip(requests, results))
     
     def exchange_builder(self) -> "ExchangeBuilder":
         """
@@ -2,27 +2,154 @@
 
 import os
 import json
-from typing import Optional, Dict, Any
+import stat
+from types import MappingProxyType
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Mapping, Optional, Tuple
 from pathlib import Path
+try:
+    import orjson  # Optional fast JSON backend
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
+# Parses JSON from bytes (orjson when installed)
+_json_loads: Callable[[bytes], Any] = orjson.loads if orjson is not None else json.loads
+
+# Built-in defaults, overridden by config files and then environment variables
+_DEFAULTS: Dict[str, Any] = {
+    "base_url": "https://api-partner.houdiniswap.com",
+    "timeout": 30,
+    "api_version": "v1",
+    "verify_ssl": True,
+    "max_retries": 3,
+    "retry_backoff_factor": 1.0,
+    "cache_enabled": False,
+    "cache_ttl": 300,
+}
+
+
+# Values accepted as True for boolean environment variables (compared lowercased)
+_TRUTHY = frozenset({"true", "1", "yes", "on"})
+# Common spellings matched as-is, without allocating a lowercased copy
+_TRUTHY_EXACT = _TRUTHY | {"True", "TRUE", "Yes", "YES", "On", "ON"}
+
+
+def _env_bool(value: str) -> bool:
+    """Parse a boolean environment variable ("true", "1", "yes" or "on", any case)."""
+    return value in _TRUTHY_EXACT or value.lower() in _TRUTHY
+
+
+# (environment variable, config key, converter)
+_ENV_OVERRIDES: Tuple[Tuple[str, str, Callable[[str], Any]], ...] = (
+    ("HOUDINI_SWAP_API_URL", "base_url", str),
+    ("HOUDINI_SWAP_TIMEOUT", "timeout", int),
+    ("HOUDINI_SWAP_API_VERSION", "api_version", str),
+    ("HOUDINI_SWAP_VERIFY_SSL", "verify_ssl", _env_bool),
+    ("HOUDINI_SWAP_MAX_RETRIES", "max_retries", int),
+    ("HOUDINI_SWAP_RETRY_BACKOFF_FACTOR", "retry_backoff_factor", float),
+    ("HOUDINI_SWAP_CACHE_ENABLED", "cache_enabled", _env_bool),
+    ("HOUDINI_SWAP_CACHE_TTL", "cache_ttl", int),
+)
+
+# Supported config file extensions, in lookup order
+_CONFIG_SUFFIXES = (".json", ".yaml", ".yml", ".toml")
+
+
+@lru_cache(maxsize=None)
+def _default_config_paths() -> Tuple[str, ...]:
+    """
+    Config file locations searched when no config_file is given, in priority order.
+    
+    Built on first use rather than at import, so the home directory is only
+    looked up when a default search actually happens.
+    """
+    home = os.path.expanduser("~")
+    return (
+        *(f"houdiniswap{suffix}" for suffix in _CONFIG_SUFFIXES),
+        *(f".houdiniswap{suffix}" for suffix in _CONFIG_SUFFIXES),
+        *(os.path.join(home, f".houdiniswap{suffix}") for suffix in _CONFIG_SUFFIXES),
+    )
+
+
+class _LazyDefaultConfigPaths:
+    """
+    Class attribute holding the default search paths, built on first access.
+    
+    The first read replaces the descriptor with a plain list on the owning
+    class, so Config.DEFAULT_CONFIG_PATHS behaves like the list it used to be:
+    in-place edits and reassignment both affect later default searches.
+    """
+    
+    def __set_name__(self, owner: type, name: str) -> None:
+        self._owner = owner
+        self._name = name
+    
+    def __get__(self, instance: Any, owner: Optional[type] = None) -> List[str]:
+        paths = list(_default_config_paths())
+        setattr(self._owner, self._name, paths)
+        return paths
+
+
+def _load_json(path: Path) -> Any:
+    """Parse a JSON config file (read as bytes; JSON is UTF-8)."""
+    with open(path, "rb") as f:
+        return _json_loads(f.read())
+
+
+@lru_cache(maxsize=None)
+def _loader_for(suffix: str) -> Optional[Callable[[Path], Any]]:
+    """
+    Return a parser for config files with the given suffix.
+    
+    The YAML/TOML libraries are imported on first use of their format and the
+    resulting parser is cached for the process. Returns None for unsupported
+    suffixes or when the optional library is not installed.
+    """
+    if suffix == ".json":
+        return _load_json
+    
+    if suffix in (".yaml", ".yml"):
+        try:
+            import yaml
+        except ImportError:
+            return None
+        # libyaml's C loader when available; same safe subset
+        yaml_loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+        
+        def load_yaml(path: Path) -> Any:
+            with open(path, "r", encoding="utf-8") as f:
+                return yaml.load(f, Loader=yaml_loader)
+        
+        return load_yaml
+    
+    if suffix == ".toml":
+        try:
+            import tomllib  # Python 3.11+
+        except ImportError:
+            try:
+                import tomli as tomllib  # type: ignore[no-redef]  # Python < 3.11
+            except ImportError:
+                return None
+        
+        def load_toml(path: Path) -> Any:
+            with open(path, "rb") as f:
+                return tomllib.load(f)
+        
+        return load_toml
+    
+    return None
 
 
 class Config:
     """Configuration manager for SDK settings."""
     
-    DEFAULT_CONFIG_PATHS = [
-        "houdiniswap.json",
-        "houdiniswap.yaml",
-        "houdiniswap.yml",
-        "houdiniswap.toml",
-        ".houdiniswap.json",
-        ".houdiniswap.yaml",
-        ".houdiniswap.yml",
-        ".houdiniswap.toml",
-        os.path.expanduser("~/.houdiniswap.json"),
-        os.path.expanduser("~/.houdiniswap.yaml"),
-        os.path.expanduser("~/.houdiniswap.yml"),
-        os.path.expanduser("~/.houdiniswap.toml"),
-    ]
+    # Searched in order when no config_file is given
+    DEFAULT_CONFIG_PATHS = _LazyDefaultConfigPaths()
+    
+    # Parsed config files shared by all instances: absolute path -> (signature, data),
+    # where signature is (st_mtime_ns, st_size, st_ino). Size and inode catch
+    # rewrites within one mtime tick on filesystems with coarse timestamps.
+    _file_cache: Dict[str, Tuple[Tuple[int, int, int], Any]] = {}
     
     def __init__(self, profile: Optional[str] = None, config_file: Optional[str] = None):
         """
@@ -35,21 +162,13 @@ class Config:
         self.profile = profile or os.getenv("HOUDINI_SWAP_PROFILE", "prod")
         self.config_file = config_file
         self._config: Dict[str, Any] = {}
+        self._config_view: Mapping[str, Any] = MappingProxyType(self._config)
         self._load_config()
     
     def _load_config(self) -> None:
-        """Load configuration from file and environment variables."""
+        """Load configuration from defaults, config file, and environment variables."""
         # Start with defaults
-        self._config = {
-            "base_url": os.getenv("HOUDINI_SWAP_API_URL", "https://api-partner.houdiniswap.com"),
-            "timeout": int(os.getenv("HOUDINI_SWAP_TIMEOUT", "30")),
-            "api_version": os.getenv("HOUDINI_SWAP_API_VERSION", "v1"),
-            "verify_ssl": os.getenv("HOUDINI_SWAP_VERIFY_SSL", "true").lower() == "true",
-            "max_retries": int(os.getenv("HOUDINI_SWAP_MAX_RETRIES", "3")),
-            "retry_backoff_factor": float(os.getenv("HOUDINI_SWAP_RETRY_BACKOFF_FACTOR", "1.0")),
-            "cache_enabled": os.getenv("HOUDINI_SWAP_CACHE_ENABLED", "false").lower() == "true",
-            "cache_ttl": int(os.getenv("HOUDINI_SWAP_CACHE_TTL", "300")),
-        }
+        self._config = dict(_DEFAULTS)
         
         # Load from config file if specified or found
         config_data = self._load_from_file()
@@ -62,79 +181,73 @@ class Config:
             if "global" in config_data:
                 self._config.update(config_data["global"])
         
-        # Environment variables override everything
-        self._apply_env_overrides()
+        # Environment variables override everything (one lookup per variable)
+        env = os.environ
+        for env_var, key, converter in _ENV_OVERRIDES:
+            value = env.get(env_var)
+            if value is not None:
+                self._config[key] = converter(value)
+        
+        # Read-only view handed out by get_all() without copying; rebuilt
+        # here because a reload rebinds self._config
+        self._config_view = MappingProxyType(self._config)
     
     def _load_from_file(self) -> Optional[Dict[str, Any]]:
-        """Load configuration from file."""
+        """
+        Load configuration from file.
+        
+        Each candidate costs a single stat() call. Parsed files are cached by
+        path, modification time, size and inode, so constructing many Config
+        instances parses an unchanged file only once.
+        """
         config_paths = [self.config_file] if self.config_file else self.DEFAULT_CONFIG_PATHS
         
         for path_str in config_paths:
             if not path_str:
                 continue
+            try:
+                st = os.stat(path_str)
+            except OSError:
+                continue
+            if not stat.S_ISREG(st.st_mode):
+                continue
+            
+            cache_key = os.path.abspath(path_str)
+            signature = (st.st_mtime_ns, st.st_size, st.st_ino)
+            cached = self._file_cache.get(cache_key)
+            if cached is not None and cached[0] == signature:
+                return cached[1]
+            
             path = Path(path_str)
-            if path.exists() and path.is_file():
-                try:
-                    if path.suffix in [".json"]:
-                        with open(path, "r", encoding="utf-8") as f:
-                            return json.load(f)
-                    elif path.suffix in [".yaml", ".yml"]:
-                        try:
-                            import yaml
-                            with open(path, "r", encoding="utf-8") as f:
-                                return yaml.safe_load(f)
-                        except ImportError:
-                            # YAML not available, skip
-                            continue
-                    elif path.suffix == ".toml":
-                        try:
-                            import tomllib  # Python 3.11+
-                        except ImportError:
-                            try:
-                                import tomli  # Python < 3.11
-                            except ImportError:
-                                # TOML not available, skip
-                                continue
-                        with open(path, "rb") as f:
-                            if "tomllib" in globals():
-                                return tomllib.load(f)
-                            else:
-                                return tomli.load(f)
-                except Exception:
-                    # Skip invalid config files
-                    continue
+            loader = _loader_for(path.suffix)
+            if loader is None:
+                # Unsupported format or parser library not installed
+                continue
+            try:
+                data = loader(path)
+            except Exception:
+                # Skip invalid config files
+                continue
+            
+            self._file_cache[cache_key] = (signature, data)
+            return data
         
         return None
     
-    def _apply_env_overrides(self) -> None:
-        """Apply environment variable overrides."""
-        env_mappings = {
-            "HOUDINI_SWAP_API_URL": "base_url",
-            "HOUDINI_SWAP_TIMEOUT": ("timeout", int),
-            "HOUDINI_SWAP_API_VERSION": "api_version",
-            "HOUDINI_SWAP_VERIFY_SSL": ("verify_ssl", lambda x: x.lower() == "true"),
-            "HOUDINI_SWAP_MAX_RETRIES": ("max_retries", int),
-            "HOUDINI_SWAP_RETRY_BACKOFF_FACTOR": ("retry_backoff_factor", float),
-            "HOUDINI_SWAP_CACHE_ENABLED": ("cache_enabled", lambda x: x.lower() == "true"),
-            "HOUDINI_SWAP_CACHE_TTL": ("cache_ttl", int),
-        }
-        
-        for env_var, config_key in env_mappings.items():
-            value = os.getenv(env_var)
-            if value is not None:
-                if isinstance(config_key, tuple):
-                    key, converter = config_key
-                    self._config[key] = converter(value)
-                else:
-                    self._config[config_key] = value
-    
     def get(self, key: str, default: Any = None) -> Any:
         """Get configuration value."""
         return self._config.get(key, default)
     
-    def get_all(self) -> Dict[str, Any]:
-        """Get all configuration values."""
-        return self._config.copy()
+    def get_all(self) -> Mapping[str, Any]:
+        """
+        Get all configuration values.
+        
+        Returns:
+            Read-only mapping of all settings (no copy is made). Earlier
+            versions returned a fresh dict; use dict(config.get_all()) for a
+            mutable copy or before passing the result to json.dumps().
+        """
+        return self._config_view
     
     @classmethod
     def load(cls, profile: Optional[str] = None, config_file: Optional[str] = None) -> "Config":
@@ -19,6 +19,19 @@ DEFAULT_PAGE_SIZE = 100
 DEFAULT_MAX_RETRIES = 3
 DEFAULT_RETRY_BACKOFF_FACTOR = 1.0
 DEFAULT_CACHE_TTL = 300  # 5 minutes in seconds
+DEFAULT_CACHE_MAXSIZE = 256  # Maximum cached token responses per client
+DEFAULT_MIN_MAX_CACHE_TTL = 30  # seconds; exchange limits track liquidity
+DEFAULT_VOLUME_CACHE_TTL = 60  # seconds; running volume total
+DEFAULT_WEEKLY_VOLUME_CACHE_TTL = 300  # seconds; weekly aggregates
+DEFAULT_QUOTE_CACHE_TTL = 10  # Quotes are only reused for a few seconds
+DEFAULT_QUOTE_CACHE_MAXSIZE = 64  # Maximum cached quote responses per client
+DEFAULT_MAX_POLL_INTERVAL = 30  # seconds; cap for exponential status polling backoff
+DEFAULT_POOL_CONNECTIONS = 10  # Connection pools (hosts) kept by the session adapter
+DEFAULT_POOL_MAXSIZE = 20  # Keep-alive connections per host
+REQUEST_COMPRESSION_MIN_SIZE = 1024  # bytes; smaller request bodies are sent uncompressed
+MAX_CREDENTIAL_LENGTH = 1000  # HTTP headers typically have an 8KB limit; be conservative
+DEFAULT_BREAKER_THRESHOLD = 5  # Consecutive failures before an endpoint's circuit opens
+DEFAULT_BREAKER_COOLDOWN = 30  # seconds an open circuit fails fast before a trial request
 
 # Base URL Configuration
 BASE_URL_PRODUCTION = "https://api-partner.houdiniswap.com"
@@ -43,6 +56,7 @@ ERROR_INVALID_CREDENTIALS = "API key and secret are required"
 ERROR_AUTHENTICATION_FAILED = "Invalid API key or secret"
 ERROR_NETWORK = "Network error: {}"
 ERROR_UNEXPECTED = "Unexpected error: {}"
+ERROR_CIRCUIT_OPEN = "Circuit open for {} after {} consecutive failures; retry in {:.0f}s"
 
 # API Versioning
 API_VERSION_DEFAULT = "v1"
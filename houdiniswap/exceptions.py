@@ -1,5 +1,7 @@
 """Custom exceptions for the Houdini Swap SDK."""
 
+from typing import Optional
+
 
 class HoudiniSwapError(Exception):
     """Base exception for all Houdini Swap SDK errors."""
@@ -29,3 +31,12 @@ class NetworkError(HoudiniSwapError):
     """Raised when a network error occurs."""
     pass
 
+
+class CircuitOpenError(NetworkError):
+    """Raised without sending a request while an endpoint's circuit breaker is open."""
+    
+    def __init__(self, message: str, endpoint: Optional[str] = None, retry_after: Optional[float] = None):
+        super().__init__(message)
+        self.endpoint = endpoint
+        self.retry_after = retry_after
+
@@ -1,11 +1,14 @@
 """Data models for Houdini Swap API responses."""
 
-from typing import Optional, List, Dict, Any, Union
+from typing import Optional, List, Dict, Any, Union, Callable, Iterator, Sequence, TypeVar, overload
 from dataclasses import dataclass
 from enum import IntEnum
 from decimal import Decimal
+from operator import itemgetter
 import hashlib
 import json
+import sys
+import threading
 
 from .exceptions import ValidationError
 
@@ -13,6 +16,11 @@ from .exceptions import ValidationError
 _network_cache: Dict[str, "Network"] = {}
 _token_cache: Dict[str, "Token"] = {}
 
+T = TypeVar("T")
+
+# Slotted dataclasses (no per-instance __dict__) where supported (Python 3.10+)
+_SLOTS: Dict[str, Any] = {"slots": True} if sys.version_info >= (3, 10) else {}
+
 
 class TransactionStatus(IntEnum):
     """Transaction status codes."""
@@ -28,7 +36,11 @@ class TransactionStatus(IntEnum):
     DELETED = 8
 
 
-@dataclass(frozen=True)
+# Status code -> member, avoiding EnumMeta.__call__ on every status decode
+_STATUS_BY_CODE: Dict[int, TransactionStatus] = {s.value: s for s in TransactionStatus}
+
+
+@dataclass(frozen=True, **_SLOTS)
 class Network:
     """Network/blockchain information."""
     name: str
@@ -83,7 +95,7 @@ class Network:
         return f"Network(name='{self.name}', short_name='{self.short_name}')"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, **_SLOTS)
 class Token:
     """Token information."""
     id: str
@@ -163,7 +175,14 @@ class Token:
         return f"Token(symbol='{self.symbol}', name='{self.name}', id='{self.id}')"
 
 
-@dataclass(frozen=True)
+# API keys of a DEXToken row, in DEXToken field order
+_DEX_TOKEN_FIELDS = itemgetter(
+    "id", "address", "chain", "decimals", "symbol", "name",
+    "created", "modified", "enabled", "hasDex",
+)
+
+
+@dataclass(frozen=True, **_SLOTS)
 class DEXToken:
     """DEX token information."""
     id: str
@@ -180,6 +199,11 @@ class DEXToken:
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "DEXToken":
         """Create DEXToken from API response."""
+        try:
+            # Complete rows (the common case): one C-level extraction, in field order
+            return cls(*_DEX_TOKEN_FIELDS(data))
+        except KeyError:
+            pass
         return cls(
             id=data.get("id", ""),
             address=data.get("address", ""),
@@ -197,7 +221,7 @@ class DEXToken:
         return f"DEXToken(symbol='{self.symbol}', name='{self.name}', chain='{self.chain}')"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, **_SLOTS)
 class RouteDTO:
     """Route DTO for DEX transactions."""
     # Route structure is complex and may vary, so we store the raw dict
@@ -219,7 +243,7 @@ class RouteDTO:
         return self.raw
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, **_SLOTS)
 class Quote:
     """Quote information."""
     amount_in: Decimal
@@ -260,7 +284,7 @@ class Quote:
         return f"Quote(amount_in={self.amount_in}, amount_out={self.amount_out})"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, **_SLOTS)
 class DEXQuote:
     """DEX quote information."""
     swap: str
@@ -298,7 +322,7 @@ class DEXQuote:
         return f"DEXQuote(quote_id='{self.quote_id}', amount_out={self.amount_out}, swap='{self.swap}')"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, **_SLOTS)
 class ExchangeResponse:
     """Exchange transaction response."""
     houdini_id: str
@@ -381,7 +405,7 @@ class ExchangeResponse:
         return f"ExchangeResponse(houdini_id='{self.houdini_id}', status={self.status}, in_amount={self.in_amount})"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, **_SLOTS)
 class DexApproveResponse:
     """DEX approve transaction response."""
     data: str
@@ -412,7 +436,7 @@ class DexApproveResponse:
         return f"DexApproveResponse(to='{self.to}', from_address='{self.from_address}')"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, **_SLOTS)
 class Status:
     """Transaction status information."""
     houdini_id: str
@@ -442,8 +466,8 @@ class Status:
         
         status_code = data.get("status", 0)
         try:
-            status_enum = TransactionStatus(status_code)
-        except ValueError:
+            status_enum = _STATUS_BY_CODE[status_code]
+        except (KeyError, TypeError):
             raise ValidationError(f"Invalid transaction status code: {status_code}")
         
         return cls(
@@ -465,7 +489,7 @@ class Status:
         return f"Status(houdini_id='{self.houdini_id}', status={self.status.name})"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, **_SLOTS)
 class MinMax:
     """Min-Max exchange amounts."""
     min: Decimal
@@ -474,18 +498,20 @@ class MinMax:
     @classmethod
     def from_list(cls, data: List[Union[float, str, Decimal, int]]) -> "MinMax":
         """Create MinMax from API response array."""
-        if len(data) < 2:
-            raise ValueError("MinMax requires at least 2 elements")
+        try:
+            min_value, max_value, *_ = data
+        except ValueError:
+            raise ValueError("MinMax requires at least 2 elements") from None
         return cls(
-            min=Decimal(str(data[0])),
-            max=Decimal(str(data[1]))
+            min=Decimal(str(min_value)),
+            max=Decimal(str(max_value))
         )
     
     def __repr__(self) -> str:
         return f"MinMax(min={self.min}, max={self.max})"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, **_SLOTS)
 class Volume:
     """Volume information."""
     count: int
@@ -503,9 +529,99 @@ class Volume:
         return f"Volume(count={self.count}, total_transacted_usd={self.total_transacted_usd})"
 
 
-@dataclass(frozen=True)
+class LazyModelList(Sequence[T]):
+    """
+    Read-only list of models built from raw API dicts on first access.
+    
+    Each element is constructed by factory the first time it is indexed or
+    iterated and then memoized, so callers that only read len() or a few
+    elements skip building the rest. Iterating everything costs the same as
+    an eager list. The raw dicts are released once every model is built.
+    
+    Compares equal to lists and other LazyModelLists with the same models,
+    and concatenates with lists (``+``) to a plain list. Safe to share
+    between threads (e.g. when served from the client cache): each model is
+    built exactly once. Pickling or copying builds every model first; the
+    copy is a fully built LazyModelList with its own lock.
+    """
+    
+    __slots__ = ('_raw', '_factory', '_items', '_pending', '_lock')
+    
+    def __init__(self, raw: List[Dict[str, Any]], factory: Callable[[Dict[str, Any]], T]) -> None:
+        self._raw: Optional[List[Dict[str, Any]]] = raw
+        self._factory: Optional[Callable[[Dict[str, Any]], T]] = factory
+        self._items: List[Optional[T]] = [None] * len(raw)
+        self._pending = len(raw)  # models not built yet
+        self._lock = threading.Lock()
+    
+    def __len__(self) -> int:
+        return len(self._items)
+    
+    @overload
+    def __getitem__(self, index: int) -> T: ...
+    
+    @overload
+    def __getitem__(self, index: slice) -> List[T]: ...
+    
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self._items)))]
+        item = self._items[index]
+        if item is None:
+            # Only the first access to an element takes the lock
+            with self._lock:
+                item = self._items[index]
+                if item is None:
+                    item = self._items[index] = self._factory(self._raw[index])
+                    self._pending -= 1
+                    if not self._pending:
+                        self._raw = None
+        return item
+    
+    def __iter__(self) -> Iterator[T]:
+        for index in range(len(self._items)):
+            yield self[index]
+    
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, (LazyModelList, list)):
+            return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+        return NotImplemented
+    
+    __hash__ = None  # type: ignore[assignment]
+    
+    def __add__(self, other: object) -> List[T]:
+        if isinstance(other, (LazyModelList, list)):
+            return list(self) + list(other)
+        return NotImplemented
+    
+    def __radd__(self, other: object) -> List[T]:
+        if isinstance(other, list):
+            return other + list(self)
+        return NotImplemented
+    
+    def __getstate__(self) -> List[T]:
+        # Locks cannot be pickled or copied: materialize and rebuild on restore
+        return list(self)
+    
+    def __setstate__(self, state: List[T]) -> None:
+        self._raw = None
+        self._factory = None
+        self._items = list(state)
+        self._pending = 0
+        self._lock = threading.Lock()
+    
+    def __repr__(self) -> str:
+        return repr(list(self))
+
+
+@dataclass(frozen=True, **_SLOTS)
 class DEXTokensResponse:
-    """Response from get_dex_tokens() containing paginated token list."""
+    """
+    Response from get_dex_tokens() containing paginated token list.
+    
+    tokens is a list of DEXToken objects, or a read-only LazyModelList
+    when requested with get_dex_tokens(lazy=True).
+    """
     count: int
     tokens: List[DEXToken]
     
@@ -513,7 +629,7 @@ class DEXTokensResponse:
         return f"DEXTokensResponse(count={self.count}, tokens={len(self.tokens)})"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, **_SLOTS)
 class WeeklyVolume:
     """Weekly volume information."""
     count: int
@@ -31,8 +31,15 @@ setup(
     python_requires=">=3.8",
     install_requires=[
         "requests>=2.31.0",
+        "urllib3>=1.26.0",
     ],
     extras_require={
+        "fast": [
+            "orjson>=3.8.0",
+        ],
+        "brotli": [
+            "brotli>=1.0.9",
+        ],
         "dev": [
             "pytest>=7.0.0",
             "pytest-cov>=4.0.0",
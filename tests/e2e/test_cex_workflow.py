@@ -150,6 +150,7 @@ class TestCexErrorScenarios:
         mock_response = MagicMock()
         mock_response.status_code = 400
         mock_response.json.return_value = {"message": "Invalid token"}
+        mock_response.content = b'{"message": "Invalid token"}'
         
         with patch.object(client.session, 'request', return_value=mock_response):
             with pytest.raises(Exception):  # APIError
@@ -165,6 +166,7 @@ class TestCexErrorScenarios:
         mock_response = MagicMock()
         mock_response.status_code = 400
         mock_response.json.return_value = {"message": "Amount below minimum"}
+        mock_response.content = b'{"message": "Amount below minimum"}'
         
         with patch.object(client.session, 'request', return_value=mock_response):
             with pytest.raises(Exception):  # APIError
@@ -138,7 +138,7 @@ class TestDexExchangeWorkflow:
         with patch('houdiniswap.client.HoudiniSwapClient._request', side_effect=[
             [sample_dex_quote_data],  # get_dex_quote
             sample_exchange_response_data,  # post_dex_exchange
-            True,  # post_dex_confirm_tx
+            b"true",  # post_dex_confirm_tx
         ]):
             # Get quote
             quotes = client.get_dex_quote("1.0", "token1", "token2")
@@ -188,6 +188,7 @@ class TestDexErrorScenarios:
         mock_response = MagicMock()
         mock_response.status_code = 400
         mock_response.json.return_value = {"message": "Quote expired"}
+        mock_response.content = b'{"message": "Quote expired"}'
         
         with patch.object(client.session, 'request', return_value=mock_response):
             with pytest.raises(Exception):  # APIError
@@ -212,6 +213,7 @@ class TestDexErrorScenarios:
         mock_response = MagicMock()
         mock_response.status_code = 400
         mock_response.json.return_value = {"message": "Route mismatch"}
+        mock_response.content = b'{"message": "Route mismatch"}'
         
         with patch.object(client.session, 'request', return_value=mock_response):
             with pytest.raises(Exception):  # APIError
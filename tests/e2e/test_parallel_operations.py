@@ -65,6 +65,7 @@ class TestParallelOperations:
         mock_error = MagicMock()
         mock_error.status_code = 400
         mock_error.json.return_value = {"message": "Error"}
+        mock_error.content = b'{"message": "Error"}'
         
         with patch('houdiniswap.client.HoudiniSwapClient._request', side_effect=[
             [sample_token_data],  # Success
@@ -128,7 +129,7 @@ class TestIterationAndPagination:
             tokens=[DEXToken.from_dict(sample_dex_token_data)]
         )
         
-        with patch('houdiniswap.client.HoudiniSwapClient.iter_dex_tokens', return_value=iter([DEXToken.from_dict(sample_dex_token_data)])):
+        with patch('houdiniswap.client.HoudiniSwapClient.get_dex_tokens', return_value=response):
             tokens = client.get_all_dex_tokens()
             assert len(tokens) == 1
             assert tokens[0].symbol == "USDC"
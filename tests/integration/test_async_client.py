@@ -0,0 +1,158 @@
+"""Integration tests for AsyncHoudiniSwapClient."""
+
+import asyncio
+import pytest
+from unittest.mock import patch
+
+from houdiniswap import AsyncHoudiniSwapClient, HoudiniSwapClient
+from houdiniswap.exceptions import APIError
+from houdiniswap.models import DEXToken, DEXTokensResponse, Status, TransactionStatus
+
+
+@pytest.fixture
+def async_client(api_key, api_secret):
+    """Create an AsyncHoudiniSwapClient instance for testing."""
+    client = AsyncHoudiniSwapClient(
+        api_key=api_key,
+        api_secret=api_secret,
+        base_url="https://test-api.houdiniswap.com",
+        timeout=5,
+        max_retries=1,
+    )
+    yield client
+    client.close()
+
+
+class TestAsyncClient:
+    """Tests for the asyncio client wrapper."""
+    
+    def test_wraps_sync_client(self, async_client):
+        """Test that the async client wraps a configured sync client."""
+        assert isinstance(async_client.sync_client, HoudiniSwapClient)
+        assert async_client.sync_client.base_url == "https://test-api.houdiniswap.com"
+        assert "api_key" not in repr(async_client).lower()
+    
+    def test_api_method_is_coroutine(self, async_client, sample_status_data):
+        """Test that API methods are awaitable and return parsed models."""
+        with patch('houdiniswap.client.HoudiniSwapClient._request', return_value=sample_status_data):
+            status = asyncio.run(async_client.get_status("test_houdini_id_123"))
+        assert isinstance(status, Status)
+        assert asyncio.iscoroutinefunction(AsyncHoudiniSwapClient.get_status)
+    
+    def test_gather_requests_keeps_order_and_errors(self, async_client, sample_status_data):
+        """Test gathering concurrent calls with an error in the middle."""
+        def fake_request(method, endpoint, params=None, json_data=None):
+            if params["id"] == "bad_houdini_id_000":
+                raise APIError("boom", status_code=500)
+            return {**sample_status_data, "houdiniId": params["id"]}
+        
+        async def run():
+            return await async_client.gather_requests(
+                async_client.get_status(houdini_id)
+                for houdini_id in ("first_houdini_id_1", "bad_houdini_id_000", "third_houdini_id_3")
+            )
+        
+        with patch('houdiniswap.client.HoudiniSwapClient._request', side_effect=fake_request):
+            results = asyncio.run(run())
+        
+        assert results[0].houdini_id == "first_houdini_id_1"
+        assert isinstance(results[1], APIError)
+        assert results[2].houdini_id == "third_houdini_id_3"
+    
+    def test_iter_dex_tokens(self, async_client, sample_dex_token_data):
+        """Test async iteration across pages."""
+        pages = [
+            DEXTokensResponse(count=3, tokens=[DEXToken.from_dict(sample_dex_token_data)] * 2),
+            DEXTokensResponse(count=3, tokens=[DEXToken.from_dict(sample_dex_token_data)]),
+        ]
+        
+        async def collect():
+            return [token async for token in async_client.iter_dex_tokens(page_size=2)]
+        
+        with patch('houdiniswap.client.HoudiniSwapClient.get_dex_tokens', side_effect=pages):
+            tokens = asyncio.run(collect())
+        assert len(tokens) == 3
+    
+    def test_iter_dex_tokens_prefetch(self, async_client, sample_dex_token_data):
+        """Test async iteration with several pages prefetched."""
+        pages = [DEXTokensResponse(count=5, tokens=[DEXToken.from_dict(sample_dex_token_data)] * 2)] * 2 + [
+            DEXTokensResponse(count=5, tokens=[DEXToken.from_dict(sample_dex_token_data)]),
+        ]
+        
+        async def collect():
+            return [token async for token in async_client.iter_dex_tokens(page_size=2, prefetch=2)]
+        
+        with patch('houdiniswap.client.HoudiniSwapClient.get_dex_tokens', side_effect=pages) as mock_get:
+            tokens = asyncio.run(collect())
+        assert len(tokens) == 5
+        assert sorted(c[1]["page"] for c in mock_get.call_args_list) == [1, 2, 3]
+    
+    def test_poll_until_finished_uses_asyncio_sleep(self, async_client):
+        """Test that polling waits on the event loop with backoff."""
+        waiting = Status.from_dict({"houdiniId": "test123", "status": TransactionStatus.WAITING.value})
+        finished = Status.from_dict({"houdiniId": "test123", "status": TransactionStatus.FINISHED.value})
+        
+        async def fake_sleep(delay):
+            pass
+        
+        with patch('houdiniswap.client.HoudiniSwapClient.get_status', side_effect=[waiting, waiting, finished]), \
+             patch('houdiniswap.async_client.asyncio.sleep', side_effect=fake_sleep) as mock_sleep:
+            result = asyncio.run(async_client.poll_until_finished("test123", poll_interval=1))
+        
+        assert result.status == TransactionStatus.FINISHED
+        assert [c[0][0] for c in mock_sleep.call_args_list] == [1, 2]
+    
+    def test_poll_until_finished_sleep_capped_by_deadline(self, async_client):
+        """Test that async polling never sleeps past the timeout."""
+        from unittest.mock import MagicMock
+        waiting = Status.from_dict({"houdiniId": "test123", "status": TransactionStatus.WAITING.value})
+        clock = MagicMock()
+        clock.monotonic.side_effect = [0, 2, 7, 10.5]
+        
+        async def fake_sleep(delay):
+            pass
+        
+        with patch('houdiniswap.client.HoudiniSwapClient.get_status', return_value=waiting), \
+             patch('houdiniswap.async_client.time', clock), \
+             patch('houdiniswap.async_client.asyncio.sleep', side_effect=fake_sleep) as mock_sleep:
+            with pytest.raises(TimeoutError):
+                asyncio.run(async_client.poll_until_finished("test123", timeout=10, poll_interval=5))
+        
+        assert [c[0][0] for c in mock_sleep.call_args_list] == [5, 3]
+    
+    def test_async_context_manager_closes(self, api_key, api_secret):
+        """Test that leaving the async context closes the session."""
+        async def run():
+            async with AsyncHoudiniSwapClient(api_key, api_secret) as client:
+                pass
+            return client
+        
+        client = asyncio.run(run())
+        assert client.sync_client.session.closed
+    
+    def test_aclose_does_not_block_event_loop(self, api_key, api_secret):
+        """Test that aclose waits for in-flight calls without stalling the loop."""
+        import time
+        
+        async def run():
+            client = AsyncHoudiniSwapClient(api_key, api_secret)
+            ticks = []
+            
+            async def ticker():
+                for _ in range(5):
+                    ticks.append(time.monotonic())
+                    await asyncio.sleep(0.01)
+            
+            slow_call = asyncio.ensure_future(client._run(time.sleep, 0.2))
+            await asyncio.sleep(0)
+            ticker_task = asyncio.ensure_future(ticker())
+            await client.aclose()
+            closed_at = time.monotonic()
+            await ticker_task
+            await slow_call
+            return client, ticks, closed_at
+        
+        client, ticks, closed_at = asyncio.run(run())
+        assert client.sync_client.session.closed
+        # The ticker kept running while aclose waited for the slow call
+        assert sum(tick < closed_at for tick in ticks) >= 2
@@ -6,7 +6,7 @@ from decimal import Decimal
 
 from houdiniswap import HoudiniSwapClient
 from houdiniswap.exceptions import APIError, AuthenticationError, NetworkError, ValidationError
-from houdiniswap.models import TransactionStatus
+from houdiniswap.models import DEXToken, LazyModelList, TransactionStatus
 
 
 class TestGetCexTokens:
@@ -43,6 +43,17 @@ class TestGetCexTokens:
             with pytest.raises(APIError, match="Unexpected response type"):
                 client.get_cex_tokens()
     
+    def test_iter_cex_tokens_lazy(self, client, sample_token_data):
+        """Test that _iter_cex_tokens builds Token objects on demand."""
+        from houdiniswap.models import Token
+        with patch('houdiniswap.client.HoudiniSwapClient._request', return_value=[sample_token_data] * 3), \
+             patch.object(Token, 'from_dict', wraps=Token.from_dict) as mock_from_dict:
+            tokens = client._iter_cex_tokens()
+            assert mock_from_dict.call_count == 0
+            first = next(tokens)
+            assert first.symbol == sample_token_data["symbol"]
+            assert mock_from_dict.call_count == 1
+    
     def test_get_cex_tokens_with_caching(self, client, sample_token_data):
         """Test get_cex_tokens with caching enabled."""
         client.cache_enabled = True
@@ -114,6 +125,23 @@ class TestGetDexTokens:
             assert result.count == 0
             assert len(result.tokens) == 0
     
+    def test_get_dex_tokens_eager_by_default(self, client, sample_dex_tokens_response_data):
+        """Test that tokens are a plain list of parsed models unless lazy is requested."""
+        with patch('houdiniswap.client.HoudiniSwapClient._request', return_value=sample_dex_tokens_response_data):
+            result = client.get_dex_tokens()
+        assert type(result.tokens) is list
+        assert isinstance(result.tokens[0], DEXToken)
+    
+    def test_get_dex_tokens_lazy(self, client, sample_dex_tokens_response_data):
+        """Test that lazy=True returns a LazyModelList cached separately from the eager page."""
+        client.cache_enabled = True
+        with patch('houdiniswap.client.HoudiniSwapClient._request', return_value=sample_dex_tokens_response_data):
+            eager = client.get_dex_tokens()
+            lazy = client.get_dex_tokens(lazy=True)
+            assert client._request.call_count == 2
+        assert isinstance(lazy.tokens, LazyModelList)
+        assert lazy.tokens == eager.tokens
+    
     def test_get_dex_tokens_invalid_page(self, client):
         """Test get_dex_tokens with invalid page number."""
         with pytest.raises(ValidationError, match="must be >= 1"):
@@ -127,6 +155,27 @@ class TestGetDexTokens:
             assert mock_request.call_count == 1
             client.get_dex_tokens(page=1, chain="base")  # Same params
             assert mock_request.call_count == 1  # Cached
+            client.get_dex_tokens(page=2, chain="base")  # Different page
+            assert mock_request.call_count == 2
+            assert client._token_cache.get(("dex_tokens", 1, 100, "base")) is not None
+    
+    def test_get_dex_tokens_concurrent_misses_share_request(self, client, sample_dex_tokens_response_data):
+        """Test that concurrent cold-cache calls issue a single request."""
+        import threading
+        import time
+        client.cache_enabled = True
+        
+        def slow_request(*args, **kwargs):
+            time.sleep(0.05)
+            return sample_dex_tokens_response_data
+        
+        with patch('houdiniswap.client.HoudiniSwapClient._request', side_effect=slow_request) as mock_request:
+            threads = [threading.Thread(target=client.get_dex_tokens, kwargs={"chain": "base"}) for _ in range(5)]
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
+            assert mock_request.call_count == 1
 
 
 class TestGetCexQuote:
@@ -176,6 +225,36 @@ class TestGetCexQuote:
             )
             call_args = client._request.call_args
             assert call_args[1]["params"]["anonymous"] is True
+    
+    def test_get_cex_quote_cache_disabled_by_default(self, client, sample_quote_data):
+        """Test that identical quotes are re-requested unless the quote cache is enabled."""
+        with patch('houdiniswap.client.HoudiniSwapClient._request', return_value=sample_quote_data):
+            client.get_cex_quote("1.0", "ETH", "BNB")
+            client.get_cex_quote("1.0", "ETH", "BNB")
+            assert client._request.call_count == 2
+    
+    def test_get_cex_quote_cached(self, client, sample_quote_data):
+        """Test that identical quotes are served from the quote cache."""
+        client.quote_cache_enabled = True
+        with patch('houdiniswap.client.HoudiniSwapClient._request', return_value=sample_quote_data):
+            first = client.get_cex_quote("1.0", "ETH", "BNB")
+            assert client.get_cex_quote("1.0", "ETH", "BNB") is first
+            assert client._request.call_count == 1
+            client.get_cex_quote("1.0", "ETH", "BNB", anonymous=True)
+            assert client._request.call_count == 2
+            client.clear_cache()
+            client.get_cex_quote("1.0", "ETH", "BNB")
+            assert client._request.call_count == 3
+    
+    def test_get_cex_quote_cache_expires(self, client, sample_quote_data):
+        """Test that cached quotes expire after quote_cache_ttl."""
+        client.quote_cache_enabled = True
+        with patch('houdiniswap.client.HoudiniSwapClient._request', return_value=sample_quote_data), \
+             patch('houdiniswap.cache.time.monotonic', return_value=100.0) as mock_clock:
+            client.get_cex_quote("1.0", "ETH", "BNB")
+            mock_clock.return_value = 100.0 + client.quote_cache_ttl
+            client.get_cex_quote("1.0", "ETH", "BNB")
+            assert client._request.call_count == 2
 
 
 class TestGetDexQuote:
@@ -235,6 +314,16 @@ class TestGetDexQuote:
             quotes = client.get_dex_quote(1.5, "token1", "token2")
             call_args = client._request.call_args
             assert isinstance(call_args[1]["params"]["amount"], str)
+    
+    def test_get_dex_quote_cached_by_normalized_amount(self, client, sample_dex_quote_data):
+        """Test that equivalent amounts share one cached DEX quote."""
+        client.quote_cache_enabled = True
+        with patch('houdiniswap.client.HoudiniSwapClient._request', return_value=[sample_dex_quote_data]):
+            first = client.get_dex_quote("1.5", "token1", "token2")
+            assert client.get_dex_quote(Decimal("1.5"), "token1", "token2") is first
+            assert client._request.call_count == 1
+            client.get_dex_quote("1.5", "token2", "token1")
+            assert client._request.call_count == 2
 
 
 class TestPostCexExchange:
@@ -261,6 +350,19 @@ class TestPostCexExchange:
             assert json_data["addressTo"] == "0x1234567890123456789012345678901234567890"
             assert json_data["anonymous"] is False
     
+    @pytest.mark.parametrize("amount", ["NaN", "sNaN", "Infinity"])
+    def test_post_cex_exchange_non_finite_amount(self, client, amount):
+        """Test that non-finite amounts are rejected before any request is sent."""
+        with patch('houdiniswap.client.HoudiniSwapClient._request') as mock_request:
+            with pytest.raises(ValidationError, match="amount must be a valid number"):
+                client.post_cex_exchange(
+                    amount=amount,
+                    from_token="ETH",
+                    to_token="BNB",
+                    address_to="0x1234567890123456789012345678901234567890"
+                )
+        mock_request.assert_not_called()
+    
     def test_post_cex_exchange_with_optional_params(self, client, sample_exchange_response_data):
         """Test post_cex_exchange with optional parameters."""
         with patch('houdiniswap.client.HoudiniSwapClient._request', return_value=sample_exchange_response_data):
@@ -407,7 +509,7 @@ class TestPostDexConfirmTx:
     
     def test_post_dex_confirm_tx_success(self, client):
         """Test successful post_dex_confirm_tx call."""
-        with patch('houdiniswap.client.HoudiniSwapClient._request', return_value=True):
+        with patch('houdiniswap.client.HoudiniSwapClient._request', return_value=b"true"):
             result = client.post_dex_confirm_tx(
                 transaction_id="tx123",
                 tx_hash="0xabcdef1234567890"
@@ -420,6 +522,40 @@ class TestPostDexConfirmTx:
             json_data = call_args[1]["json_data"]
             assert json_data["id"] == "tx123"
             assert json_data["txHash"] == "0xabcdef1234567890"
+            assert call_args[1]["raw"] is True
+    
+    @pytest.mark.parametrize("body,expected", [
+        (b"true", True),
+        (b"TRUE\n", True),
+        (b'"true"', True),
+        (b"false", False),
+        (b'"false"', False),
+        (b"", False),
+        (b"not json", False),
+        (b'{"success": true}', True),
+        (b'{"response": "TRUE"}', True),
+        (b"{}", False),
+        (b"1", True),
+    ])
+    def test_post_dex_confirm_tx_body(self, client, body, expected):
+        """Test that bare true bodies match directly and JSON bodies count by truthiness."""
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.content = body
+        
+        with patch.object(client.session, 'request', return_value=mock_response):
+            assert client.post_dex_confirm_tx("tx123", "0xabcdef1234567890") is expected
+        mock_response.json.assert_not_called()
+    
+    def test_post_dex_confirm_tx_json_object_without_orjson(self, client):
+        """Test that JSON success objects are confirmed with the stdlib decoder too."""
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.content = b'{"success": true}'
+        
+        with patch('houdiniswap.client.orjson', None), \
+             patch.object(client.session, 'request', return_value=mock_response):
+            assert client.post_dex_confirm_tx("tx123", "0xabcdef1234567890") is True
     
     def test_post_dex_confirm_tx_invalid_hash(self, client):
         """Test post_dex_confirm_tx with invalid hash."""
@@ -486,6 +622,19 @@ class TestGetMinMax:
             )
             call_args = client._request.call_args
             assert call_args[1]["params"]["cexOnly"] is True
+    
+    def test_get_min_max_cached(self, client, sample_min_max_data):
+        """Test that min/max limits are cached per pair with a short TTL."""
+        client.cache_enabled = True
+        with patch('houdiniswap.client.HoudiniSwapClient._request', return_value=sample_min_max_data), \
+             patch('houdiniswap.cache.time.monotonic', return_value=100.0) as mock_clock:
+            first = client.get_min_max("ETH", "BNB")
+            assert client.get_min_max("ETH", "BNB") is first
+            client.get_min_max("BNB", "ETH")
+            assert client._request.call_count == 2
+            mock_clock.return_value = 130.0  # DEFAULT_MIN_MAX_CACHE_TTL elapsed
+            client.get_min_max("ETH", "BNB")
+            assert client._request.call_count == 3
 
 
 class TestGetVolume:
@@ -505,6 +654,22 @@ class TestGetVolume:
             volume = client.get_volume()
             assert volume.count == 1000
     
+    def test_get_volume_cached(self, client, sample_volume_data, sample_weekly_volume_data):
+        """Test that volume endpoints are cached and can be invalidated per group."""
+        client.cache_enabled = True
+        with patch('houdiniswap.client.HoudiniSwapClient._request', return_value=sample_volume_data):
+            client.get_volume()
+            client.get_volume()
+            assert client._request.call_count == 1
+        with patch('houdiniswap.client.HoudiniSwapClient._request', return_value=[sample_weekly_volume_data]):
+            client.get_weekly_volume()
+            client.clear_cache("volume")
+            client.get_weekly_volume()
+            assert client._request.call_count == 1  # Weekly volume still cached
+        with patch('houdiniswap.client.HoudiniSwapClient._request', return_value=sample_volume_data):
+            client.get_volume()
+            assert client._request.call_count == 1  # Volume was invalidated
+    
     def test_get_volume_invalid_response(self, client):
         """Test get_volume with invalid response type."""
         with patch('houdiniswap.client.HoudiniSwapClient._request', return_value="invalid"):
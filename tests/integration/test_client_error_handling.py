@@ -1,11 +1,17 @@
 """Integration tests for client error handling and retry logic."""
 
+import gzip
+import json
 import pytest
+import requests
 import time
 from unittest.mock import patch, MagicMock
+from urllib.parse import urljoin
 
 from houdiniswap import HoudiniSwapClient
-from houdiniswap.exceptions import APIError, AuthenticationError, NetworkError, HoudiniSwapError
+from houdiniswap.exceptions import (
+    APIError, AuthenticationError, NetworkError, HoudiniSwapError, CircuitOpenError, ValidationError,
+)
 from houdiniswap.constants import (
     HTTP_STATUS_UNAUTHORIZED,
     HTTP_STATUS_TOO_MANY_REQUESTS,
@@ -24,6 +30,7 @@ class TestErrorHandling:
         mock_response = MagicMock()
         mock_response.status_code = HTTP_STATUS_UNAUTHORIZED
         mock_response.json.return_value = {"message": "Invalid credentials"}
+        mock_response.content = b'{"message": "Invalid credentials"}'
         
         with patch.object(client.session, 'request', return_value=mock_response):
             with pytest.raises(AuthenticationError):
@@ -34,6 +41,7 @@ class TestErrorHandling:
         mock_response = MagicMock()
         mock_response.status_code = 400
         mock_response.json.return_value = {"message": "Bad request"}
+        mock_response.content = b'{"message": "Bad request"}'
         
         with patch.object(client.session, 'request', return_value=mock_response):
             with pytest.raises(APIError) as exc_info:
@@ -46,6 +54,7 @@ class TestErrorHandling:
         mock_response = MagicMock()
         mock_response.status_code = 500
         mock_response.json.return_value = {}
+        mock_response.content = b'{}'
         mock_response.text = "Internal Server Error"
         
         with patch.object(client.session, 'request', return_value=mock_response):
@@ -58,6 +67,7 @@ class TestErrorHandling:
         mock_response = MagicMock()
         mock_response.status_code = 500
         mock_response.json.side_effect = ValueError("Invalid JSON")
+        mock_response.content = b"<html>Bad Gateway</html>"
         mock_response.text = "Internal Server Error"
         
         with patch.object(client.session, 'request', return_value=mock_response):
@@ -88,161 +98,274 @@ class TestErrorHandling:
 
 
 class TestRetryLogic:
-    """Tests for retry logic in _request method."""
+    """Tests for the urllib3 retry policy mounted on the session."""
     
-    def test_retry_on_429(self, client):
-        """Test retry on 429 Too Many Requests."""
-        client.max_retries = 2
-        client.retry_backoff_factor = 0.01  # Fast backoff for tests
-        
-        mock_response_success = MagicMock()
-        mock_response_success.status_code = 200
-        mock_response_success.json.return_value = {"success": True}
+    @staticmethod
+    def _retry(client):
+        return client.session.get_adapter("https://test-api.houdiniswap.com").max_retries
+    
+    def test_retry_policy_configured(self, api_key, api_secret):
+        """Test that the adapter retry policy reflects client settings."""
+        client = HoudiniSwapClient(api_key, api_secret, max_retries=4, retry_backoff_factor=0.5)
+        retry = client.session.get_adapter("https://api-partner.houdiniswap.com").max_retries
+        assert retry.total == 4
+        assert retry.backoff_factor == 0.5
+        assert retry.respect_retry_after_header is True
+        assert retry.raise_on_status is False
+        assert retry.status_forcelist is HoudiniSwapClient._RETRYABLE_STATUSES
+        assert client.session.get_adapter("http://example.com").max_retries is retry
+    
+    def test_retry_settings_changed_after_construction(self, client):
+        """Test that assigning retry settings rebuilds the mounted Retry policy."""
+        client.max_retries = 5
+        client.retry_backoff_factor = 0.25
+        retry = self._retry(client)
+        assert retry.total == 5
+        assert retry.backoff_factor == 0.25
+        assert client.session.get_adapter("http://example.com").max_retries is retry
         
+        mock_response = MagicMock()
+        mock_response.status_code = HTTP_STATUS_TOO_MANY_REQUESTS
+        mock_response.content = b'{"error": "Rate limited"}'
+        with patch.object(client.session, 'request', return_value=mock_response), \
+             patch.object(client.logger, 'error') as mock_error:
+            with pytest.raises(APIError):
+                client._request("GET", "/test")
+        mock_error.assert_called_once_with("Rate limit exceeded after %d attempts", 6)
+    
+    @pytest.mark.parametrize("status", [
+        HTTP_STATUS_TOO_MANY_REQUESTS,
+        HTTP_STATUS_INTERNAL_SERVER_ERROR,
+        HTTP_STATUS_BAD_GATEWAY,
+        HTTP_STATUS_SERVICE_UNAVAILABLE,
+        HTTP_STATUS_GATEWAY_TIMEOUT,
+    ])
+    def test_retryable_statuses(self, client, status):
+        """Test that transient statuses are retried for GET and POST."""
+        retry = self._retry(client)
+        assert retry.is_retry("GET", status)
+        assert retry.is_retry("POST", status)
+    
+    @pytest.mark.parametrize("status", [400, HTTP_STATUS_UNAUTHORIZED, 404])
+    def test_non_retryable_statuses(self, client, status):
+        """Test that client errors are not retried."""
+        assert not self._retry(client).is_retry("GET", status)
+    
+    def test_retry_backoff_timing(self, api_key, api_secret):
+        """Test that retry backoff increases exponentially."""
+        from urllib3.exceptions import ProtocolError
+        client = HoudiniSwapClient(api_key, api_secret, max_retries=3, retry_backoff_factor=0.1)
+        retry = client.session.get_adapter("https://api-partner.houdiniswap.com").max_retries
+        backoffs = []
+        for _ in range(3):
+            retry = retry.increment(method="GET", url="/test", error=ProtocolError("reset"))
+            backoffs.append(retry.get_backoff_time())
+        assert backoffs[1] == pytest.approx(0.2)
+        assert backoffs[2] == pytest.approx(0.4)
+    
+    def test_rate_limit_exhausted(self, client):
+        """Test that a 429 surviving all retries raises APIError."""
         mock_response_429 = MagicMock()
         mock_response_429.status_code = HTTP_STATUS_TOO_MANY_REQUESTS
+        mock_response_429.json.return_value = {"message": "Too many requests"}
+        mock_response_429.content = b'{"message": "Too many requests"}'
         
-        with patch.object(client.session, 'request', side_effect=[
-            mock_response_429,
-            mock_response_429,
-            mock_response_success,
-        ]):
-            result = client._request("GET", "/test")
-            assert result == {"success": True}
-            assert client.session.request.call_count == 3
-    
-    def test_retry_on_500(self, client):
-        """Test retry on 500 Internal Server Error."""
-        client.max_retries = 1
-        client.retry_backoff_factor = 0.01
-        
-        mock_response_success = MagicMock()
-        mock_response_success.status_code = 200
-        mock_response_success.json.return_value = {"success": True}
-        
-        mock_response_500 = MagicMock()
-        mock_response_500.status_code = HTTP_STATUS_INTERNAL_SERVER_ERROR
-        
-        with patch.object(client.session, 'request', side_effect=[
-            mock_response_500,
-            mock_response_success,
-        ]):
-            result = client._request("GET", "/test")
-            assert result == {"success": True}
+        with patch.object(client.session, 'request', return_value=mock_response_429):
+            with pytest.raises(APIError, match="Please wait before retrying") as exc_info:
+                client._request("GET", "/test")
+            assert exc_info.value.status_code == HTTP_STATUS_TOO_MANY_REQUESTS
+            assert "Too many requests" in str(exc_info.value)
     
-    def test_retry_on_502(self, client):
-        """Test retry on 502 Bad Gateway."""
-        client.max_retries = 1
-        client.retry_backoff_factor = 0.01
-        
-        mock_response_success = MagicMock()
-        mock_response_success.status_code = 200
-        mock_response_success.json.return_value = {"success": True}
-        
-        mock_response_502 = MagicMock()
-        mock_response_502.status_code = HTTP_STATUS_BAD_GATEWAY
+    def test_rate_limit_exhausted_invalid_json(self, client):
+        """Test rate limit error message when the body is not JSON."""
+        mock_response_429 = MagicMock()
+        mock_response_429.status_code = HTTP_STATUS_TOO_MANY_REQUESTS
+        mock_response_429.json.side_effect = ValueError("Invalid JSON")
+        mock_response_429.content = b"<html>Bad Gateway</html>"
         
-        with patch.object(client.session, 'request', side_effect=[
-            mock_response_502,
-            mock_response_success,
-        ]):
-            result = client._request("GET", "/test")
-            assert result == {"success": True}
+        with patch.object(client.session, 'request', return_value=mock_response_429):
+            with pytest.raises(APIError, match="Rate limit exceeded"):
+                client._request("GET", "/test")
     
     def test_retry_exhausted(self, client):
-        """Test that retries are exhausted after max_retries."""
-        client.max_retries = 2
-        client.retry_backoff_factor = 0.01
-        
+        """Test that a retryable status surviving all retries raises APIError."""
         mock_response_500 = MagicMock()
         mock_response_500.status_code = HTTP_STATUS_INTERNAL_SERVER_ERROR
         mock_response_500.json.return_value = {"error": "Server error"}
+        mock_response_500.content = b'{"error": "Server error"}'
         
         with patch.object(client.session, 'request', return_value=mock_response_500):
             with pytest.raises(APIError):
                 client._request("GET", "/test")
-            # Should try max_retries + 1 times (initial + retries)
-            assert client.session.request.call_count == 3
+            # Retries happen inside the adapter, not in _request
+            assert client.session.request.call_count == 1
     
     def test_no_retry_on_401(self, client):
         """Test that 401 errors are not retried."""
-        client.max_retries = 2
-        
         mock_response_401 = MagicMock()
         mock_response_401.status_code = HTTP_STATUS_UNAUTHORIZED
         
         with patch.object(client.session, 'request', return_value=mock_response_401):
             with pytest.raises(AuthenticationError):
                 client._request("GET", "/test")
-            # Should only try once (no retry)
             assert client.session.request.call_count == 1
     
     def test_no_retry_on_400(self, client):
         """Test that 400 errors are not retried."""
-        client.max_retries = 2
-        
         mock_response_400 = MagicMock()
         mock_response_400.status_code = 400
         mock_response_400.json.return_value = {"error": "Bad request"}
+        mock_response_400.content = b'{"error": "Bad request"}'
         
         with patch.object(client.session, 'request', return_value=mock_response_400):
             with pytest.raises(APIError):
                 client._request("GET", "/test")
-            # Should only try once (no retry)
             assert client.session.request.call_count == 1
     
-    def test_retry_backoff_timing(self, client):
-        """Test that retry backoff increases exponentially."""
-        client.max_retries = 2
-        client.retry_backoff_factor = 0.1
-        
-        mock_response_500 = MagicMock()
-        mock_response_500.status_code = HTTP_STATUS_INTERNAL_SERVER_ERROR
-        
-        mock_response_success = MagicMock()
-        mock_response_success.status_code = 200
-        mock_response_success.json.return_value = {"success": True}
-        
-        with patch.object(client.session, 'request', side_effect=[
-            mock_response_500,
-            mock_response_500,
-            mock_response_success,
-        ]), patch('time.sleep') as mock_sleep:
-            client._request("GET", "/test")
-            # Should sleep with exponential backoff: 0.1 * 2^0, 0.1 * 2^1
-            assert mock_sleep.call_count == 2
-            assert mock_sleep.call_args_list[0][0][0] == pytest.approx(0.1)  # 0.1 * 2^0
-            assert mock_sleep.call_args_list[1][0][0] == pytest.approx(0.2)  # 0.1 * 2^1
+    def test_network_error_exhausted(self, client):
+        """Test that a network error surviving all retries raises NetworkError."""
+        import requests
+        with patch.object(client.session, 'request', side_effect=requests.exceptions.ConnectionError("Connection failed")):
+            with pytest.raises(NetworkError):
+                client._request("GET", "/test")
+            assert client.session.request.call_count == 1
+
+
+class TestCircuitBreaker:
+    """Tests for the per-endpoint circuit breaker."""
+    
+    @staticmethod
+    def _response(status_code):
+        mock_response = MagicMock()
+        mock_response.status_code = status_code
+        mock_response.content = b'{"message": "error"}'
+        return mock_response
     
-    def test_retry_on_network_error(self, client):
-        """Test retry on network errors."""
+    def test_opens_after_threshold_and_fails_fast(self, api_key, api_secret):
+        """Test that consecutive 5xx responses open the circuit for that endpoint only."""
+        client = HoudiniSwapClient(api_key, api_secret, breaker_threshold=2, breaker_cooldown=30)
+        with patch.object(client.session, 'request', return_value=self._response(503)):
+            for _ in range(2):
+                with pytest.raises(APIError):
+                    client._request("GET", "/status")
+            with pytest.raises(CircuitOpenError) as exc_info:
+                client._request("GET", "/status")
+            assert client.session.request.call_count == 2
+            assert exc_info.value.endpoint == "/status"
+            assert 0 < exc_info.value.retry_after <= 30
+            with pytest.raises(APIError):
+                client._request("GET", "/volume")  # Other endpoints unaffected
+    
+    def test_trial_request_after_cooldown(self, api_key, api_secret):
+        """Test that a successful trial after the cooldown closes the circuit."""
         import requests
-        client.max_retries = 1
-        client.retry_backoff_factor = 0.01
+        client = HoudiniSwapClient(api_key, api_secret, breaker_threshold=1, breaker_cooldown=10)
+        with patch('houdiniswap.client.time.monotonic', return_value=100.0) as mock_clock:
+            with patch.object(client.session, 'request', side_effect=requests.exceptions.ConnectionError("down")):
+                with pytest.raises(NetworkError):
+                    client._request("GET", "/status")
+                with pytest.raises(CircuitOpenError):
+                    client._request("GET", "/status")
+            mock_clock.return_value = 110.0
+            ok = self._response(200)
+            ok.content = b'{"success": true}'
+            with patch.object(client.session, 'request', return_value=ok):
+                assert client._request("GET", "/status") == {"success": True}
+                assert client._request("GET", "/status") == {"success": True}
+        assert client._breaker_failures == {}
+    
+    def test_single_trial_while_half_open(self, api_key, api_secret):
+        """Test that only one caller probes after the cooldown; others still fail fast."""
+        import threading
+        client = HoudiniSwapClient(api_key, api_secret, breaker_threshold=1, breaker_cooldown=10)
+        client._breaker_failures["/status"] = (1, 0.0)
+        in_flight = threading.Event()
+        release = threading.Event()
+        ok = self._response(200)
+        ok.content = b'{"success": true}'
         
-        mock_response_success = MagicMock()
-        mock_response_success.status_code = 200
-        mock_response_success.json.return_value = {"success": True}
+        def slow_request(**kwargs):
+            in_flight.set()
+            release.wait(5)
+            return ok
+        
+        results = []
+        with patch('houdiniswap.client.time.monotonic', return_value=100.0), \
+             patch.object(client.session, 'request', side_effect=slow_request):
+            trial = threading.Thread(target=lambda: results.append(client._request("GET", "/status")))
+            trial.start()
+            assert in_flight.wait(5)
+            with pytest.raises(CircuitOpenError) as exc_info:
+                client._request("GET", "/status")
+            assert exc_info.value.retry_after == 0
+            release.set()
+            trial.join(5)
+            assert client.session.request.call_count == 1
         
+        assert results == [{"success": True}]
+        assert client._breaker_failures == {}
+        assert client._breaker_trials == set()
+    
+    def test_failed_trial_reopens_circuit(self, api_key, api_secret):
+        """Test that a failed trial restarts the cooldown and clears the trial marker."""
+        client = HoudiniSwapClient(api_key, api_secret, breaker_threshold=1, breaker_cooldown=10)
+        client._breaker_failures["/status"] = (1, 0.0)
+        with patch('houdiniswap.client.time.monotonic', return_value=100.0), \
+             patch.object(client.session, 'request', return_value=self._response(503)):
+            with pytest.raises(APIError):
+                client._request("GET", "/status")
+            with pytest.raises(CircuitOpenError) as exc_info:
+                client._request("GET", "/status")
+        assert exc_info.value.retry_after == 10
+        assert client._breaker_failures["/status"] == (2, 100.0)
+        assert client._breaker_trials == set()
+    
+    def test_client_errors_reset_failures(self, api_key, api_secret):
+        """Test that 4xx responses count as the endpoint being up."""
+        client = HoudiniSwapClient(api_key, api_secret, breaker_threshold=2)
         with patch.object(client.session, 'request', side_effect=[
-            requests.exceptions.ConnectionError("Connection failed"),
-            mock_response_success,
+            self._response(500), self._response(400), self._response(500), self._response(500),
         ]):
-            result = client._request("GET", "/test")
-            assert result == {"success": True}
-            assert client.session.request.call_count == 2
+            for _ in range(4):
+                with pytest.raises(APIError):
+                    client._request("GET", "/status")
+        assert client._breaker_failures["/status"][0] == 2
     
-    def test_retry_network_error_exhausted(self, client):
-        """Test that network error retries are exhausted."""
-        import requests
-        client.max_retries = 1
-        client.retry_backoff_factor = 0.01
-        
-        with patch.object(client.session, 'request', side_effect=requests.exceptions.ConnectionError("Connection failed")):
+    @pytest.mark.parametrize("error", [
+        requests.exceptions.InvalidURL("bad url"),
+        requests.exceptions.MissingSchema("no schema"),
+        requests.exceptions.InvalidJSONError("bad body"),
+    ])
+    def test_client_side_request_errors_leave_breaker_closed(self, api_key, api_secret, error):
+        """Test that RequestExceptions raised before reaching the server are not counted."""
+        client = HoudiniSwapClient(api_key, api_secret, breaker_threshold=1)
+        with patch.object(client.session, 'request', side_effect=error):
+            for _ in range(3):
+                with pytest.raises(NetworkError):
+                    client._request("GET", "/status")
+            assert client.session.request.call_count == 3
+        assert client._breaker_failures == {}
+    
+    @pytest.mark.parametrize("error", [
+        requests.exceptions.ConnectionError("down"),
+        requests.exceptions.ReadTimeout("slow"),
+    ])
+    def test_transport_errors_count_towards_breaker(self, api_key, api_secret, error):
+        """Test that connection errors and timeouts are counted."""
+        client = HoudiniSwapClient(api_key, api_secret, breaker_threshold=1)
+        with patch.object(client.session, 'request', side_effect=error):
             with pytest.raises(NetworkError):
-                client._request("GET", "/test")
-            # Should try max_retries + 1 times
-            assert client.session.request.call_count == 2
+                client._request("GET", "/status")
+        assert client._breaker_failures["/status"][0] == 1
+    
+    def test_disabled(self, api_key, api_secret):
+        """Test that breaker_threshold=None never opens the circuit."""
+        client = HoudiniSwapClient(api_key, api_secret, breaker_threshold=None)
+        with patch.object(client.session, 'request', return_value=self._response(500)):
+            for _ in range(10):
+                with pytest.raises(APIError):
+                    client._request("GET", "/status")
+            assert client.session.request.call_count == 10
 
 
 class TestRequestLogging:
@@ -256,6 +379,7 @@ class TestRequestLogging:
         mock_response = MagicMock()
         mock_response.status_code = 200
         mock_response.json.return_value = {"success": True}
+        mock_response.content = b'{"success": true}'
         
         with patch.object(client.session, 'request', return_value=mock_response), \
              patch.object(client.logger, 'debug') as mock_debug:
@@ -271,6 +395,7 @@ class TestRequestLogging:
         mock_response = MagicMock()
         mock_response.status_code = 200
         mock_response.json.return_value = {"success": True}
+        mock_response.content = b'{"success": true}'
         
         with patch.object(client.session, 'request', return_value=mock_response), \
              patch.object(client.logger, 'debug') as mock_debug:
@@ -280,34 +405,205 @@ class TestRequestLogging:
             all_logs = " ".join(logged_calls)
             # Authorization should be redacted
             assert "***REDACTED***" in all_logs or "api_key" not in all_logs.lower()
+            assert client.session.headers["Authorization"] not in all_logs
+    
+    def test_debug_logging_uses_lazy_formatting(self, client):
+        """Test that request log arguments are passed lazily, not pre-formatted."""
+        import logging
+        client.logger.setLevel(logging.DEBUG)
+        
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.json.return_value = {"success": True}
+        mock_response.content = b'{"success": true}'
+        
+        with patch.object(client.session, 'request', return_value=mock_response), \
+             patch.object(client.logger, 'debug') as mock_debug:
+            client._request("GET", "/test", params={"id": "abc"})
+            request_call = mock_debug.call_args_list[0]
+            assert request_call[0][0] == "Request: %s %s params=%s json=%s"
+            assert request_call[0][3] == {"id": "abc"}
 
 
 class TestRequestParameters:
     """Tests for request parameter handling."""
     
-    def test_params_defensive_copy(self, client):
-        """Test that params dict is defensively copied."""
+    def test_params_passed_through_unmodified(self, client):
+        """Test that params dict is passed through without copy or mutation."""
         params = {"key": "value"}
         mock_response = MagicMock()
         mock_response.status_code = 200
         mock_response.json.return_value = {"success": True}
+        mock_response.content = b'{"success": true}'
         
         with patch.object(client.session, 'request', return_value=mock_response):
             client._request("GET", "/test", params=params)
-            # Modify original dict
-            params["key"] = "modified"
-            # Should not affect the request (already made)
-            # This test ensures defensive copying works
+            assert client.session.request.call_args[1]["params"] is params
+            assert params == {"key": "value"}
     
-    def test_json_data_defensive_copy(self, client):
-        """Test that json_data dict is defensively copied."""
+    def test_json_data_passed_through_unmodified(self, client):
+        """Test that json_data dict is serialized without being mutated."""
         json_data = {"key": "value"}
         mock_response = MagicMock()
         mock_response.status_code = 200
         mock_response.json.return_value = {"success": True}
+        mock_response.content = b'{"success": true}'
+        
+        with patch('houdiniswap.client.orjson', None), \
+             patch.object(client.session, 'request', return_value=mock_response):
+            client._request("POST", "/test", json_data=json_data)
+            call_kwargs = client.session.request.call_args[1]
+            assert "json" not in call_kwargs
+            assert json.loads(call_kwargs["data"]) == json_data
+            assert json_data == {"key": "value"}
+    
+    def test_json_data_serialized_with_orjson(self, client):
+        """Test that request bodies are pre-serialized with orjson when available."""
+        orjson = pytest.importorskip("orjson")
+        json_data = {"amount": 1.5, "from": "ETH"}
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.content = b'{"success": true}'
+        
+        with patch.object(client.session, 'request', return_value=mock_response):
+            client._request("POST", "/test", json_data=json_data)
+            call_kwargs = client.session.request.call_args[1]
+            assert "json" not in call_kwargs
+            assert orjson.loads(call_kwargs["data"]) == json_data
+    
+    def test_json_body_falls_back_to_stdlib_encoder(self, client):
+        """Test that payloads orjson rejects (big ints, non-str keys) are still sent intact."""
+        pytest.importorskip("orjson")
+        json_data = {"amountIn": 10**21, 1: "one"}
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.content = b'{"success": true}'
+        
+        with patch.object(client.session, 'request', return_value=mock_response):
+            client._request("POST", "/test", json_data=json_data)
+            body = client.session.request.call_args[1]["data"]
+        assert json.loads(body) == {"amountIn": 10**21, "1": "one"}
+    
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_unserializable_json_body_raises_validation_error(self, client, use_orjson):
+        """Test that bodies that cannot be JSON encoded raise ValidationError without a request."""
+        from decimal import Decimal
+        if use_orjson:
+            pytest.importorskip("orjson")
+        orjson_patch = patch('houdiniswap.client.orjson', None) if not use_orjson else patch.object(
+            client, 'request_compression', False)
+        with orjson_patch, patch.object(client.session, 'send') as mock_send:
+            with pytest.raises(ValidationError, match="not JSON serializable"):
+                client._request("POST", "/test", json_data={"amount": Decimal("1.5")})
+            mock_send.assert_not_called()
+        assert client._breaker_failures == {}
+    
+    def test_large_json_body_gzipped_when_enabled(self, client):
+        """Test that large request bodies are gzipped when request_compression is on."""
+        client.request_compression = True
+        json_data = {"addresses": ["0x" + "a" * 40] * 100}
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.content = b'{"success": true}'
         
         with patch.object(client.session, 'request', return_value=mock_response):
             client._request("POST", "/test", json_data=json_data)
-            # Modify original dict
-            json_data["key"] = "modified"
-            # Should not affect the request (already made)
+            call_kwargs = client.session.request.call_args[1]
+            assert "json" not in call_kwargs
+            assert call_kwargs["headers"] == {"Content-Encoding": "gzip"}
+            assert json.loads(gzip.decompress(call_kwargs["data"])) == json_data
+    
+    def test_small_json_body_not_gzipped(self, client):
+        """Test that bodies below the size threshold are sent uncompressed."""
+        client.request_compression = True
+        json_data = {"key": "value"}
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.content = b'{"success": true}'
+        
+        with patch('houdiniswap.client.orjson', None), \
+             patch.object(client.session, 'request', return_value=mock_response):
+            client._request("POST", "/test", json_data=json_data)
+            call_kwargs = client.session.request.call_args[1]
+            assert call_kwargs["headers"] is None
+            assert json.loads(call_kwargs["data"]) == json_data
+    
+    def test_json_body_not_gzipped_by_default(self, client):
+        """Test that request compression is off unless enabled."""
+        json_data = {"addresses": ["0x" + "a" * 40] * 100}
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.content = b'{"success": true}'
+        
+        with patch.object(client.session, 'request', return_value=mock_response):
+            client._request("POST", "/test", json_data=json_data)
+            assert client.session.request.call_args[1]["headers"] is None
+    
+    def test_url_resolved_once_per_endpoint(self, client):
+        """Test that endpoint URLs are joined once and then reused."""
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.json.return_value = {"success": True}
+        mock_response.content = b'{"success": true}'
+        
+        with patch.object(client.session, 'request', return_value=mock_response), \
+             patch('houdiniswap.client.urljoin', wraps=urljoin) as mock_urljoin:
+            client._request("GET", "/tokens")
+            assert mock_urljoin.call_count == 0  # precomputed in __init__
+            assert client.session.request.call_args[1]["url"] == "https://test-api.houdiniswap.com/tokens"
+            client._request("GET", "/custom")
+            client._request("GET", "/custom")
+            assert mock_urljoin.call_count == 1
+            assert client.session.request.call_args[1]["url"] == "https://test-api.houdiniswap.com/custom"
+    
+    def test_empty_params_sent_as_none(self, client):
+        """Test that empty params and json_data are sent as None."""
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.json.return_value = {"success": True}
+        mock_response.content = b'{"success": true}'
+        
+        with patch.object(client.session, 'request', return_value=mock_response):
+            client._request("GET", "/test", params={}, json_data={})
+            call_kwargs = client.session.request.call_args[1]
+            assert call_kwargs["params"] is None
+            assert "json" not in call_kwargs
+            assert call_kwargs["data"] is None
+    
+    def test_non_json_body_returned_as_text(self, client):
+        """Test that a non-JSON success body is wrapped in a response dict."""
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.json.side_effect = ValueError("Invalid JSON")
+        mock_response.content = b"OK"
+        mock_response.text = "OK"
+        
+        with patch.object(client.session, 'request', return_value=mock_response):
+            assert client._request("GET", "/test") == {"response": "OK"}
+    
+    def test_json_decoding_without_orjson(self, client):
+        """Test that decoding falls back to response.json() when orjson is missing."""
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.json.return_value = {"success": True}
+        
+        with patch('houdiniswap.client.orjson', None), \
+             patch.object(client.session, 'request', return_value=mock_response):
+            assert client._request("GET", "/test") == {"success": True}
+            mock_response.json.assert_called_once()
+    
+    def test_big_integer_round_trip(self, client):
+        """Test that integers wider than 64 bits survive decoding and re-encoding."""
+        pytest.importorskip("orjson")
+        response = requests.Response()
+        response.status_code = 200
+        response._content = b'{"amountOut": 1000000000000000000000}'
+        
+        with patch.object(client.session, 'request', return_value=response):
+            result = client._request("GET", "/test")
+            assert result["amountOut"] == 10**21
+            assert isinstance(result["amountOut"], int)
+            
+            client._request("POST", "/test", json_data=result)
+            body = client.session.request.call_args[1]["data"]
+            assert b"1000000000000000000000" in body
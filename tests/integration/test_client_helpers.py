@@ -1,11 +1,14 @@
 """Integration tests for client helper methods."""
 
 import pytest
+import threading
 import time
+from decimal import Decimal
 from unittest.mock import patch
 
 from houdiniswap import HoudiniSwapClient
 from houdiniswap.models import TransactionStatus, DEXToken
+from houdiniswap.exceptions import APIError, NetworkError, ValidationError
 
 
 class TestIterDexTokens:
@@ -57,6 +60,65 @@ class TestIterDexTokens:
             assert len(tokens) == 1
             client.get_dex_tokens.assert_called_with(page=1, page_size=100, chain="base")
     
+    def test_iter_dex_tokens_prefetches_next_page(self, client, sample_dex_token_data):
+        """Test that the next page is fetched while the current one is consumed."""
+        from houdiniswap.models import DEXTokensResponse, DEXToken
+        pages = [
+            DEXTokensResponse(count=300, tokens=[DEXToken.from_dict(sample_dex_token_data) for _ in range(100)])
+            for _ in range(3)
+        ]
+        
+        with patch('houdiniswap.client.HoudiniSwapClient.get_dex_tokens', side_effect=pages) as mock_get:
+            tokens = client.iter_dex_tokens(page_size=100)
+            next(tokens)  # First token of page 1; page 2 is now in flight
+            for _ in range(100):
+                if mock_get.call_count == 2:
+                    break
+                time.sleep(0.01)
+            assert mock_get.call_count == 2
+            assert mock_get.call_args_list[1][1]["page"] == 2
+            tokens.close()  # Stopping early never requests page 3
+            assert mock_get.call_count == 2
+    
+    def test_iter_dex_tokens_prefetch_depth(self, client, sample_dex_token_data):
+        """Test that prefetch controls how many pages are requested ahead."""
+        from houdiniswap.models import DEXTokensResponse, DEXToken
+        pages = [
+            DEXTokensResponse(count=400, tokens=[DEXToken.from_dict(sample_dex_token_data)] * 100)
+            for _ in range(4)
+        ]
+        
+        with patch('houdiniswap.client.HoudiniSwapClient.get_dex_tokens', side_effect=pages) as mock_get:
+            tokens = client.iter_dex_tokens(page_size=100, prefetch=2)
+            next(tokens)  # Pages 2 and 3 are now in flight
+            for _ in range(100):
+                if mock_get.call_count == 3:
+                    break
+                time.sleep(0.01)
+            assert sorted(c[1]["page"] for c in mock_get.call_args_list) == [1, 2, 3]
+            assert len(list(tokens)) == 399
+            assert mock_get.call_count == 4
+    
+    def test_iter_dex_tokens_prefetches_on_shared_pool(self, client, sample_dex_token_data):
+        """Test that prefetched pages run on the client's shared worker pool."""
+        from houdiniswap.models import DEXTokensResponse, DEXToken
+        threads = []
+        
+        def fake_get_dex_tokens(page, page_size, chain):
+            threads.append(threading.current_thread().name)
+            return DEXTokensResponse(count=300, tokens=[DEXToken.from_dict(sample_dex_token_data)] * 100)
+        
+        with patch('houdiniswap.client.HoudiniSwapClient.get_dex_tokens', side_effect=fake_get_dex_tokens):
+            assert len(list(client.iter_dex_tokens(page_size=100))) == 300
+        
+        assert all(name.startswith("houdiniswap-parallel") for name in threads[1:])
+        assert client._executor is not None
+    
+    def test_iter_dex_tokens_invalid_prefetch(self, client):
+        """Test that a prefetch depth below 1 is rejected."""
+        with pytest.raises(ValidationError, match="prefetch"):
+            next(client.iter_dex_tokens(prefetch=0))
+    
     def test_iter_dex_tokens_empty(self, client):
         """Test iterating when no tokens."""
         from houdiniswap.models import DEXTokensResponse
@@ -72,13 +134,44 @@ class TestGetAllDexTokens:
     
     def test_get_all_dex_tokens(self, client, sample_dex_token_data):
         """Test getting all DEX tokens."""
-        from houdiniswap.models import DEXToken
-        token = DEXToken.from_dict(sample_dex_token_data)
+        from houdiniswap.models import DEXTokensResponse, DEXToken
+        response = DEXTokensResponse(count=1, tokens=[DEXToken.from_dict(sample_dex_token_data)])
         
-        with patch('houdiniswap.client.HoudiniSwapClient.iter_dex_tokens', return_value=iter([token])):
+        with patch('houdiniswap.client.HoudiniSwapClient.get_dex_tokens', return_value=response) as mock_get:
             tokens = client.get_all_dex_tokens()
             assert len(tokens) == 1
             assert tokens[0].symbol == "USDC"
+            mock_get.assert_called_once_with(page=1, page_size=100, chain=None)
+    
+    def test_get_all_dex_tokens_fetches_remaining_pages_in_order(self, client, sample_dex_token_data):
+        """Test that pages after the first are fetched concurrently and kept in order."""
+        from houdiniswap.models import DEXTokensResponse, DEXToken
+        
+        def fake_get_dex_tokens(page, page_size, chain):
+            # Later pages return faster to exercise ordering
+            time.sleep(0.01 * (5 - page))
+            token = DEXToken.from_dict({**sample_dex_token_data, "symbol": f"T{page}"})
+            return DEXTokensResponse(count=4 * page_size, tokens=[token] * page_size)
+        
+        with patch('houdiniswap.client.HoudiniSwapClient.get_dex_tokens', side_effect=fake_get_dex_tokens) as mock_get:
+            tokens = client.get_all_dex_tokens(page_size=2, chain="base")
+        
+        assert [t.symbol for t in tokens] == ["T1", "T1", "T2", "T2", "T3", "T3", "T4", "T4"]
+        assert mock_get.call_count == 4
+        assert client._executor is not None  # Pages ran on the shared pool
+    
+    def test_get_all_dex_tokens_raises_page_error(self, client, sample_dex_token_data):
+        """Test that a failed page after the first is raised."""
+        from houdiniswap.models import DEXTokensResponse, DEXToken
+        
+        def fake_get_dex_tokens(page, page_size, chain):
+            if page == 3:
+                raise NetworkError("page 3 failed")
+            return DEXTokensResponse(count=4 * page_size, tokens=[DEXToken.from_dict(sample_dex_token_data)] * page_size)
+        
+        with patch('houdiniswap.client.HoudiniSwapClient.get_dex_tokens', side_effect=fake_get_dex_tokens):
+            with pytest.raises(NetworkError, match="page 3 failed"):
+                client.get_all_dex_tokens(page_size=2)
 
 
 class TestWaitForStatus:
@@ -115,11 +208,37 @@ class TestWaitForStatus:
         
         with patch('houdiniswap.client.HoudiniSwapClient.get_status', return_value=status), \
              patch('time.sleep'), \
-             patch('time.time', side_effect=[0, 11]):  # Simulate timeout
+             patch('time.monotonic', side_effect=[0, 11]):  # Simulate timeout
             with pytest.raises(TimeoutError, match="Timeout waiting for status"):
                 client.wait_for_status("test123", TransactionStatus.FINISHED, timeout=10, poll_interval=0.1)
 
 
+    def test_wait_for_status_backs_off_exponentially(self, client):
+        """Test that poll delays double up to max_poll_interval."""
+        from houdiniswap.models import Status
+        waiting = Status.from_dict({"houdiniId": "test123", "status": TransactionStatus.WAITING.value})
+        finished = Status.from_dict({"houdiniId": "test123", "status": TransactionStatus.FINISHED.value})
+        
+        with patch('houdiniswap.client.HoudiniSwapClient.get_status', side_effect=[waiting] * 5 + [finished]), \
+             patch('time.sleep') as mock_sleep:
+            client.wait_for_status("test123", TransactionStatus.FINISHED, timeout=600, poll_interval=5, max_poll_interval=30)
+        
+        assert [c[0][0] for c in mock_sleep.call_args_list] == [5, 10, 20, 30, 30]
+    
+    def test_wait_for_status_sleep_capped_by_deadline(self, client):
+        """Test that the last sleep ends at the timeout instead of overshooting it."""
+        from houdiniswap.models import Status
+        status = Status.from_dict({"houdiniId": "test123", "status": TransactionStatus.WAITING.value})
+        
+        with patch('houdiniswap.client.HoudiniSwapClient.get_status', return_value=status), \
+             patch('time.sleep') as mock_sleep, \
+             patch('time.monotonic', side_effect=[0, 2, 7, 10.5]):
+            with pytest.raises(TimeoutError):
+                client.wait_for_status("test123", TransactionStatus.FINISHED, timeout=10, poll_interval=5)
+        
+        assert [c[0][0] for c in mock_sleep.call_args_list] == [5, 3]
+
+
 class TestPollUntilFinished:
     """Tests for poll_until_finished method."""
     
@@ -153,9 +272,22 @@ class TestPollUntilFinished:
         
         with patch('houdiniswap.client.HoudiniSwapClient.get_status', return_value=status), \
              patch('time.sleep'), \
-             patch('time.time', side_effect=[0, 11]):  # Simulate timeout
+             patch('time.monotonic', side_effect=[0, 11]):  # Simulate timeout
             with pytest.raises(TimeoutError, match="Timeout waiting for transaction"):
                 client.poll_until_finished("test123", timeout=10, poll_interval=0.1)
+    
+    def test_poll_until_finished_sleep_capped_by_deadline(self, client):
+        """Test that backoff never sleeps past the timeout."""
+        from houdiniswap.models import Status
+        status = Status.from_dict({"houdiniId": "test123", "status": TransactionStatus.WAITING.value})
+        
+        with patch('houdiniswap.client.HoudiniSwapClient.get_status', return_value=status), \
+             patch('time.sleep') as mock_sleep, \
+             patch('time.monotonic', side_effect=[0, 1, 31, 40, 41]):
+            with pytest.raises(TimeoutError):
+                client.poll_until_finished("test123", timeout=40, poll_interval=30, max_poll_interval=30)
+        
+        assert [c[0][0] for c in mock_sleep.call_args_list] == [30, 9, 0]
 
 
 class TestExecuteParallel:
@@ -195,6 +327,173 @@ class TestExecuteParallel:
         """Test executing parallel with empty list."""
         results = client.execute_parallel([], max_workers=2)
         assert results == []
+    
+    def test_execute_parallel_preserves_order_when_completion_differs(self, client):
+        """Test that results follow input order even when later calls finish first."""
+        import threading
+        
+        def make_request(i):
+            def request():
+                time.sleep(0.01 * (3 - i))
+                return (i, threading.current_thread().name)
+            return request
+        
+        results = client.execute_parallel([make_request(i) for i in range(3)], max_workers=3)
+        assert [r[0] for r in results] == [0, 1, 2]
+        assert all(r[1].startswith("houdiniswap-parallel") for r in results)
+    
+    def test_execute_parallel_reuses_executor(self, client):
+        """Test that the worker pool is created once and shut down by close()."""
+        from concurrent.futures import ThreadPoolExecutor
+        
+        with patch('houdiniswap.client.ThreadPoolExecutor', wraps=ThreadPoolExecutor) as mock_executor:
+            client.execute_parallel([lambda: 1, lambda: 2])
+            client.execute_parallel([lambda: 3])
+            client.batch_execute([])
+        
+        assert mock_executor.call_count == 1
+        executor = client._executor
+        client.close()
+        assert client._executor is None
+        assert executor._shutdown
+    
+    def test_execute_parallel_limits_in_flight_calls(self, client):
+        """Test that no more than max_workers calls run at once."""
+        import threading
+        lock = threading.Lock()
+        state = {"running": 0, "peak": 0}
+        
+        def request():
+            with lock:
+                state["running"] += 1
+                state["peak"] = max(state["peak"], state["running"])
+            time.sleep(0.01)
+            with lock:
+                state["running"] -= 1
+            return True
+        
+        results = client.execute_parallel([request] * 8, max_workers=2)
+        assert results == [True] * 8
+        assert state["peak"] <= 2
+    
+    def test_execute_parallel_nested_does_not_deadlock(self, api_key, api_secret):
+        """Test that a fan-out started from a pool worker cannot starve the pool."""
+        import threading
+        client = HoudiniSwapClient(api_key, api_secret, pool_maxsize=2)
+        
+        def inner():
+            return client.execute_parallel([lambda: 1, lambda: 2], max_workers=2)
+        
+        outcome = {}
+        runner = threading.Thread(
+            target=lambda: outcome.update(results=client.execute_parallel([inner, inner], max_workers=2)),
+            daemon=True,
+        )
+        runner.start()
+        runner.join(timeout=5)
+        assert not runner.is_alive(), "nested execute_parallel deadlocked"
+        assert outcome["results"] == [[1, 2], [1, 2]]
+        client.close()
+    
+    @pytest.mark.parametrize("max_workers", [0, -1])
+    def test_execute_parallel_invalid_max_workers(self, client, max_workers):
+        """Test that max_workers below 1 is rejected."""
+        with pytest.raises(ValidationError, match="max_workers must be at least 1"):
+            client.execute_parallel([lambda: 1], max_workers=max_workers)
+
+
+class TestBatchExecute:
+    """Tests for batch_execute method."""
+    
+    def test_batch_execute_success(self, client):
+        """Test executing raw requests concurrently preserves order."""
+        def fake_request(method, endpoint, params=None, json_data=None):
+            return {"method": method, "endpoint": endpoint, "params": params, "json": json_data}
+        
+        with patch('houdiniswap.client.HoudiniSwapClient._request', side_effect=fake_request):
+            results = client.batch_execute([
+                ("GET", "/status", {"id": "id1"}),
+                ("POST", "/exchange", None, {"amount": 1}),
+                ("GET", "/volume"),
+            ], max_workers=3)
+        
+        assert results[0] == {"method": "GET", "endpoint": "/status", "params": {"id": "id1"}, "json": None}
+        assert results[1] == {"method": "POST", "endpoint": "/exchange", "params": None, "json": {"amount": 1}}
+        assert results[2]["endpoint"] == "/volume"
+    
+    def test_batch_execute_with_errors(self, client):
+        """Test that failed calls return their exception in place."""
+        def fake_request(method, endpoint, params=None, json_data=None):
+            if endpoint == "/fail":
+                raise APIError("boom", status_code=500)
+            return {"ok": endpoint}
+        
+        with patch('houdiniswap.client.HoudiniSwapClient._request', side_effect=fake_request):
+            results = client.batch_execute([("GET", "/ok"), ("GET", "/fail")])
+        
+        assert results[0] == {"ok": "/ok"}
+        assert isinstance(results[1], APIError)
+    
+    def test_batch_execute_empty_list(self, client):
+        """Test executing an empty batch."""
+        assert client.batch_execute([]) == []
+    
+    def test_batch_execute_workers_capped_at_pool_size(self, client):
+        """Test that worker count never exceeds the connection pool size."""
+        from concurrent.futures import ThreadPoolExecutor
+        from houdiniswap.constants import DEFAULT_POOL_MAXSIZE
+        calls = [("GET", "/volume")] * 50
+        
+        with patch('houdiniswap.client.HoudiniSwapClient._request', return_value={}), \
+             patch('houdiniswap.client.ThreadPoolExecutor', wraps=ThreadPoolExecutor) as mock_executor:
+            results = client.batch_execute(calls, max_workers=50)
+        
+        assert len(results) == 50
+        assert mock_executor.call_args[1]["max_workers"] == DEFAULT_POOL_MAXSIZE
+
+
+class TestBulkLookups:
+    """Tests for get_statuses, get_min_maxes, and get_dex_quotes."""
+    
+    def test_get_statuses(self, client, sample_status_data):
+        """Test that statuses are keyed by ID with per-ID errors in place."""
+        def fake_request(method, endpoint, params=None, json_data=None):
+            if params["id"] == "failingHoudiniId1":
+                raise APIError("not found", status_code=404)
+            return {**sample_status_data, "houdiniId": params["id"]}
+        
+        ids = ["firstHoudiniId123", "failingHoudiniId1", "firstHoudiniId123", "bad id!"]
+        with patch('houdiniswap.client.HoudiniSwapClient._request', side_effect=fake_request) as mock_request:
+            statuses = client.get_statuses(ids)
+        
+        assert list(statuses) == ["firstHoudiniId123", "failingHoudiniId1", "bad id!"]
+        assert statuses["firstHoudiniId123"].houdini_id == "firstHoudiniId123"
+        assert isinstance(statuses["failingHoudiniId1"], APIError)
+        assert isinstance(statuses["bad id!"], ValidationError)
+        assert mock_request.call_count == 2  # Duplicate requested once, invalid ID never sent
+    
+    def test_get_min_maxes(self, client, sample_min_max_data):
+        """Test fetching min/max limits for several pairs."""
+        with patch('houdiniswap.client.HoudiniSwapClient._request', return_value=sample_min_max_data) as mock_request:
+            limits = client.get_min_maxes([("ETH", "BNB"), ("BTC", "ETH")], cex_only=True)
+        
+        assert set(limits) == {("ETH", "BNB"), ("BTC", "ETH")}
+        assert all(limit.max == Decimal("100.0") for limit in limits.values())
+        assert all(call[1]["params"]["cexOnly"] is True for call in mock_request.call_args_list)
+    
+    def test_get_dex_quotes(self, client, sample_dex_quote_data):
+        """Test fetching DEX quotes for several swaps."""
+        with patch('houdiniswap.client.HoudiniSwapClient._request', return_value=[sample_dex_quote_data]):
+            quotes = client.get_dex_quotes([("1.0", "token1", "token2"), ("2.0", "token2", "token1")])
+        
+        assert len(quotes) == 2
+        assert quotes[("1.0", "token1", "token2")][0].quote_id == "quote_12345"
+    
+    def test_bulk_lookups_empty(self, client):
+        """Test that empty inputs return empty dicts without requests."""
+        assert client.get_statuses([]) == {}
+        assert client.get_min_maxes([]) == {}
+        assert client.get_dex_quotes([]) == {}
 
 
 class TestClearCache:
@@ -213,6 +512,20 @@ class TestClearCache:
             # Clear cache
             client.clear_cache()
             assert len(client._token_cache) == 0
+    
+    def test_cache_stats(self, client, sample_token_data):
+        """Test that cache_stats reports hits and misses per endpoint."""
+        client.cache_enabled = True
+        
+        with patch('houdiniswap.client.HoudiniSwapClient._request', return_value=[sample_token_data]):
+            client.get_cex_tokens()
+            client.get_cex_tokens()
+            client.clear_cache()
+            client.get_cex_tokens()
+        
+        stats = client.cache_stats()
+        assert stats["groups"]["cex_tokens"] == {"hits": 1, "misses": 2, "hit_ratio": pytest.approx(1 / 3)}
+        assert stats["size"] == 1
 
 
 class TestExchangeBuilder:
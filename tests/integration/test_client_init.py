@@ -25,6 +25,13 @@ class TestClientInitialization:
         client = HoudiniSwapClient(api_key, api_secret, base_url=custom_url)
         assert client.base_url == custom_url
     
+    def test_init_precomputes_endpoint_urls(self, api_key, api_secret):
+        """Test that endpoint URLs are resolved against base_url at init."""
+        custom_url = "https://custom-api.example.com"
+        client = HoudiniSwapClient(api_key, api_secret, base_url=custom_url)
+        assert client._url_cache["/status"] == "https://custom-api.example.com/status"
+        assert client._url_cache["/dexTokens"] == "https://custom-api.example.com/dexTokens"
+    
     def test_init_with_env_var_base_url(self, api_key, api_secret):
         """Test initializing client with base URL from environment variable."""
         env_url = "https://env-api.example.com"
@@ -58,6 +65,21 @@ class TestClientInitialization:
         assert client.max_retries == 5
         assert client.retry_backoff_factor == 2.0
     
+    def test_init_with_pool_maxsize(self, api_key, api_secret):
+        """Test that pool_maxsize sizes the session's connection pool."""
+        client = HoudiniSwapClient(api_key, api_secret)
+        assert client.pool_maxsize == 20
+        client = HoudiniSwapClient(api_key, api_secret, pool_maxsize=64)
+        assert client.pool_maxsize == 64
+        adapter = client.session.get_adapter("https://api-partner.houdiniswap.com")
+        assert adapter._pool_maxsize == 64
+    
+    def test_init_with_request_compression(self, api_key, api_secret):
+        """Test that request body compression is opt-in."""
+        assert HoudiniSwapClient(api_key, api_secret).request_compression is False
+        client = HoudiniSwapClient(api_key, api_secret, request_compression=True)
+        assert client.request_compression is True
+    
     def test_init_with_caching(self, api_key, api_secret):
         """Test initializing client with caching enabled."""
         client = HoudiniSwapClient(
@@ -69,6 +91,15 @@ class TestClientInitialization:
         assert client.cache_enabled is True
         assert client.cache_ttl == 600
     
+    def test_init_with_quote_caching(self, api_key, api_secret):
+        """Test that the quote cache is opt-in with a short default TTL."""
+        client = HoudiniSwapClient(api_key, api_secret)
+        assert client.quote_cache_enabled is False
+        assert client.quote_cache_ttl == 10
+        client = HoudiniSwapClient(api_key, api_secret, quote_cache_enabled=True, quote_cache_ttl=5)
+        assert client.quote_cache_enabled is True
+        assert client.quote_cache_ttl == 5
+    
     def test_init_with_logging(self, api_key, api_secret):
         """Test initializing client with logging."""
         import logging
@@ -96,6 +127,9 @@ class TestClientInitialization:
             _ = client.api_key
         with pytest.raises(AttributeError, match="has no attribute 'api_secret'"):
             _ = client.api_secret
+        assert not hasattr(client, 'api_key')
+        with pytest.raises(AttributeError):
+            client.api_key = "new_key"  # No slot for public credential names
     
     def test_repr(self, client):
         """Test client string representation."""
@@ -119,6 +153,15 @@ class TestClientInitialization:
         client.close()
         assert client.session.closed
     
+    def test_close_idempotent(self, client):
+        """Test that closing twice only closes the session once."""
+        assert client._closed is False
+        with patch.object(client.session, 'close') as mock_close:
+            client.close()
+            client.close()
+            mock_close.assert_called_once()
+        assert client._closed is True
+    
     def test_session_headers(self, client):
         """Test that session headers are set correctly."""
         assert "Authorization" in client.session.headers
@@ -127,6 +170,14 @@ class TestClientInitialization:
         # Authorization should contain credentials (but we can't check exact value)
         auth_header = client.session.headers["Authorization"]
         assert ":" in auth_header  # Format: key:secret
+        assert auth_header is client._auth_header  # Built once in __init__
+    
+    def test_session_accepts_compressed_json(self, client):
+        """Test that the session asks for compressed JSON responses."""
+        assert client.session.headers["Accept"] == "application/json"
+        accept_encoding = client.session.headers["Accept-Encoding"]
+        assert "gzip" in accept_encoding
+        assert "deflate" in accept_encoding
     
     def test_session_ssl_verification(self, api_key, api_secret):
         """Test that session SSL verification is set correctly."""
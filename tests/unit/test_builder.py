@@ -29,6 +29,12 @@ class TestExchangeBuilder:
         assert builder._exchange_type is None
         assert builder._amount is None
     
+    def test_uses_slots(self, builder):
+        """Test that builder instances have no per-instance __dict__."""
+        assert not hasattr(builder, "__dict__")
+        with pytest.raises(AttributeError):
+            builder.unknown_field = "value"
+    
     def test_cex(self, builder):
         """Test setting exchange type to CEX."""
         result = builder.cex()
@@ -252,6 +258,21 @@ class TestExchangeBuilder:
         assert call_kwargs["token_id_to"] == "token2"
         assert call_kwargs["swap"] == "sw"
     
+    def test_execute_sanitizes_fields(self, builder, mock_client):
+        """Test that string fields are sanitized when executing."""
+        mock_client.post_cex_exchange.return_value = MagicMock()
+        
+        builder.cex().amount(1.0).from_token(" ETH ").to_token("BNB ") \
+            .address_to(" 0x123").wallet_id(" wallet123 ")
+        builder.execute()
+        
+        call_kwargs = mock_client.post_cex_exchange.call_args[1]
+        assert call_kwargs["from_token"] == "ETH"
+        assert call_kwargs["to_token"] == "BNB"
+        assert call_kwargs["address_to"] == "0x123"
+        assert call_kwargs["wallet_id"] == "wallet123"
+        assert call_kwargs["receiver_tag"] is None
+    
     def test_execute_no_exchange_type_raises(self, builder):
         """Test that execute without exchange type raises ValidationError."""
         builder.amount(1.0).from_token("ETH").to_token("BNB").address_to("0x123")
@@ -0,0 +1,229 @@
+"""Unit tests for the TTL cache."""
+
+import threading
+import pytest
+from unittest.mock import patch
+from houdiniswap.cache import TTLCache
+
+
+class TestTTLCache:
+    """Tests for TTLCache."""
+    
+    def test_get_missing_returns_default(self):
+        """Test that a missing key returns the default."""
+        cache = TTLCache()
+        assert cache.get("missing") is None
+        assert cache.get("missing", "fallback") == "fallback"
+    
+    def test_set_and_get(self):
+        """Test that a stored value is returned before it expires."""
+        cache = TTLCache()
+        cache.set("key", [1, 2], ttl=60)
+        assert cache.get("key") == [1, 2]
+        assert "key" in cache
+        assert len(cache) == 1
+    
+    def test_entry_expires(self):
+        """Test that entries expire based on the monotonic clock."""
+        cache = TTLCache()
+        with patch('houdiniswap.cache.time.monotonic', return_value=100.0):
+            cache.set("key", "value", ttl=10)
+        with patch('houdiniswap.cache.time.monotonic', return_value=109.9):
+            assert cache.get("key") == "value"
+        with patch('houdiniswap.cache.time.monotonic', return_value=110.0):
+            assert cache.get("key") is None
+        assert len(cache) == 0  # Expired entry removed on access
+    
+    def test_clear(self):
+        """Test that clear removes all entries."""
+        cache = TTLCache()
+        cache.set("a", 1, ttl=60)
+        cache.set("b", 2, ttl=60)
+        cache.clear()
+        assert len(cache) == 0
+        assert "a" not in cache
+    
+    def test_clear_group(self):
+        """Test that clear(group) only removes keys in that group."""
+        cache = TTLCache()
+        cache.set(("dex_tokens", 1), "page1", ttl=60)
+        cache.set(("dex_tokens", 2), "page2", ttl=60)
+        cache.set(("cex_tokens",), "tokens", ttl=60)
+        cache.clear("dex_tokens")
+        assert len(cache) == 1
+        assert ("cex_tokens",) in cache
+    
+    def test_maxsize_evicts_soonest_to_expire(self):
+        """Test that inserts beyond maxsize evict the entry closest to expiry."""
+        cache = TTLCache(maxsize=2)
+        with patch('houdiniswap.cache.time.monotonic', return_value=100.0):
+            cache.set("short", 1, ttl=10)
+            cache.set("long", 2, ttl=60)
+            cache.get("short")  # Recently used, but still expires first
+            cache.set("new", 3, ttl=60)
+            assert len(cache) == 2
+            assert "short" not in cache
+            assert cache.get("long") == 2
+            assert cache.get("new") == 3
+        assert cache.stats()["evictions"] == 1
+    
+    def test_maxsize_equal_ttl_evicts_least_recently_used(self):
+        """Test that entries expiring together are evicted in LRU order."""
+        cache = TTLCache(maxsize=2)
+        with patch('houdiniswap.cache.time.monotonic', return_value=100.0):
+            cache.set("a", 1, ttl=60)
+            cache.set("b", 2, ttl=60)
+            cache.get("a")  # "b" is now least recently used
+            cache.set("c", 3, ttl=60)
+            assert "b" not in cache
+            assert cache.get("a") == 1
+            assert cache.get("c") == 3
+    
+    def test_maxsize_purges_expired_first(self):
+        """Test that expired entries are dropped before live ones are evicted."""
+        cache = TTLCache(maxsize=2)
+        with patch('houdiniswap.cache.time.monotonic', return_value=100.0):
+            cache.set("live", 1, ttl=60)
+            cache.set("stale", 2, ttl=1)
+        with patch('houdiniswap.cache.time.monotonic', return_value=105.0):
+            cache.set("new", 3, ttl=60)
+            assert cache.get("live") == 1
+            assert cache.get("new") == 3
+            assert "stale" not in cache
+    
+    def test_overwrite_does_not_evict(self):
+        """Test that updating an existing key at capacity keeps other entries."""
+        cache = TTLCache(maxsize=2)
+        cache.set("a", 1, ttl=60)
+        cache.set("b", 2, ttl=60)
+        cache.set("a", 10, ttl=60)
+        assert cache.get("a") == 10
+        assert cache.get("b") == 2
+    
+    def test_stats_counts_hits_and_misses_per_group(self):
+        """Test that stats() reports hit/miss counters grouped by key prefix."""
+        cache = TTLCache(maxsize=4)
+        cache.get(("dex_tokens", 1))
+        cache.set(("dex_tokens", 1), "page1", ttl=60)
+        cache.get(("dex_tokens", 1))
+        cache.get(("dex_tokens", 2))
+        cache.get_or_load(("cex_tokens",), lambda: [], ttl=60)
+        cache.get_or_load(("cex_tokens",), lambda: [], ttl=60)
+        assert "plain" not in cache  # Membership checks are not counted
+        
+        stats = cache.stats()
+        assert stats["size"] == 2
+        assert stats["maxsize"] == 4
+        assert stats["hits"] == 2
+        assert stats["misses"] == 3
+        assert stats["hit_ratio"] == pytest.approx(0.4)
+        assert stats["groups"]["dex_tokens"] == {"hits": 1, "misses": 2, "hit_ratio": pytest.approx(1 / 3)}
+        assert stats["groups"]["cex_tokens"] == {"hits": 1, "misses": 1, "hit_ratio": 0.5}
+    
+    def test_stats_empty(self):
+        """Test stats() on an unused cache."""
+        stats = TTLCache().stats()
+        assert stats["hits"] == stats["misses"] == stats["evictions"] == 0
+        assert stats["hit_ratio"] == 0.0
+        assert stats["groups"] == {}
+    
+    def test_invalid_maxsize_raises(self):
+        """Test that a non-positive maxsize is rejected."""
+        with pytest.raises(ValueError, match="maxsize must be >= 1"):
+            TTLCache(maxsize=0)
+    
+    def test_get_or_load_caches_result(self):
+        """Test that get_or_load calls the loader once and then serves the cache."""
+        cache = TTLCache()
+        calls = []
+        
+        def loader():
+            calls.append(1)
+            return "value"
+        
+        assert cache.get_or_load("key", loader, ttl=60) == "value"
+        assert cache.get_or_load("key", loader, ttl=60) == "value"
+        assert len(calls) == 1
+    
+    def test_get_or_load_coalesces_concurrent_misses(self):
+        """Test that concurrent misses for one key share a single loader call."""
+        cache = TTLCache()
+        started = threading.Event()
+        release = threading.Event()
+        calls = []
+        
+        def loader():
+            calls.append(1)
+            started.set()
+            release.wait(5)
+            return "value"
+        
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(cache.get_or_load("key", loader, ttl=60)))
+            for _ in range(5)
+        ]
+        threads[0].start()
+        started.wait(5)
+        for t in threads[1:]:
+            t.start()
+        release.set()
+        for t in threads:
+            t.join()
+        
+        assert len(calls) == 1
+        assert results == ["value"] * 5
+    
+    def test_get_or_load_propagates_errors_without_caching(self):
+        """Test that loader errors are raised and nothing is cached."""
+        cache = TTLCache()
+        
+        def loader():
+            raise RuntimeError("boom")
+        
+        with pytest.raises(RuntimeError, match="boom"):
+            cache.get_or_load("key", loader, ttl=60)
+        assert "key" not in cache
+        assert cache.get_or_load("key", lambda: "ok", ttl=60) == "ok"
+    
+    @pytest.mark.parametrize("group", [None, "tokens"])
+    def test_clear_during_load_does_not_cache_stale_value(self, group):
+        """Test that a load in flight when its key is cleared is returned but not cached."""
+        cache = TTLCache()
+        key = ("tokens", 1)
+        started = threading.Event()
+        release = threading.Event()
+        
+        def loader():
+            started.set()
+            release.wait(5)
+            return "stale"
+        
+        results = []
+        thread = threading.Thread(target=lambda: results.append(cache.get_or_load(key, loader, ttl=60)))
+        thread.start()
+        assert started.wait(5)
+        cache.clear(group)
+        # A load started after clear() runs its own loader instead of joining the stale one
+        assert cache.get_or_load(key, lambda: "fresh", ttl=60) == "fresh"
+        release.set()
+        thread.join(5)
+        
+        assert results == ["stale"]
+        assert cache.get(key) == "fresh"
+    
+    def test_concurrent_access(self):
+        """Test that concurrent writers and readers do not corrupt the cache."""
+        cache = TTLCache(maxsize=8 * 200)
+        
+        def worker(n):
+            for i in range(200):
+                cache.set((n, i), i, ttl=60)
+                assert cache.get((n, i)) == i
+        
+        threads = [threading.Thread(target=worker, args=(n,)) for n in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert len(cache) == 8 * 200
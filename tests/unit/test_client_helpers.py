@@ -39,6 +39,13 @@ class TestClientValidation:
         with pytest.raises(ValidationError):
             client._validate_credentials(api_key, "   ")
     
+    def test_validate_credentials_internal_whitespace_allowed(self, api_key, api_secret):
+        """Test that credentials outside the fast-path pattern still pass the full checks."""
+        client = HoudiniSwapClient(api_key, api_secret)
+        # Should not raise
+        client._validate_credentials("key with spaces", api_secret)
+        client._validate_credentials(api_key, "x" * 1000)
+    
     def test_sanitize_input_valid(self, client):
         """Test sanitizing valid input."""
         result = client._sanitize_input("valid_input", "field")
@@ -70,6 +77,24 @@ class TestClientValidation:
             with pytest.raises(ValidationError, match="invalid characters"):
                 client._sanitize_input(f"input{char}test", "field")
     
+    def test_sanitize_input_cached(self, client):
+        """Test that repeated short inputs are served from the sanitize cache."""
+        from houdiniswap.client import _sanitize_string
+        client._sanitize_input(" cached_input ", "field")
+        hits = _sanitize_string.cache_info().hits
+        assert client._sanitize_input(" cached_input ", "field") == "cached_input"
+        assert _sanitize_string.cache_info().hits == hits + 1
+    
+    def test_sanitize_input_long_value_not_cached(self, client):
+        """Test that long inputs bypass the sanitize cache."""
+        from houdiniswap.client import _sanitize_string
+        long_value = "x" * 500
+        size = _sanitize_string.cache_info().currsize
+        assert client._sanitize_input(long_value, "field") == long_value
+        assert _sanitize_string.cache_info().currsize == size
+        with pytest.raises(ValidationError, match="invalid characters"):
+            client._sanitize_input(long_value + "\n" + long_value, "field")
+    
     def test_validate_amount_positive(self, client):
         """Test validating positive amounts."""
         client._validate_amount(1.0, "amount")
@@ -149,11 +174,32 @@ class TestClientValidation:
         with pytest.raises(ValidationError, match="valid hexadecimal string"):
             client._validate_hex_string("0xGHIJKL", "hex_string")
     
+    def test_validate_hex_string_long_and_odd_length(self, client):
+        """Test validating long and odd-length hex payloads."""
+        client._validate_hex_string("0x" + "ab" * 5000, "hex_string")
+        client._validate_hex_string("0xabc", "hex_string")
+    
+    def test_validate_hex_string_rejects_non_hex_separators(self, client):
+        """Test that prefix-only, spaced, or underscored values are rejected."""
+        for value in ("0x", "ab cd", "ab_cd", "-abcd"):
+            with pytest.raises(ValidationError, match="valid hexadecimal string"):
+                client._validate_hex_string(value, "hex_string")
+    
     def test_validate_houdini_id_valid(self, client):
         """Test validating valid houdini IDs."""
         client._validate_houdini_id("h9NpKm75gRnX7GWaFATwYn")
         client._validate_houdini_id("test_123-abc")
     
+    def test_validate_houdini_id_cached(self, client):
+        """Test that repeated houdini ID validation is served from the cache."""
+        from houdiniswap.client import _check_houdini_id
+        client._validate_houdini_id("cachedHoudiniId123")
+        hits = _check_houdini_id.cache_info().hits
+        client._validate_houdini_id("cachedHoudiniId123")
+        assert _check_houdini_id.cache_info().hits == hits + 1
+        with pytest.raises(ValidationError, match="must be a string"):
+            client._validate_houdini_id(None)
+    
     def test_validate_houdini_id_too_short_raises(self, client):
         """Test that too short houdini ID raises ValidationError."""
         with pytest.raises(ValidationError, match="between 10 and 50 characters"):
@@ -195,6 +241,22 @@ class TestClientValidation:
         # Invalid format for Ethereum
         with pytest.raises(ValidationError):
             client._validate_address("invalid_address", network=network, field_name="address")
+    
+    def test_validate_address_regex_compiled_once(self, client, sample_network_data):
+        """Test that a network's address regex is compiled once and reused."""
+        from houdiniswap.client import _compile_address_pattern
+        from houdiniswap.models import Network
+        network = Network.from_dict(sample_network_data)
+        client._validate_address("0x1234567890123456789012345678901234567890", network=network)
+        hits = _compile_address_pattern.cache_info().hits
+        client._validate_address("0xabcdefabcdefabcdefabcdefabcdefabcdefabcd", network=network)
+        assert _compile_address_pattern.cache_info().hits == hits + 1
+    
+    def test_validate_address_invalid_network_regex_skipped(self, client, sample_network_data):
+        """Test that an invalid network regex skips format validation."""
+        from houdiniswap.models import Network
+        network = Network.from_dict({**sample_network_data, "addressValidation": "[unclosed"})
+        client._validate_address("any_address_value", network=network)
 
 
 class TestClientNormalization:
@@ -250,6 +312,25 @@ class TestClientNormalization:
             client._normalize_amount_to_decimal("invalid")
         with pytest.raises(ValidationError, match="must be str, Decimal, or number"):
             client._normalize_amount_to_decimal(None)
+    
+    @pytest.mark.parametrize("amount", [
+        "NaN", "sNaN", "Infinity", "-Infinity", Decimal("NaN"), Decimal("sNaN"),
+        Decimal("Infinity"), float("nan"), float("inf"),
+    ])
+    def test_normalize_amount_rejects_non_finite(self, client, amount):
+        """Test that NaN and infinite amounts raise ValidationError."""
+        with pytest.raises(ValidationError, match="valid number"):
+            client._normalize_amount(amount)
+        with pytest.raises(ValidationError, match="valid number"):
+            client._normalize_amount_to_decimal(amount)
+    
+    def test_normalize_amount_subclass(self, client):
+        """Test that subclasses of supported types use their base normalizer."""
+        class Amount(str):
+            pass
+        
+        assert client._normalize_amount(Amount("2.5")) == "2.5"
+        assert client._normalize_amount_to_decimal(Amount("2.5")) == Decimal("2.5")
 
 
 class TestClientRedaction:
@@ -4,8 +4,10 @@ import os
 import json
 import pytest
 import tempfile
+from collections.abc import Mapping
 from pathlib import Path
-from houdiniswap.config import Config
+from unittest.mock import patch
+from houdiniswap.config import Config, _default_config_paths
 
 
 class TestConfig:
@@ -71,13 +73,182 @@ class TestConfig:
         """Test getting all config values."""
         config = Config()
         all_config = config.get_all()
-        assert isinstance(all_config, dict)
+        assert isinstance(all_config, Mapping)
         assert "base_url" in all_config
         assert "timeout" in all_config
     
+    def test_config_get_all_read_only(self):
+        """Test that get_all() returns a shared read-only view."""
+        config = Config()
+        all_config = config.get_all()
+        assert config.get_all() is all_config
+        with pytest.raises(TypeError):
+            all_config["timeout"] = 1
+        assert dict(all_config)["timeout"] == config.get("timeout")
+    
+    def test_config_get_all_after_reload(self):
+        """Test that get_all() reflects values loaded by a reload."""
+        config = Config()
+        assert config.get_all()["timeout"] == 30
+        with patch.dict(os.environ, {"HOUDINI_SWAP_TIMEOUT": "45"}):
+            config._load_config()
+        assert config.get_all()["timeout"] == 45
+        assert json.loads(json.dumps(dict(config.get_all())))["timeout"] == 45
+    
     def test_config_load_classmethod(self):
         """Test Config.load() class method."""
         config = Config.load()
         assert isinstance(config, Config)
         assert config.get("base_url") is not None
 
+    
+    def test_config_file_parsed_once(self, tmp_path):
+        """Test that an unchanged config file is parsed only once."""
+        config_file = tmp_path / "houdiniswap.json"
+        config_file.write_text(json.dumps({"prod": {"timeout": 45}}))
+        
+        with patch("houdiniswap.config._json_loads", wraps=json.loads) as mock_load:
+            first = Config(profile="prod", config_file=str(config_file))
+            second = Config(profile="prod", config_file=str(config_file))
+        assert mock_load.call_count == 1
+        assert first.get("timeout") == second.get("timeout") == 45
+    
+    def test_config_file_reparsed_when_modified(self, tmp_path):
+        """Test that the parsed-file cache is invalidated by a new mtime."""
+        config_file = tmp_path / "houdiniswap.json"
+        config_file.write_text(json.dumps({"prod": {"timeout": 45}}))
+        assert Config(config_file=str(config_file)).get("timeout") == 45
+        
+        config_file.write_text(json.dumps({"prod": {"timeout": 90}}))
+        mtime_ns = config_file.stat().st_mtime_ns + 1_000_000_000
+        os.utime(config_file, ns=(mtime_ns, mtime_ns))
+        assert Config(config_file=str(config_file)).get("timeout") == 90
+    
+    def test_config_file_reparsed_when_size_changes_within_same_mtime(self, tmp_path):
+        """Test that a rewrite keeping the same mtime is still detected by size."""
+        config_file = tmp_path / "houdiniswap.json"
+        config_file.write_text(json.dumps({"prod": {"timeout": 45}}))
+        mtime_ns = config_file.stat().st_mtime_ns
+        assert Config(config_file=str(config_file)).get("timeout") == 45
+        
+        config_file.write_text(json.dumps({"prod": {"timeout": 120}}))
+        os.utime(config_file, ns=(mtime_ns, mtime_ns))
+        assert Config(config_file=str(config_file)).get("timeout") == 120
+    
+    def test_config_missing_file_ignored(self, tmp_path):
+        """Test that a missing config file falls back to defaults."""
+        config = Config(config_file=str(tmp_path / "missing.json"))
+        assert config.get("timeout") == 30
+    
+    def test_default_config_paths(self):
+        """Test the default search order: cwd, dotfiles in cwd, then home."""
+        paths = _default_config_paths()
+        assert len(paths) == 12
+        assert paths[0] == "houdiniswap.json"
+        assert paths[4] == ".houdiniswap.json"
+        assert paths[8] == os.path.expanduser("~/.houdiniswap.json")
+        assert paths[-1] == os.path.expanduser("~/.houdiniswap.toml")
+    
+    def test_default_config_paths_class_attribute(self, tmp_path, monkeypatch):
+        """Test that Config.DEFAULT_CONFIG_PATHS is still a list and still honoured."""
+        assert Config.DEFAULT_CONFIG_PATHS == list(_default_config_paths())
+        assert Config().DEFAULT_CONFIG_PATHS is Config.DEFAULT_CONFIG_PATHS
+        
+        config_file = tmp_path / "custom.json"
+        config_file.write_text(json.dumps({"prod": {"timeout": 50}}))
+        monkeypatch.delenv("HOUDINI_SWAP_TIMEOUT", raising=False)
+        monkeypatch.setattr(Config, "DEFAULT_CONFIG_PATHS", [str(config_file)])
+        assert Config(profile="prod").get("timeout") == 50
+    
+    def test_explicit_config_file_skips_home_lookup(self, tmp_path):
+        """Test that an explicit config_file never resolves the home directory."""
+        config_file = tmp_path / "houdiniswap.json"
+        config_file.write_text(json.dumps({"prod": {"timeout": 45}}))
+        
+        with patch("houdiniswap.config._default_config_paths") as mock_paths:
+            config = Config(profile="prod", config_file=str(config_file))
+        mock_paths.assert_not_called()
+        assert config.get("timeout") == 45
+    
+    def test_config_env_converts_types(self, monkeypatch):
+        """Test that environment overrides are converted to the setting's type."""
+        monkeypatch.setenv("HOUDINI_SWAP_VERIFY_SSL", "FALSE")
+        monkeypatch.setenv("HOUDINI_SWAP_RETRY_BACKOFF_FACTOR", "0.5")
+        monkeypatch.setenv("HOUDINI_SWAP_CACHE_ENABLED", "True")
+        config = Config()
+        assert config.get("verify_ssl") is False
+        assert config.get("retry_backoff_factor") == 0.5
+        assert config.get("cache_enabled") is True
+    
+    def test_config_file_overrides_defaults(self, tmp_path, monkeypatch):
+        """Test that file values apply when no environment override is set."""
+        monkeypatch.delenv("HOUDINI_SWAP_CACHE_TTL", raising=False)
+        config_file = tmp_path / "houdiniswap.json"
+        config_file.write_text(json.dumps({"global": {"cache_ttl": 60}}))
+        config = Config(config_file=str(config_file))
+        assert config.get("cache_ttl") == 60
+        assert config.get("max_retries") == 3
+    
+    def test_config_from_yaml_file(self, tmp_path):
+        """Test loading config from YAML file."""
+        pytest.importorskip("yaml")
+        config_file = tmp_path / "houdiniswap.yaml"
+        config_file.write_text("prod:\n  base_url: https://yaml.example.com\n  timeout: 15\n")
+        
+        config = Config(profile="prod", config_file=str(config_file))
+        assert config.get("base_url") == "https://yaml.example.com"
+        assert config.get("timeout") == 15
+    
+    def test_config_yaml_is_safe_loaded(self, tmp_path):
+        """Test that YAML files cannot construct arbitrary Python objects."""
+        pytest.importorskip("yaml")
+        config_file = tmp_path / "houdiniswap.yaml"
+        config_file.write_text("prod: !!python/object/apply:os.getcwd []\n")
+        
+        config = Config(profile="prod", config_file=str(config_file))
+        assert config.get("timeout") == 30
+    
+    def test_config_from_toml_file(self, tmp_path):
+        """Test loading config from TOML file."""
+        try:
+            import tomllib  # noqa: F401
+        except ImportError:
+            pytest.importorskip("tomli")
+        config_file = tmp_path / "houdiniswap.toml"
+        config_file.write_text('[prod]\nbase_url = "https://toml.example.com"\ntimeout = 20\n')
+        
+        config = Config(profile="prod", config_file=str(config_file))
+        assert config.get("base_url") == "https://toml.example.com"
+        assert config.get("timeout") == 20
+    
+    def test_unsupported_suffix_ignored(self, tmp_path):
+        """Test that files with an unknown extension are skipped."""
+        config_file = tmp_path / "houdiniswap.ini"
+        config_file.write_text("[prod]\ntimeout = 20\n")
+        config = Config(profile="prod", config_file=str(config_file))
+        assert config.get("timeout") == 30
+    
+    def test_config_json_without_orjson(self, tmp_path):
+        """Test that JSON config files load with the stdlib parser."""
+        config_file = tmp_path / "houdiniswap.json"
+        config_file.write_text(json.dumps({"prod": {"base_url": "https://stdlib.example.com"}}))
+        
+        with patch("houdiniswap.config._json_loads", json.loads):
+            config = Config(profile="prod", config_file=str(config_file))
+        assert config.get("base_url") == "https://stdlib.example.com"
+    
+    @pytest.mark.parametrize("value,expected", [
+        ("true", True),
+        ("TRUE", True),
+        ("tRuE", True),
+        ("1", True),
+        ("yes", True),
+        ("On", True),
+        ("false", False),
+        ("0", False),
+        ("", False),
+    ])
+    def test_config_env_bool_values(self, monkeypatch, value, expected):
+        """Test the accepted spellings of boolean environment variables."""
+        monkeypatch.setenv("HOUDINI_SWAP_CACHE_ENABLED", value)
+        assert Config().get("cache_enabled") is expected
@@ -26,6 +26,19 @@ class TestConstants:
         assert constants.DEFAULT_MAX_RETRIES == 3
         assert constants.DEFAULT_RETRY_BACKOFF_FACTOR == 1.0
         assert constants.DEFAULT_CACHE_TTL == 300
+        assert constants.DEFAULT_CACHE_MAXSIZE == 256
+        assert constants.DEFAULT_MIN_MAX_CACHE_TTL == 30
+        assert constants.DEFAULT_VOLUME_CACHE_TTL == 60
+        assert constants.DEFAULT_WEEKLY_VOLUME_CACHE_TTL == 300
+        assert constants.DEFAULT_QUOTE_CACHE_TTL == 10
+        assert constants.DEFAULT_QUOTE_CACHE_MAXSIZE == 64
+        assert constants.DEFAULT_MAX_POLL_INTERVAL == 30
+        assert constants.DEFAULT_POOL_CONNECTIONS == 10
+        assert constants.DEFAULT_POOL_MAXSIZE == 20
+        assert constants.MAX_CREDENTIAL_LENGTH == 1000
+        assert constants.REQUEST_COMPRESSION_MIN_SIZE == 1024
+        assert constants.DEFAULT_BREAKER_THRESHOLD == 5
+        assert constants.DEFAULT_BREAKER_COOLDOWN == 30
     
     def test_base_url(self):
         """Test base URL constant."""
@@ -64,6 +77,7 @@ class TestConstants:
         assert isinstance(constants.ERROR_UNEXPECTED, str)
         assert "{}" in constants.ERROR_NETWORK  # Format string
         assert "{}" in constants.ERROR_UNEXPECTED  # Format string
+        assert "{}" in constants.ERROR_CIRCUIT_OPEN  # Format string
     
     def test_api_versioning(self):
         """Test API versioning constants."""
@@ -8,6 +8,7 @@ from houdiniswap.exceptions import (
     APIError,
     ValidationError,
     NetworkError,
+    CircuitOpenError,
 )
 
 
@@ -119,3 +120,19 @@ class TestNetworkError:
         """Test NetworkError with detailed message."""
         error = NetworkError("Network error: Connection refused")
         assert "Connection refused" in str(error)
+
+
+class TestCircuitOpenError:
+    """Tests for CircuitOpenError."""
+    
+    def test_inheritance(self):
+        """Test that CircuitOpenError is a NetworkError."""
+        error = CircuitOpenError("Circuit open")
+        assert isinstance(error, NetworkError)
+    
+    def test_attributes(self):
+        """Test endpoint and retry_after attributes."""
+        error = CircuitOpenError("Circuit open", endpoint="/status", retry_after=12.5)
+        assert error.endpoint == "/status"
+        assert error.retry_after == 12.5
+        assert str(error) == "Circuit open"
@@ -1,5 +1,10 @@
 """Unit tests for model classes."""
 
+import copy
+import dataclasses
+import pickle
+import sys
+
 import pytest
 from decimal import Decimal
 from typing import Dict, Any
@@ -18,6 +23,7 @@ from houdiniswap.models import (
     Volume,
     WeeklyVolume,
     DEXTokensResponse,
+    LazyModelList,
     TransactionStatus,
 )
 from houdiniswap.exceptions import ValidationError
@@ -162,6 +168,23 @@ class TestDEXToken:
         assert token.created is None
         assert token.enabled is None
     
+    def test_from_dict_maps_fields_in_order(self, sample_dex_token_data):
+        """Test that complete rows map every key to the matching field."""
+        data = {**sample_dex_token_data, "enabled": False, "extra": "ignored"}
+        token = DEXToken.from_dict(data)
+        assert token == DEXToken(
+            id="6689b73ec90e45f3b3e51553",
+            address="0x1234567890123456789012345678901234567890",
+            chain="base",
+            decimals=18,
+            symbol="USDC",
+            name="USD Coin",
+            created="2024-01-01T00:00:00Z",
+            modified="2024-01-01T00:00:00Z",
+            enabled=False,
+            has_dex=True,
+        )
+    
     def test_repr(self, sample_dex_token_data):
         """Test DEXToken string representation."""
         token = DEXToken.from_dict(sample_dex_token_data)
@@ -169,6 +192,14 @@ class TestDEXToken:
         assert "DEXToken" in repr_str
         assert "USDC" in repr_str
         assert "base" in repr_str
+    
+    @pytest.mark.skipif(sys.version_info < (3, 10), reason="dataclass slots require Python 3.10+")
+    def test_uses_slots(self, sample_dex_token_data):
+        """Test that DEXToken instances have no per-instance __dict__."""
+        token = DEXToken.from_dict(sample_dex_token_data)
+        assert not hasattr(token, "__dict__")
+        with pytest.raises(AttributeError):
+            token.symbol = "ETH"
 
 
 class TestRouteDTO:
@@ -423,6 +454,13 @@ class TestStatus:
         with pytest.raises(ValidationError, match="Invalid transaction status code"):
             Status.from_dict(data)
     
+    @pytest.mark.parametrize("status_code", ["4", None, [4]])
+    def test_from_dict_non_integer_status_code(self, status_code):
+        """Test that non-integer status codes raise ValidationError."""
+        data = {"houdiniId": "test", "status": status_code}
+        with pytest.raises(ValidationError, match="Invalid transaction status code"):
+            Status.from_dict(data)
+    
     def test_from_dict_missing_required_field(self):
         """Test that missing required fields raise ValidationError."""
         data = {"status": 0}  # Missing houdiniId
@@ -469,6 +507,14 @@ class TestMinMax:
         """Test that insufficient elements raise ValueError."""
         with pytest.raises(ValueError, match="requires at least 2 elements"):
             MinMax.from_list([0.01])
+        with pytest.raises(ValueError, match="requires at least 2 elements"):
+            MinMax.from_list([])
+    
+    def test_from_list_ignores_extra_elements(self):
+        """Test that elements after min and max are ignored."""
+        min_max = MinMax.from_list([1, 2, 3])
+        assert min_max.min == Decimal("1")
+        assert min_max.max == Decimal("2")
     
     def test_repr(self, sample_min_max_data):
         """Test MinMax string representation."""
@@ -551,3 +597,71 @@ class TestDEXTokensResponse:
         repr_str = repr(response)
         assert "DEXTokensResponse" in repr_str
         assert "1" in repr_str
+
+
+class TestLazyModelList:
+    """Tests for LazyModelList."""
+    
+    def test_builds_items_on_first_access(self, sample_dex_token_data):
+        """Test that models are built lazily and memoized."""
+        calls = []
+        
+        def factory(data):
+            calls.append(data)
+            return DEXToken.from_dict(data)
+        
+        tokens = LazyModelList([sample_dex_token_data] * 3, factory)
+        assert len(tokens) == 3
+        assert calls == []
+        assert tokens[1] is tokens[1]
+        assert len(calls) == 1
+        assert [t.symbol for t in tokens] == ["USDC"] * 3
+        assert len(calls) == 3
+        assert tokens[-1].symbol == "USDC"
+        assert len(tokens[:2]) == 2
+    
+    def test_equality_with_list(self, sample_dex_token_data):
+        """Test that a LazyModelList compares equal to the eager list."""
+        raw = [sample_dex_token_data, {**sample_dex_token_data, "id": "other"}]
+        lazy = LazyModelList(raw, DEXToken.from_dict)
+        assert lazy == [DEXToken.from_dict(item) for item in raw]
+        assert lazy != [DEXToken.from_dict(raw[0])]
+        assert LazyModelList([], DEXToken.from_dict) == []
+    
+    def test_index_error(self):
+        """Test that out-of-range indexes raise IndexError."""
+        with pytest.raises(IndexError):
+            LazyModelList([], DEXToken.from_dict)[0]
+    
+    def test_pickle_round_trip(self, sample_dex_token_data):
+        """Test that responses holding a LazyModelList can be pickled."""
+        tokens = LazyModelList([sample_dex_token_data] * 2, DEXToken.from_dict)
+        response = DEXTokensResponse(count=2, tokens=tokens)
+        restored = pickle.loads(pickle.dumps(response))
+        assert restored == response
+        assert isinstance(restored.tokens, LazyModelList)
+        assert restored.tokens[0].symbol == "USDC"
+    
+    def test_deepcopy(self, sample_dex_token_data):
+        """Test that deepcopy builds an independent list with its own lock."""
+        tokens = LazyModelList([sample_dex_token_data], DEXToken.from_dict)
+        copied = copy.deepcopy(tokens)
+        assert copied == tokens
+        assert copied._lock is not tokens._lock
+    
+    def test_asdict_on_response(self, sample_dex_token_data):
+        """Test that dataclasses.asdict works on a response with lazy tokens."""
+        tokens = LazyModelList([sample_dex_token_data], DEXToken.from_dict)
+        result = dataclasses.asdict(DEXTokensResponse(count=1, tokens=tokens))
+        assert result["count"] == 1
+        assert list(result["tokens"]) == [DEXToken.from_dict(sample_dex_token_data)]
+    
+    def test_concatenation_with_lists(self, sample_dex_token_data):
+        """Test that + with lists returns a plain list."""
+        token = DEXToken.from_dict(sample_dex_token_data)
+        tokens = LazyModelList([sample_dex_token_data], DEXToken.from_dict)
+        assert tokens + [token] == [token, token]
+        assert [token] + tokens == [token, token]
+        assert type(tokens + tokens) is list
+        with pytest.raises(TypeError):
+            tokens + (token,)
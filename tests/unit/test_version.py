@@ -41,6 +41,12 @@ class TestVersionUtilities:
         with pytest.raises(ValueError, match="Invalid version format"):
             houdiniswap.compare_version("invalid")
     
+    @pytest.mark.parametrize("version", [None, 1.0, ["0", "1", "0"], {"major": 0}])
+    def test_compare_version_non_string(self, version):
+        """Test that non-string versions, hashable or not, raise ValueError."""
+        with pytest.raises(ValueError, match="Invalid version format"):
+            houdiniswap.compare_version(version)
+    
     def test_is_compatible_with_true(self):
         """Test is_compatible_with() when compatible."""
         assert houdiniswap.is_compatible_with("0.0.9") is True